@@ -0,0 +1,224 @@
+'''
+Benchmarks of `Networkdays` and `JobSchedule`.
+
+Times `networkdays()`, `count()`, `weekends()`, `holidays()`,
+`last_workday_of_month()`, `JobSchedule` construction, a new `Networkdays`
+with a single query and the command line cold start, for ranges from 1 day
+to 100 years and holidays sets from 0 to 10k dates. Results are seconds per call, as JSON, and may be compared with
+a stored baseline to catch regressions::
+
+    python benchmarks/bench.py --output results.json
+    python benchmarks/bench.py --compare benchmarks/baseline.json
+    python benchmarks/bench.py --quick --save-baseline
+
+Two baselines are kept: `baseline.json` of the current code, to catch
+regressions, and `baseline-original.json` of the code before the
+`count()`, `BusinessCalendar` and cache work, to see the speedups. Cases of
+methods a tree doesn't have are skipped, so the same script runs on older
+trees with `--package`::
+
+    git worktree add /tmp/original <commit>
+    python benchmarks/bench.py --package /tmp/original --output benchmarks/baseline-original.json
+    python benchmarks/bench.py --compare benchmarks/baseline-original.json
+
+`--compare` exits with status 1 when any case is slower than the baseline
+by more than `--threshold` (a ratio, 1.5 by default). Timings depend on the
+machine, compare runs made on the same one.
+'''
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# directory of the networkdays package benchmarked, `--package`
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATE_START = datetime.date(2000, 1, 3)
+WEEK_END = DATE_START + datetime.timedelta(days=6)
+
+RANGES = {
+    '1d': 1,
+    '1m': 31,
+    '1y': 365,
+    '10y': 3652,
+    '100y': 36524,
+}
+
+HOLIDAYS = [0, 100, 1000, 10000]
+
+JOB_HOURS = [8, 800, 8000, 80000]
+
+WORKDAYS = [1, 250, 25000]
+
+QUICK_RANGES = ['1d', '1y', '100y']
+QUICK_HOLIDAYS = [0, 10000]
+QUICK_JOB_HOURS = [8, 8000]
+QUICK_WORKDAYS = [1, 25000]
+
+
+def holidays(number: int) -> set:
+    '''
+    `number` holidays evenly spread over 100 years from `DATE_START`.
+    '''
+    if not number:
+        return set()
+    step = RANGES['100y'] / number
+    return {DATE_START + datetime.timedelta(days=int(i * step)) for i in range(number)}
+
+
+def cases(quick: bool = False) -> Iterator[Tuple[str, Callable[[], object]]]:
+    '''
+    The benchmark cases, without those of the methods `Networkdays` has not.
+    '''
+    from networkdays.networkdays import JobSchedule, Networkdays
+
+    ranges = QUICK_RANGES if quick else list(RANGES)
+    holidays_sizes = QUICK_HOLIDAYS if quick else HOLIDAYS
+    job_hours = QUICK_JOB_HOURS if quick else JOB_HOURS
+    workdays = QUICK_WORKDAYS if quick else WORKDAYS
+
+    for holidays_size in holidays_sizes:
+        holidays_set = holidays(holidays_size)
+        for range_name in ranges:
+            date_end = DATE_START + datetime.timedelta(days=RANGES[range_name] - 1)
+            ndays = Networkdays(DATE_START, date_end, holidays_set)
+            suffix = f'range={range_name},holidays={holidays_size}'
+            yield f'networkdays[{suffix}]', ndays.networkdays
+            if hasattr(ndays, 'count'):
+                yield f'count[{suffix}]', ndays.count
+            yield f'weekends[{suffix}]', ndays.weekends
+            yield f'holidays[{suffix}]', ndays.holidays
+            if hasattr(ndays, 'nth_workdays'):
+                yield f'nth_workdays[{suffix}]', ndays.nth_workdays
+
+        ndays = Networkdays(DATE_START, holidays=holidays_set)
+        yield f'last_workday_of_month[holidays={holidays_size}]', lambda ndays=ndays: ndays.last_workday_of_month(2020, 5)
+        yield f'Networkdays.__init__[holidays={holidays_size}]', lambda holidays_set=holidays_set: Networkdays(DATE_START, holidays=holidays_set)
+        if hasattr(ndays, 'add_workdays'):
+            for days in workdays:
+                yield (
+                    f'add_workdays[days={days},holidays={holidays_size}]',
+                    lambda ndays=ndays, days=days: ndays.add_workdays(DATE_START, days)
+                )
+        # a new instance per query, like per row or per request callers
+        yield (
+            f'Networkdays+networkdays[range=1w,holidays={holidays_size}]',
+            lambda holidays_set=holidays_set: Networkdays(DATE_START, WEEK_END, holidays_set).networkdays()
+        )
+        yield (
+            f'Networkdays+last_workday_of_month[holidays={holidays_size}]',
+            lambda holidays_set=holidays_set: Networkdays(DATE_START, WEEK_END, holidays_set).last_workday_of_month(2020, 5)
+        )
+
+        job_date_end = DATE_START + datetime.timedelta(days=RANGES['100y'] - 1)
+        for hours in job_hours:
+            yield (
+                f'JobSchedule[hours={hours},holidays={holidays_size}]',
+                lambda hours=hours, holidays_set=holidays_set: JobSchedule(
+                    hours, 8, DATE_START, Networkdays(DATE_START, job_date_end, holidays_set))
+            )
+
+
+def cli_cold_start() -> None:
+    subprocess.run(
+        [sys.executable, '-m', 'networkdays', '2024-03-01', '-f', '2024-03-10'],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        cwd=PACKAGE,
+    )
+
+
+def time_case(function: Callable[[], object], min_time: float, repeat: int) -> float:
+    '''
+    Best seconds per call of `repeat` rounds, each one of at least `min_time`.
+    '''
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / 10 or number >= 10 ** 7:
+            break
+        number *= 10
+    number = max(int(number * min_time / max(elapsed, 1e-9)), 1)
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(quick: bool = False, min_time: float = 0.2, repeat: int = 3, filter_name: str = '') -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    all_cases: List[Tuple[str, Callable[[], object]]] = list(cases(quick))
+    all_cases.append(('cli_cold_start', cli_cold_start))
+    for name, function in all_cases:
+        if filter_name in name:
+            results[name] = time_case(function, min_time, repeat)
+            print(f'{name:60} {results[name] * 1e6:14.2f} us', file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    '''
+    Cases slower than the baseline by more than `threshold`.
+    '''
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        if name not in baseline:
+            continue
+        ratio = seconds / baseline[name]
+        status = 'REGRESSION' if ratio > threshold else ''
+        print(f'{name:60} {ratio:8.2f}x {status}', file=sys.stderr)
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(sys_args: List[str]) -> None:
+    global PACKAGE
+    parser = argparse.ArgumentParser(description='networkdays benchmarks')
+    parser.add_argument('--quick', action='store_true', help='fewer range and holidays sizes')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timing round, default 0.2')
+    parser.add_argument('--repeat', type=int, default=3, help='timing rounds per case, the best is kept')
+    parser.add_argument('--filter', default='', help='only cases whose name contains this text')
+    parser.add_argument('--output', help='write the results JSON to this file')
+    parser.add_argument('--compare', metavar='BASELINE', help='compare with a baseline results JSON')
+    parser.add_argument('--threshold', type=float, default=1.5, help='slowdown ratio reported as regression')
+    parser.add_argument('--save-baseline', action='store_true', help=f'write the results to {BASELINE}')
+    parser.add_argument('--package', default=PACKAGE, help='directory of the networkdays package to benchmark')
+    args = parser.parse_args(sys_args)
+
+    PACKAGE = os.path.abspath(args.package)
+    sys.path.insert(0, PACKAGE)
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'unit': 'seconds per call',
+        'results': run(args.quick, args.min_time, args.repeat, args.filter),
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output + '\n')
+    if args.save_baseline:
+        with open(BASELINE, 'w') as output_file:
+            output_file.write(output + '\n')
+    if not args.output and not args.save_baseline:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        if compare(report['results'], baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,10 +1,12 @@
 import argparse
+import csv
 import datetime
+import json
 import sys
 import re
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 
-from networkdays.networkdays import Networkdays
+from networkdays.networkdays import BusinessCalendar, Networkdays
 
 
 DESCRIPTION = 'Bussiness Days Calendar & JobScheduling'
@@ -51,7 +53,260 @@ def command_line_parser(sys_args: List[str]) -> argparse.Namespace:
     return args
 
 
+def str_weekdays_to_set(weekdays: str) -> Set[int]:
+    '''
+    Convert a comma separated list of ISO weekdays, like "6,7", into a set.
+    '''
+    try:
+        weekdaysoff = {int(weekday) for weekday in weekdays.split(',') if weekday.strip()}
+    except ValueError:
+        raise ValueError(f'Error: cant convert weekdays "{weekdays}"')
+    if not weekdaysoff <= set(range(1, 8)):
+        raise ValueError(f'Error: cant convert weekdays "{weekdays}"')
+    return weekdaysoff
+
+
+def read_holidays(lines: Iterable[str]) -> Set[datetime.date]:
+    '''
+    Read holidays, one ISO date per line, blank lines and `#` comments are ignored.
+    '''
+    holidays = set()
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if line:
+            holidays.add(str_iso_date_to_date(line))
+    return holidays
+
+
+def read_calendar(path: str) -> BusinessCalendar:
+    '''
+    Read a calendar JSON file, like `{"holidays": ["2020-12-25"], "weekdaysoff": [6, 7]}`.
+    '''
+    try:
+        with open(path) as calendar_file:
+            data = json.load(calendar_file)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f'Error: cant read calendar "{path}": {e}')
+    if not isinstance(data, dict):
+        raise ValueError(f'Error: calendar "{path}" must be a JSON object')
+
+    holidays = data.get('holidays', [])
+    if not isinstance(holidays, list) or not all(isinstance(date, str) for date in holidays):
+        raise ValueError(f'Error: calendar "{path}" holidays must be a list of ISO dates')
+    weekdaysoff = data.get('weekdaysoff', [6, 7])
+    if not isinstance(weekdaysoff, list) or not all(
+        isinstance(weekday, int) and not isinstance(weekday, bool) and 1 <= weekday <= 7
+        for weekday in weekdaysoff
+    ):
+        raise ValueError(f'Error: calendar "{path}" weekdaysoff must be a list of ISO weekdays, 1 to 7')
+
+    return BusinessCalendar({str_iso_date_to_date(date) for date in holidays}, set(weekdaysoff))
+
+
+def batch_command_line_parser(sys_args: List[str]) -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser(
+        prog='networkdays batch',
+        description=f'{DESCRIPTION} - batch mode, reads "start, end[, calendar]" rows from stdin '
+                    'and writes one result row per input row to stdout',
+    )
+    parser.add_argument(
+        '--format', choices=['csv', 'ndjson'], default='csv',
+        help='rows format, CSV or newline delimited JSON objects with "start", "end" and "calendar" keys'
+    )
+    parser.add_argument(
+        '--output', choices=['count', 'list'], default='count',
+        help='number of workdays or the list of workdays, default is count'
+    )
+    parser.add_argument(
+        '--holidays',
+        help='holidays file, one iso date per line'
+    )
+    parser.add_argument(
+        '--weekdaysoff', default='6,7',
+        help='ISO weekdays off, comma separated, default is "6,7" (Saturday and Sunday)'
+    )
+    parser.add_argument(
+        '--calendar', action='append', default=[], metavar='NAME=FILE',
+        help='named calendar JSON file, like {"holidays": ["2020-12-25"], "weekdaysoff": [6, 7]}, '
+             'selected by the third column of a row. May be repeated'
+    )
+    parser.add_argument(
+        '--header', action='store_true',
+        help='CSV input has a header row, one is written to the output too'
+    )
+
+    args = parser.parse_args(sys_args)
+    return args
+
+
+def batch_calendars(args: argparse.Namespace) -> Dict[Optional[str], BusinessCalendar]:
+    '''
+    Load every calendar once, the default one is keyed by `None`.
+    '''
+    holidays: Set[datetime.date] = set()
+    if args.holidays:
+        try:
+            with open(args.holidays) as holidays_file:
+                holidays = read_holidays(holidays_file)
+        except OSError as e:
+            raise ValueError(f'Error: cant read holidays "{args.holidays}": {e}')
+
+    calendars: Dict[Optional[str], BusinessCalendar] = {
+        None: BusinessCalendar(holidays, str_weekdays_to_set(args.weekdaysoff)),
+    }
+    for calendar in args.calendar:
+        name, sep, path = calendar.partition('=')
+        if not sep or not name:
+            raise ValueError(f'Error: cant read calendar "{calendar}", use NAME=FILE')
+        calendars[name] = read_calendar(path)
+    return calendars
+
+
+def batch_rows(stdin: TextIO, rows_format: str, header: bool) -> Iterator[Tuple[int, List[str]]]:
+    '''
+    Yield (line number, [start, end, calendar]) from the input rows.
+    '''
+    if rows_format == 'csv':
+        reader = csv.reader(stdin)
+        if header:
+            next(reader, None)
+        for row in reader:
+            if row:
+                yield reader.line_num, [field.strip() for field in row]
+        return
+
+    for line_num, line in enumerate(stdin, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+            yield line_num, [row.get('start') or '', row.get('end') or '', row.get('calendar') or '']
+        except (ValueError, AttributeError):
+            yield line_num, []
+
+
+def batch_result(row: List[str], calendars: Dict[Optional[str], BusinessCalendar], output: str):
+    if not all(isinstance(field, str) for field in row):
+        # NDJSON fields may be of any JSON type
+        raise ValueError('Error: start, end and calendar must be strings')
+    if len(row) < 1 or not row[0]:
+        raise ValueError('Error: missing start date')
+    date_initial = str_iso_date_to_date(row[0])
+    date_final = str_iso_date_to_date(row[1]) if len(row) > 1 and row[1] else None
+    name = row[2] if len(row) > 2 and row[2] else None
+    if name not in calendars:
+        raise ValueError(f'Error: unknown calendar "{name}"')
+
+    ndays = Networkdays(date_initial, date_final, calendar=calendars[name])
+    if output == 'count':
+        return ndays.count()
+    return [date.isoformat() for date in ndays.iter_networkdays()]
+
+
+def batch(sys_args: List[str], stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None) -> None:
+    '''
+    Batch mode, `python -m networkdays batch < rows.csv`.
+    Calendars are loaded once and each result row is flushed as soon as
+    it's computed, so it may be used on a pipe.
+    '''
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    try:
+        args = batch_command_line_parser(sys_args)
+        calendars = batch_calendars(args)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    writer = csv.writer(stdout, lineterminator='\n')
+    if args.format == 'csv' and args.header:
+        writer.writerow(['start', 'end', args.output])
+        stdout.flush()
+
+    errors = 0
+    for line_num, row in batch_rows(stdin, args.format, args.header):
+        try:
+            result = batch_result(row, calendars, args.output)
+            error = None
+        except ValueError as e:
+            result = None
+            error = str(e)
+            errors += 1
+            print(f'line {line_num}: {error}', file=sys.stderr)
+
+        start, end = (row + ['', ''])[:2]
+        if args.format == 'csv':
+            if isinstance(result, list):
+                result = ' '.join(result)
+            writer.writerow([start, end, '' if result is None else result])
+        else:
+            output = {'start': start, 'end': end, args.output: result}
+            if error:
+                output['error'] = error
+            stdout.write(json.dumps(output) + '\n')
+        stdout.flush()
+
+    if errors:
+        sys.exit(1)
+
+
+def serve_command_line_parser(sys_args: List[str]) -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser(
+        prog='networkdays serve',
+        description=f'{DESCRIPTION} - query server, loads the calendars once and answers '
+                    'count, networkdays, add_workdays and jobschedule JSON queries over HTTP',
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='default is 127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000, help='default is 8000')
+    parser.add_argument('--unix-socket', help='listen on a UNIX socket path instead of host and port')
+    parser.add_argument('--workers', type=int, help='number of worker threads')
+    parser.add_argument('--verbose', action='store_true', help='log every request to stderr')
+    parser.add_argument('--holidays', help='holidays file, one iso date per line')
+    parser.add_argument(
+        '--weekdaysoff', default='6,7',
+        help='ISO weekdays off, comma separated, default is "6,7" (Saturday and Sunday)'
+    )
+    parser.add_argument(
+        '--calendar', action='append', default=[], metavar='NAME=FILE',
+        help='named calendar JSON file, like {"holidays": ["2020-12-25"], "weekdaysoff": [6, 7]}, '
+             'selected by the "calendar" key of a query. May be repeated'
+    )
+
+    args = parser.parse_args(sys_args)
+    return args
+
+
+def serve(sys_args: List[str]) -> None:
+    '''
+    Query server mode, `python -m networkdays serve --port 8000`.
+    '''
+    from networkdays.server import make_server
+
+    try:
+        args = serve_command_line_parser(sys_args)
+        calendars = batch_calendars(args)
+        server = make_server(calendars, args.host, args.port, args.unix_socket, args.workers, args.verbose)
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
 def main(sys_args: List[str]) -> None:
+    if sys_args and sys_args[0] == 'batch':
+        batch(sys_args[1:])
+        return
+    if sys_args and sys_args[0] == 'serve':
+        serve(sys_args[1:])
+        return
+
     try:
         args = command_line_parser(sys_args)
         date_initial = str_iso_date_to_date(args.date_initial)
@@ -0,0 +1,145 @@
+'''
+Workdays as a bitmap, one bit per day.
+
+A `WorkdayBitmap` covers a range of days and keeps a bit per day, set for
+workdays, in a `bytearray`. Counting is a popcount over a slice and
+calendars are combined with bitwise AND/OR, without any `datetime.date`
+object in between.
+'''
+import datetime
+from typing import Iterator, Optional
+
+from networkdays.networkdays import BusinessCalendar, Networkdays
+
+
+class WorkdayBitmap:
+    '''
+    Bitmap of the workdays between two dates, bit `i` is the day
+    `date_start + i` and bit order is little endian (day 0 is the lowest bit
+    of the first byte).
+
+    ex.:
+        sao_paulo = WorkdayBitmap.from_networkdays(Networkdays(start, end, HOLIDAYS_BR))
+        new_york = WorkdayBitmap.from_networkdays(Networkdays(start, end, HOLIDAYS_US))
+        (sao_paulo & new_york).count()  # days both desks are open
+    '''
+
+    def __init__(self, date_start: datetime.date, days: int, bits: Optional[bytearray] = None):
+        '''
+        Args:
+            date_start (datetime.date): first day of the bitmap.
+            days (int): number of days in the bitmap.
+            bits (bytearray): the bits, all days off if none.
+        '''
+        if days < 0:
+            raise ValueError(f'days must not be negative, got {days}')
+        size = (days + 7) // 8
+        if bits is None:
+            bits = bytearray(size)
+        elif len(bits) != size:
+            raise ValueError(f'{days} days need {size} bytes, got {len(bits)}')
+
+        self.date_start: datetime.date = date_start
+        self.days: int = days
+        self.bits: bytearray = bits
+        self._ordinal_start: int = date_start.toordinal()
+
+    @classmethod
+    def from_calendar(
+        cls,
+        calendar: BusinessCalendar,
+        date_start: datetime.date,
+        date_end: datetime.date,
+    ) -> 'WorkdayBitmap':
+        days = max((date_end - date_start).days + 1, 0)
+        bitmap = cls(date_start, days)
+        bits = bitmap.bits
+        ordinal_start = bitmap._ordinal_start
+        if days:
+            for date in calendar.iter_workdays(date_start, date_end):
+                position = date.toordinal() - ordinal_start
+                bits[position >> 3] |= 1 << (position & 7)
+        return bitmap
+
+    @classmethod
+    def from_networkdays(cls, networkdays: Networkdays) -> 'WorkdayBitmap':
+        '''
+        Bitmap of the `networkdays` range, its holidays and weekdaysoff.
+        '''
+        return cls.from_calendar(networkdays.calendar, networkdays.date_start, networkdays._date_end())
+
+    @classmethod
+    def _from_int(cls, date_start: datetime.date, days: int, value: int) -> 'WorkdayBitmap':
+        return cls(date_start, days, bytearray(value.to_bytes((days + 7) // 8, 'little')))
+
+    @property
+    def date_end(self) -> datetime.date:
+        return self.date_start + datetime.timedelta(days=self.days - 1)
+
+    def _slice(self, ordinal_start: int, ordinal_end: int) -> int:
+        '''
+        The days from `ordinal_start` to `ordinal_end` as an int, the lowest
+        bit is `ordinal_start`, days out of the bitmap are off.
+        '''
+        low = max(ordinal_start, self._ordinal_start) - self._ordinal_start
+        high = min(ordinal_end, self._ordinal_start + self.days - 1) - self._ordinal_start
+        if high < low:
+            return 0
+
+        value = int.from_bytes(self.bits[low >> 3:(high >> 3) + 1], 'little') >> (low & 7)
+        value &= (1 << (high - low + 1)) - 1
+        return value << (self._ordinal_start + low - ordinal_start)
+
+    def count(self, date_start: Optional[datetime.date] = None, date_end: Optional[datetime.date] = None) -> int:
+        '''
+        Number of workdays between `date_start` and `date_end`, both
+        inclusive, the whole bitmap by default.
+        '''
+        ordinal_start = self._ordinal_start if date_start is None else date_start.toordinal()
+        ordinal_end = self._ordinal_start + self.days - 1 if date_end is None else date_end.toordinal()
+        return bin(self._slice(ordinal_start, ordinal_end)).count('1')
+
+    def __len__(self) -> int:
+        return self.days
+
+    def __contains__(self, date: datetime.date) -> bool:
+        position = date.toordinal() - self._ordinal_start
+        if not 0 <= position < self.days:
+            return False
+        return bool(self.bits[position >> 3] & (1 << (position & 7)))
+
+    def __iter__(self) -> Iterator[datetime.date]:
+        '''
+        Yield the workdays, in order.
+        '''
+        for position in range(self.days):
+            if self.bits[position >> 3] & (1 << (position & 7)):
+                yield datetime.date.fromordinal(self._ordinal_start + position)
+
+    def __and__(self, other: 'WorkdayBitmap') -> 'WorkdayBitmap':
+        '''
+        Workdays on both bitmaps, over the days both of them cover.
+        '''
+        ordinal_start = max(self._ordinal_start, other._ordinal_start)
+        ordinal_end = min(self._ordinal_start + self.days, other._ordinal_start + other.days) - 1
+        days = max(ordinal_end - ordinal_start + 1, 0)
+        value = self._slice(ordinal_start, ordinal_end) & other._slice(ordinal_start, ordinal_end)
+        return self._from_int(datetime.date.fromordinal(ordinal_start), days, value)
+
+    def __or__(self, other: 'WorkdayBitmap') -> 'WorkdayBitmap':
+        '''
+        Workdays on any of the bitmaps, over the days any of them covers.
+        '''
+        ordinal_start = min(self._ordinal_start, other._ordinal_start)
+        ordinal_end = max(self._ordinal_start + self.days, other._ordinal_start + other.days) - 1
+        days = ordinal_end - ordinal_start + 1
+        value = self._slice(ordinal_start, ordinal_end) | other._slice(ordinal_start, ordinal_end)
+        return self._from_int(datetime.date.fromordinal(ordinal_start), days, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WorkdayBitmap):
+            return NotImplemented
+        return (self.date_start, self.days, self.bits) == (other.date_start, other.days, other.bits)
+
+    def __repr__(self) -> str:
+        return f'WorkdayBitmap({self.date_start!r}, {self.days})'
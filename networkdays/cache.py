@@ -0,0 +1,84 @@
+'''
+Memoization of `Networkdays` results.
+
+A `ResultCache` is opt-in, passed to `Networkdays(..., cache=cache)`, and may
+be shared by any number of instances: results are keyed on the query dates
+and on the immutable holidays and weekdaysoff of the instance calendar, so
+equal queries on equal calendars are served without recomputation.
+'''
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class ResultCache:
+    '''
+    Bounded LRU cache with hit, miss and eviction counters, thread safe.
+
+    Args:
+        maxsize (int): max number of results kept, the least recently used
+            is evicted first. None for no limit.
+
+    ex.:
+        cache = ResultCache(maxsize=10000)
+        Networkdays(date_start, date_end, HOLIDAYS, cache=cache).networkdays()
+        cache.stats()
+        {'hits': 0, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 10000, 'hit_rate': 0.0}
+    '''
+
+    def __init__(self, maxsize: Optional[int] = 1024):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f'maxsize must be at least 1, got {maxsize}')
+        self.maxsize: Optional[int] = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._results: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        '''
+        The result for `key`, `compute()` is called only on a miss.
+        '''
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return result
+
+        result = compute()
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+                    self.evictions += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._results),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        '''
+        Drop every result and reset the counters.
+        '''
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
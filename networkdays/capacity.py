@@ -0,0 +1,226 @@
+'''
+Work capacity calendars, hours of work per day instead of whole workdays.
+
+A `WorkCapacity` gives the hours of work of each ISO weekday, on top of a
+`BusinessCalendar` (holidays and weekdays off have no hours) and with
+per date overrides, like half-day holidays or an extra Saturday.
+
+Cumulative hours are weekly arithmetic plus a prefix sum over the dates
+that differ from their weekday, so the total hours of any range are
+O(log A), A the number of holidays and overrides, and the finish day of a
+job is a search over the cumulative hours, without a loop over days.
+
+ex.:
+    capacity = WorkCapacity({1: 8, 2: 8, 3: 8, 4: 8, 5: 4}, {datetime.date(2020, 12, 24): 4}, calendar)
+    capacity.finish(datetime.date(2020, 12, 21), 30)
+    Finish(date=datetime.date(2020, 12, 28), hours=2)
+'''
+import bisect
+import datetime
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from networkdays.networkdays import BusinessCalendar
+from networkdays.rules import HolidayRules
+
+Hours = Union[int, float]
+
+
+class Finish(NamedTuple):
+    '''
+    Last day of a job and the hours of work on it.
+    '''
+    date: datetime.date
+    hours: Hours
+
+
+class WorkCapacity:
+    '''
+    Hours of work per day: per ISO weekday, zero on holidays and weekdays
+    off of the `calendar`, and per date `overrides` that take precedence
+    over both (a 4 hours holiday eve, a worked Saturday).
+
+    Holidays given as `HolidayRules` are taken for the years of the
+    calendar index, `year_start` to `year_end`, that the calendar must have,
+    and dates out of those years raise ValueError.
+
+    Args:
+        hours (dict): hours of work per ISO weekday, Monday is 1, missing
+            weekdays have no hours.
+        overrides (dict): hours of work for given dates.
+        calendar (BusinessCalendar): holidays and weekdays off, if none the
+            weekdays without hours are off and there are no holidays.
+
+    ex.:
+        WorkCapacity({1: 8, 2: 8, 3: 8, 4: 8, 5: 4}, calendar=calendar)
+    '''
+
+    def __init__(
+        self,
+        hours: Mapping[int, Hours],
+        overrides: Optional[Mapping[datetime.date, Hours]] = None,
+        calendar: Optional[BusinessCalendar] = None,
+    ):
+        for weekday, weekday_hours in hours.items():
+            if weekday not in range(1, 8):
+                raise ValueError(f'{weekday} is not an ISO weekday, 1 to 7')
+            if weekday_hours < 0:
+                raise ValueError(f'hours must not be negative, got {weekday_hours} for weekday {weekday}')
+        overrides = dict(overrides or {})
+        for date, date_hours in overrides.items():
+            if date_hours < 0:
+                raise ValueError(f'hours must not be negative, got {date_hours} for {date}')
+
+        if calendar is None:
+            calendar = BusinessCalendar((), {weekday for weekday in range(1, 8) if not hours.get(weekday)})
+
+        self.calendar: BusinessCalendar = calendar
+        self.overrides: Dict[datetime.date, Hours] = overrides
+        # hours of the ISO weekdays 1..7, weekdays off have none
+        self.weekday_hours: Tuple[Hours, ...] = tuple(
+            0 if weekday in calendar.weekdaysoff else hours.get(weekday, 0)
+            for weekday in range(1, 8)
+        )
+
+        # cumulative hours per weekday, `_table[r]` are the hours of the ISO
+        # weekdays `1..r` and `_table[7]` the hours of a week.
+        table: List[Hours] = [0]
+        for weekday_hours in self.weekday_hours:
+            table.append(table[-1] + weekday_hours)
+        self._table: Tuple[Hours, ...] = tuple(table)
+
+        # hours of the dates that differ from their weekday (holidays and
+        # overrides), and `_adjustments[i]` the sum of the differences of
+        # the first `i` of them, in ordinal order.
+        self._days: Dict[int, Hours] = {
+            date.toordinal(): 0 for date in self._calendar_holidays() if self._weekday(date.toordinal())
+        }
+        self._days.update((date.toordinal(), date_hours) for date, date_hours in overrides.items())
+        self._ordinals: List[int] = sorted(self._days)
+        adjustments: List[Hours] = [0]
+        for ordinal in self._ordinals:
+            adjustments.append(adjustments[-1] + self._days[ordinal] - self._weekday(ordinal))
+        self._adjustments: Tuple[Hours, ...] = tuple(adjustments)
+
+    def _check_span(self, *dates: datetime.date) -> None:
+        '''
+        Rules holidays are known only in the calendar years, out of them a
+        day would have hours on a holiday.
+        '''
+        calendar = self.calendar
+        if not isinstance(calendar.holidays_set, HolidayRules):
+            return
+        for date in dates:
+            if not calendar.year_start <= date.year <= calendar.year_end:
+                raise ValueError(
+                    f'{date} is out of the holidays rules years {calendar.year_start} to {calendar.year_end}'
+                )
+
+    def _calendar_holidays(self) -> Iterable[datetime.date]:
+        holidays = self.calendar.holidays_set
+        if not isinstance(holidays, HolidayRules):
+            return holidays
+        if self.calendar.year_start is None or self.calendar.year_end is None:
+            raise ValueError('holidays rules need a calendar with year_start and year_end')
+        return holidays.between(
+            datetime.date(self.calendar.year_start, 1, 1),
+            datetime.date(self.calendar.year_end, 12, 31)
+        )
+
+    def _weekday(self, ordinal: int) -> Hours:
+        return self.weekday_hours[(ordinal - 1) % 7]
+
+    def _cumulative(self, ordinal: int) -> Hours:
+        '''
+        Hours of work from `datetime.date.min` up to `ordinal` (inclusive).
+        '''
+        weeks, weekday = divmod(ordinal, 7)
+        return (
+            weeks * self._table[7] + self._table[weekday] +
+            self._adjustments[bisect.bisect_right(self._ordinals, ordinal)]
+        )
+
+    def hours(self, date: datetime.date) -> Hours:
+        '''
+        Hours of work on `date`.
+        '''
+        self._check_span(date)
+        ordinal = date.toordinal()
+        return self._days.get(ordinal, self._weekday(ordinal))
+
+    def total(self, date_start: datetime.date, date_end: datetime.date) -> Hours:
+        '''
+        Hours of work between `date_start` and `date_end`, both inclusive.
+        '''
+        self._check_span(date_start, date_end)
+        if date_end < date_start:
+            return 0
+        return self._cumulative(date_end.toordinal()) - self._cumulative(date_start.toordinal() - 1)
+
+    def finish(self, date_start: datetime.date, hours: Hours) -> Finish:
+        '''
+        Last day of a job of `hours` starting on `date_start`, and the hours
+        of work on that day.
+
+        The finish is guessed from the hours of a week, the cumulative hours
+        are searched exponentially around the guess and then by bisection,
+        O(log E × log A), E the days between the guess and the finish.
+
+        ex.:
+            capacity.finish(datetime.date(2020, 12, 21), 30)
+            Finish(date=datetime.date(2020, 12, 28), hours=2)
+        '''
+        if hours <= 0:
+            raise ValueError(f'hours must be positive, got {hours}')
+        self._check_span(date_start)
+
+        ordinal = date_start.toordinal()
+        target = self._cumulative(ordinal - 1) + hours
+        ordinal_max = datetime.date.max.toordinal()
+        if self._cumulative(ordinal_max) < target:
+            raise ValueError(f'not enough hours of work after {date_start} for {hours} hours')
+
+        # bracket the answer in (low, high], from a guess by the weekly hours
+        guess = ordinal
+        if self._table[7] > 0:
+            guess = min(ordinal - 1 + int(hours * 7 / self._table[7]) + 1, ordinal_max)
+        step = 4
+        if self._cumulative(guess) < target:
+            low = guess
+            while guess < ordinal_max:
+                guess = min(guess + step, ordinal_max)
+                if self._cumulative(guess) >= target:
+                    break
+                low, step = guess, step * 2
+            high = guess
+        else:
+            high = guess
+            while guess > ordinal - 1:
+                guess = max(guess - step, ordinal - 1)
+                if self._cumulative(guess) < target:
+                    break
+                high, step = guess, step * 2
+            low = guess
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self._cumulative(middle) < target:
+                low = middle
+            else:
+                high = middle
+
+        finish_date = datetime.date.fromordinal(high)
+        self._check_span(finish_date)
+        return Finish(finish_date, target - self._cumulative(high - 1))
+
+    def workdays(self, date_start: datetime.date, date_end: datetime.date) -> List[datetime.date]:
+        '''
+        List of days with hours of work between `date_start` and `date_end`,
+        both inclusive.
+        '''
+        self._check_span(date_start, date_end)
+        days = self._days
+        weekday_hours = self.weekday_hours
+        return [
+            datetime.date.fromordinal(ordinal)
+            for ordinal in range(date_start.toordinal(), date_end.toordinal() + 1)
+            if days.get(ordinal, weekday_hours[(ordinal - 1) % 7])
+        ]
@@ -0,0 +1,130 @@
+'''
+Sequential jobs on a shared resource.
+
+A `JobChain` is an ordered queue of jobs done one after the other: each job
+starts on the first workday after the last day of the previous one. The
+window of a job is two `add_workdays()`, O(log H) whatever its duration,
+so the whole chain is linear in the number of jobs, and changing the queue
+only recomputes the jobs after the change, when the windows are read again.
+
+ex.:
+    chain = JobChain(datetime.date(2020, 12, 21), [(16, 8), (40, 8)], calendar)
+    chain.windows()
+    [JobSpan(date_start=datetime.date(2020, 12, 21), date_end=datetime.date(2020, 12, 22), bussines_days=2),
+     JobSpan(date_start=datetime.date(2020, 12, 23), date_end=datetime.date(2020, 12, 30), bussines_days=5)]
+'''
+import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from networkdays.networkdays import BusinessCalendar, JobSchedule, JobSpan, job_span
+
+
+# (project_duration_hours, workhours_per_day)
+ChainJob = Tuple[Union[int, float], Union[int, float]]
+
+
+class JobChain:
+    '''
+    Ordered queue of jobs on one resource, and the window of each job.
+
+    Jobs without workdays (no hours) have an empty window, `JobSpan(None, None, 0)`,
+    and don't move the next job.
+
+    Args:
+        date_start (datetime.date): the first job starts on the closest
+            workday of this date.
+        jobs: list of (project_duration_hours, workhours_per_day).
+        calendar (BusinessCalendar): holidays and weekdays off, default is
+            no holidays and Saturday and Sunday off.
+    '''
+
+    def __init__(
+        self,
+        date_start: datetime.date,
+        jobs: Iterable[ChainJob] = (),
+        calendar: Optional[BusinessCalendar] = None,
+    ):
+        self.date_start: datetime.date = date_start
+        self.calendar: BusinessCalendar = calendar if calendar is not None else BusinessCalendar()
+        self.jobs: List[ChainJob] = list(jobs)
+        # the windows of the first `_valid` jobs are up to date, `_starts[i]`
+        # is the date the job `i` was scheduled from.
+        self._spans: List[JobSpan] = []
+        self._starts: List[datetime.date] = []
+        self._valid: int = 0
+
+    def _invalidate(self, index: int) -> None:
+        if index < 0:
+            index += len(self.jobs)
+        self._valid = max(min(self._valid, index), 0)
+
+    def _update(self) -> None:
+        del self._spans[self._valid:]
+        del self._starts[self._valid:]
+        for index in range(self._valid, len(self.jobs)):
+            if index == 0:
+                date_start = self.date_start
+            elif self._spans[index - 1].date_end is None:
+                date_start = self._starts[index - 1]
+            else:
+                date_start = self._spans[index - 1].date_end + datetime.timedelta(days=1)
+            hours, workhours_per_day = self.jobs[index]
+            self._starts.append(date_start)
+            self._spans.append(job_span(self.calendar, (hours, workhours_per_day, date_start)))
+        self._valid = len(self.jobs)
+
+    def append(self, job: ChainJob) -> None:
+        self.jobs.append(job)
+
+    def insert(self, index: int, job: ChainJob) -> None:
+        '''
+        Insert a job before `index`, only the windows from `index` on are recomputed.
+        '''
+        self._invalidate(index)
+        self.jobs.insert(index, job)
+
+    def pop(self, index: int = -1) -> ChainJob:
+        '''
+        Remove and return the job at `index`, only the windows from `index` on are recomputed.
+        '''
+        self._invalidate(index)
+        return self.jobs.pop(index)
+
+    def __setitem__(self, index: int, job: ChainJob) -> None:
+        self._invalidate(index)
+        self.jobs[index] = job
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __getitem__(self, index: int) -> JobSpan:
+        self._update()
+        return self._spans[index]
+
+    def __iter__(self) -> Iterator[JobSpan]:
+        return iter(self.windows())
+
+    def windows(self) -> List[JobSpan]:
+        '''
+        The window of each job, in the queue order.
+        '''
+        self._update()
+        return list(self._spans)
+
+    def date_end(self) -> Optional[datetime.date]:
+        '''
+        Last workday of the last job, None if no job has workdays.
+        '''
+        self._update()
+        for span in reversed(self._spans):
+            if span.date_end is not None:
+                return span.date_end
+        return None
+
+    def jobschedule(self, index: int) -> JobSchedule:
+        '''
+        The `JobSchedule` of the job at `index`, with its list of workdays.
+        '''
+        self._update()
+        hours, workhours_per_day = self.jobs[index]
+        return JobSchedule(hours, workhours_per_day, self._starts[index], calendar=self.calendar)
@@ -0,0 +1,148 @@
+'''
+pandas and PyArrow adapters, business days for whole columns of dates.
+
+`count()` and `add_workdays()` take pandas `Series` / `DatetimeIndex`,
+PyArrow `date32` arrays (or chunked arrays) or NumPy arrays, and return
+the same columnar type, going through `datetime64[D]` arrays and
+`networkdays.vectorized`, never through a `datetime.date` per row.
+Missing dates (NaT, null) give missing results.
+
+pandas and PyArrow are optional, only the one of the columns given is
+used::
+
+    pip install python-networkdays[pandas]
+    pip install python-networkdays[pyarrow]
+
+ex.:
+    df['workdays'] = count(df['opened'], df['closed'], HOLIDAYS)
+    df['due'] = add_workdays(df['opened'], 10, HOLIDAYS)
+'''
+import datetime
+import sys
+from typing import Any, Callable, Iterable, Tuple
+
+import numpy as np
+
+from networkdays.vectorized import busday_count, busday_offset
+
+
+def _is_pandas(column: Any) -> bool:
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(column, (pandas.Series, pandas.Index))
+
+
+def _is_arrow(column: Any) -> bool:
+    pyarrow = sys.modules.get('pyarrow')
+    return pyarrow is not None and isinstance(column, (pyarrow.Array, pyarrow.ChunkedArray))
+
+
+def _to_datetime64(column: Any) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    `datetime64[D]` array of a column and its mask of missing dates, the
+    missing dates are set to the epoch so NumPy may compute them.
+    '''
+    if _is_pandas(column):
+        if getattr(column.dtype, 'tz', None) is not None:
+            # the wall clock date, in the column time zone
+            if isinstance(column, sys.modules['pandas'].Index):
+                column = column.tz_localize(None)
+            else:
+                column = column.dt.tz_localize(None)
+        dates = np.asarray(column.to_numpy()).astype('datetime64[D]')
+    elif _is_arrow(column):
+        pyarrow = sys.modules['pyarrow']
+        if isinstance(column, pyarrow.ChunkedArray):
+            column = column.combine_chunks()
+        days = column.cast(pyarrow.date32()).cast(pyarrow.int32()).fill_null(0)
+        dates = days.to_numpy().astype('datetime64[D]')
+        missing = column.is_null().to_numpy(zero_copy_only=False)
+        return dates, missing
+    else:
+        dates = np.asarray(column).astype('datetime64[D]')
+
+    missing = np.isnat(dates)
+    return np.where(missing, np.datetime64(0, 'D'), dates), missing
+
+
+def _from_values(like: Any, values: np.ndarray, missing: np.ndarray, arrow_type: Callable[[], Any]) -> Any:
+    '''
+    `values` as the columnar type of `like`, missing where `missing`.
+    '''
+    if _is_pandas(like):
+        pandas = sys.modules['pandas']
+        if np.issubdtype(values.dtype, np.datetime64):
+            # midnight of the dates, in the time zone of `like` if any
+            tz = getattr(like.dtype, 'tz', None)
+            values = np.where(missing, np.datetime64('NaT'), values).astype(
+                like.dtype if tz is None else 'datetime64[ns]'
+            )
+            if isinstance(like, pandas.Index):
+                dates = pandas.DatetimeIndex(values, name=like.name)
+                return dates if tz is None else dates.tz_localize(tz)
+            dates = pandas.Series(values, index=like.index, name=like.name)
+            return dates if tz is None else dates.dt.tz_localize(tz)
+        if missing.any():
+            values = pandas.array(values, dtype='Int64')
+            values[missing] = pandas.NA
+        if isinstance(like, pandas.Index):
+            return pandas.Index(values, name=like.name)
+        return pandas.Series(values, index=like.index, name=like.name)
+
+    if _is_arrow(like):
+        pyarrow = sys.modules['pyarrow']
+        return pyarrow.array(values, type=arrow_type(), mask=missing if missing.any() else None)
+
+    if np.issubdtype(values.dtype, np.datetime64):
+        return np.where(missing, np.datetime64('NaT'), values)
+    if missing.any():
+        # NumPy ints have no missing value
+        return np.where(missing, np.nan, values)
+    return values
+
+
+def count(
+    date_start: Any,
+    date_end: Any,
+    holidays: Iterable[datetime.date] = (),
+    weekdaysoff: Iterable[int] = (6, 7),
+) -> Any:
+    '''
+    Number of workdays between each pair of dates, both inclusive, in the
+    columnar type of `date_start`: int64 `Series`/`Index` (nullable `Int64`
+    if there are missing dates), PyArrow `int64` array or NumPy array
+    (float64 with NaN if there are missing dates).
+    See `networkdays.vectorized.busday_count()`.
+    '''
+    starts, starts_missing = _to_datetime64(date_start)
+    ends, ends_missing = _to_datetime64(date_end)
+    counts = busday_count(starts, ends, holidays, weekdaysoff).astype(np.int64)
+    return _from_values(date_start, counts, starts_missing | ends_missing, lambda: sys.modules['pyarrow'].int64())
+
+
+def add_workdays(
+    dates: Any,
+    days: Any,
+    holidays: Iterable[datetime.date] = (),
+    weekdaysoff: Iterable[int] = (6, 7),
+) -> Any:
+    '''
+    Shift each date by a number of workdays, like Excel WORKDAY, in the
+    columnar type of `dates`: a `Series`/`DatetimeIndex` of the same dtype,
+    a PyArrow `date32` array or a NumPy `datetime64[D]` array.
+    See `networkdays.vectorized.busday_offset()`.
+
+    Args:
+        days: int, or a column of ints of the same length of `dates`,
+            missing days give missing dates.
+    '''
+    values, missing = _to_datetime64(dates)
+    if _is_pandas(days):
+        missing = missing | days.isna().to_numpy()
+        days = days.fillna(0).to_numpy(dtype=np.int64)
+    elif _is_arrow(days):
+        if isinstance(days, sys.modules['pyarrow'].ChunkedArray):
+            days = days.combine_chunks()
+        missing = missing | days.is_null().to_numpy(zero_copy_only=False)
+        days = days.fill_null(0).to_numpy()
+    shifted = busday_offset(values, np.asarray(days), holidays, weekdaysoff)
+    return _from_values(dates, shifted, missing, lambda: sys.modules['pyarrow'].date32())
@@ -0,0 +1,91 @@
+'''
+Business hours, elapsed working time between two datetimes.
+
+Each workday of a `BusinessCalendar` is open from `opening` to `closing`.
+The time between two datetimes is the open time left on the first day,
+the open time up to the last one and a full day for every workday in
+between, counted by `BusinessCalendar.count()`, O(log H) whatever the
+distance, without a loop over days or minutes.
+
+ex.:
+    hours = BusinessHours(datetime.time(9), datetime.time(18), calendar)
+    hours.elapsed(datetime.datetime(2020, 12, 24, 17), datetime.datetime(2020, 12, 28, 10))
+    datetime.timedelta(seconds=7200)  # 25th is a holiday, 26th and 27th weekend
+'''
+import datetime
+from typing import Optional
+
+from networkdays.networkdays import BusinessCalendar
+
+
+def _time_of_day(time: datetime.time) -> datetime.timedelta:
+    return datetime.timedelta(
+        hours=time.hour, minutes=time.minute, seconds=time.second, microseconds=time.microsecond
+    )
+
+
+class BusinessHours:
+    '''
+    Daily business hours on the workdays of a calendar.
+
+    Datetimes are taken as wall clock times, both naive or both aware, an
+    aware `end` is converted to the `start` time zone.
+
+    Args:
+        opening (datetime.time): opening time of every workday.
+        closing (datetime.time): closing time of every workday, after `opening`.
+        calendar (BusinessCalendar): holidays and weekdays off, default is
+            no holidays and Saturday and Sunday off.
+    '''
+
+    def __init__(
+        self,
+        opening: datetime.time = datetime.time(9),
+        closing: datetime.time = datetime.time(18),
+        calendar: Optional[BusinessCalendar] = None,
+    ):
+        if closing <= opening:
+            raise ValueError(f'closing {closing} must be after opening {opening}')
+
+        self.opening: datetime.time = opening
+        self.closing: datetime.time = closing
+        self.calendar: BusinessCalendar = calendar if calendar is not None else BusinessCalendar()
+        self._opening: datetime.timedelta = _time_of_day(opening)
+        self._closing: datetime.timedelta = _time_of_day(closing)
+        self.day: datetime.timedelta = self._closing - self._opening
+
+    def _open_time(self, moment: datetime.datetime) -> datetime.timedelta:
+        '''
+        Open time of the `moment` day up to the `moment`, none on days off.
+        '''
+        if not self.calendar.is_workday(moment.date()):
+            return datetime.timedelta(0)
+        time_of_day = _time_of_day(moment.time())
+        return min(max(time_of_day, self._opening), self._closing) - self._opening
+
+    def elapsed(self, start: datetime.datetime, end: datetime.datetime) -> datetime.timedelta:
+        '''
+        Business time between `start` and `end`, 0 if `end` is before `start`.
+
+        ex.:
+            hours.elapsed(datetime.datetime(2020, 12, 24, 17), datetime.datetime(2020, 12, 28, 10))
+            datetime.timedelta(seconds=7200)
+        '''
+        if start.tzinfo is not None and end.tzinfo is not None:
+            end = end.astimezone(start.tzinfo)
+        if end <= start:
+            return datetime.timedelta(0)
+
+        # full days from the start day to the day before the end, less the
+        # open time gone on the start day, plus the open time of the end day
+        days = self.calendar.count(start.date(), end.date() - datetime.timedelta(days=1))
+        return self.day * days - self._open_time(start) + self._open_time(end)
+
+    def is_open(self, moment: datetime.datetime) -> bool:
+        '''
+        Whether `moment` is in the business hours of a workday.
+        '''
+        return (
+            self._opening <= _time_of_day(moment.time()) < self._closing and
+            self.calendar.is_workday(moment.date())
+        )
@@ -0,0 +1,158 @@
+'''
+Opt-in instrumentation of `Networkdays` and `JobSchedule` methods.
+
+When enabled, each instrumented method records its number of calls, the
+cumulative time spent and a histogram of the requested range lengths, in
+days. Disabled, the default, a call costs only a flag check.
+
+ex.:
+    from networkdays import instrumentation
+
+    instrumentation.enable()
+    ...
+    instrumentation.snapshot()
+    {'Networkdays.networkdays': {'calls': 2, 'seconds': 0.0012, 'range_days': {...}}, ...}
+    instrumentation.prometheus()  # text exposition format
+'''
+import bisect
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+
+# upper bounds (inclusive) of the range length histogram buckets, in days:
+# a day, a week, a month, a year, 10 years, 100 years
+BUCKETS = (1, 7, 31, 366, 3653, 36525)
+
+_enabled = False
+_lock = threading.Lock()
+
+
+class MethodStats:
+
+    def __init__(self):
+        self.calls: int = 0
+        self.seconds: float = 0.0
+        self.range_days_sum: int = 0
+        # one count per bucket plus the +Inf one, not cumulative
+        self.buckets: List[int] = [0] * (len(BUCKETS) + 1)
+
+    def record(self, seconds: float, range_days: Optional[int]) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        if range_days is not None:
+            self.range_days_sum += range_days
+            self.buckets[bisect.bisect_left(BUCKETS, range_days)] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [str(bucket) for bucket in BUCKETS] + ['+Inf']
+        return {
+            'calls': self.calls,
+            'seconds': self.seconds,
+            'range_days': dict(zip(labels, self.buckets)),
+            'range_days_sum': self.range_days_sum,
+        }
+
+
+_stats: Dict[str, MethodStats] = {}
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    '''
+    Drop every recorded stat.
+    '''
+    with _lock:
+        _stats.clear()
+
+
+def record(name: str, seconds: float, range_days: Optional[int]) -> None:
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = MethodStats()
+        stats.record(seconds, range_days)
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    '''
+    Recorded stats per method, `range_days` buckets are keyed by their upper
+    bound (inclusive) and are not cumulative.
+    '''
+    with _lock:
+        return {name: stats.as_dict() for name, stats in sorted(_stats.items())}
+
+
+def prometheus() -> str:
+    '''
+    Recorded stats in the Prometheus text exposition format.
+    '''
+    lines = [
+        '# HELP networkdays_calls_total Number of calls per method.',
+        '# TYPE networkdays_calls_total counter',
+    ]
+    stats = snapshot()
+    for name, method in stats.items():
+        lines.append(f'networkdays_calls_total{{method="{name}"}} {method["calls"]}')
+
+    lines += [
+        '# HELP networkdays_seconds_total Time spent per method, in seconds.',
+        '# TYPE networkdays_seconds_total counter',
+    ]
+    for name, method in stats.items():
+        lines.append(f'networkdays_seconds_total{{method="{name}"}} {method["seconds"]!r}')
+
+    lines += [
+        '# HELP networkdays_range_days Length of the requested ranges, in days.',
+        '# TYPE networkdays_range_days histogram',
+    ]
+    for name, method in stats.items():
+        cumulative = 0
+        for bucket, count in method['range_days'].items():
+            cumulative += count
+            lines.append(f'networkdays_range_days_bucket{{method="{name}",le="{bucket}"}} {cumulative}')
+        lines.append(f'networkdays_range_days_sum{{method="{name}"}} {method["range_days_sum"]}')
+        lines.append(f'networkdays_range_days_count{{method="{name}"}} {cumulative}')
+
+    return '\n'.join(lines) + '\n'
+
+
+Function = TypeVar('Function', bound=Callable[..., Any])
+
+
+def instrumented(name: str, range_days: Callable[..., Optional[int]]) -> Callable[[Function], Function]:
+    '''
+    Decorator, record the calls of a method as `name`.
+
+    Args:
+        name (str): name of the method in the stats.
+        range_days: called with the method arguments, returns the length in
+            days of the requested range.
+    '''
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start, range_days(*args, **kwargs))
+        return wrapper
+    return decorator
@@ -1,14 +1,582 @@
+import bisect
 import datetime
+import threading
+from array import array
 from itertools import groupby
 from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
     Set,
+    Tuple,
+    TYPE_CHECKING,
     Union,
 )
 
+from networkdays.cache import ResultCache
+from networkdays.instrumentation import instrumented
+from networkdays.rules import HolidayRules
+
+if TYPE_CHECKING:
+    from networkdays.capacity import WorkCapacity
+
+
+class _HolidaysWindow(NamedTuple):
+    first: int
+    last: int
+    holidays: List[int]
+    anchor_count: int
+    anchor: int = 0
+
+
+def _weekday_table(weekdaysoff: Iterable[int]) -> Tuple[int, ...]:
+    '''
+    Cumulative number of workdays per ISO weekday.
+
+    `table[r]` is the number of workdays among the ISO weekdays `1..r`, so
+    `table[0]` is always 0 and `table[7]` is the number of workdays per week.
+    '''
+    weekdaysoff = set(weekdaysoff)
+    table = [0]
+    for weekday in range(1, 8):
+        table.append(table[-1] + (weekday not in weekdaysoff))
+    return tuple(table)
+
+
+def _cumulative_workdays(ordinal: int, table: Sequence[int]) -> int:
+    '''
+    Number of workdays, holidays not considered, from `datetime.date.min`
+    up to `ordinal` (inclusive).
+
+    Ordinal 1 (0001-01-01) is a Monday, so each block of 7 ordinals is a full
+    ISO week and the remainder maps straight into the weekday table.
+    '''
+    weeks, weekday = divmod(ordinal, 7)
+    return weeks * table[7] + table[weekday]
+
+
+PERIODS = ('month', 'quarter', 'week')
+
+
+def _period_bounds(
+    date_start: datetime.date,
+    date_end: datetime.date,
+    period: str,
+) -> Iterator[Tuple[datetime.date, datetime.date]]:
+    '''
+    First and last days of each month, quarter or ISO week with any day
+    between `date_start` and `date_end`.
+    '''
+    if period not in PERIODS:
+        raise ValueError(f'period must be one of {", ".join(PERIODS)}, got {period!r}')
+
+    if period == 'week':
+        # by ordinals, the last week of `datetime.date.max` is not a full week
+        ordinal_max = datetime.date.max.toordinal()
+        for monday in range(date_start.toordinal() - date_start.isoweekday() + 1, date_end.toordinal() + 1, 7):
+            yield datetime.date.fromordinal(monday), datetime.date.fromordinal(min(monday + 6, ordinal_max))
+        return
+
+    months = 1 if period == 'month' else 3
+    year, month = date_start.year, date_start.month - (date_start.month - 1) % months
+    while (year, month) <= (date_end.year, date_end.month):
+        next_year, next_month = divmod(month - 1 + months, 12)
+        next_year += year
+        next_month += 1
+        if next_year > datetime.MAXYEAR:
+            last = datetime.date.max
+        else:
+            last = datetime.date(next_year, next_month, 1) - datetime.timedelta(days=1)
+        yield datetime.date(year, month, 1), last
+        year, month = next_year, next_month
+
+
+class BusinessCalendar:
+    '''
+    A business days calendar compiled once from holidays and weekdays off,
+    to be shared by any number of queries, `Networkdays` and `JobSchedule`
+    instances.
+
+    If `year_start` and `year_end` are informed, a cumulative workdays index
+    (prefix sums, one entry per day) is built for that span of years and
+    `count()` and `is_workday()` are O(1) inside it. Dates out of the span
+    are still answered, by weekday arithmetic and binary search over the
+    holidays, O(log H).
+
+    Holidays may be `HolidayRules`, expanded only for the years the queries
+    touch.
+
+    A calendar is an immutable value: its attributes are set once, query
+    methods take the dates as arguments and change nothing (but internal,
+    lock guarded, caches), and calendars with the same holidays and
+    weekdays off are equal and hash the same. One instance may be shared by
+    any number of threads and used as a dict or cache key.
+
+    Args:
+        holidays: list of datetime.date, or HolidayRules, indicating days off.
+        weekdaysoff (set): list of ISO weekdays not working,
+            default is Saturday and Sunday {6,7}.
+        year_start (int): first year of the cumulative index.
+        year_end (int): last year (inclusive) of the cumulative index.
+
+    ex.:
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7}, 2000, 2050)
+        calendar.count(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31))
+    '''
+
+    __slots__ = (
+        '_holidays_set',
+        '_weekdaysoff',
+        '_year_start',
+        '_year_end',
+        '_key',
+        '_hash',
+        '_weekday_table',
+        '_window',
+        '_window_lock',
+        '_holidays_sorted',
+        '_index_base',
+        '_index',
+    )
+
+    def __init__(
+        self,
+        holidays: Union[Iterable[datetime.date], HolidayRules] = (),
+        weekdaysoff: Iterable[int] = (6, 7),
+        year_start: Optional[int] = None,
+        year_end: Optional[int] = None,
+    ):
+        if (year_start is None) != (year_end is None):
+            raise ValueError('year_start and year_end must be informed together')
+        if year_start is not None and year_end is not None and year_end < year_start:
+            raise ValueError(f'year_end {year_end} is before year_start {year_start}')
+
+        # read only, by the properties
+        self._holidays_set: Union[FrozenSet[datetime.date], HolidayRules] = (
+            holidays if isinstance(holidays, HolidayRules) else frozenset(holidays)
+        )
+        self._weekdaysoff: FrozenSet[int] = frozenset(weekdaysoff)
+        self._year_start: Optional[int] = year_start
+        self._year_end: Optional[int] = year_end
+        self._key: Tuple[Union[FrozenSet[datetime.date], HolidayRules], FrozenSet[int]] = (
+            self._holidays_set, self._weekdaysoff
+        )
+        self._hash: int = hash(self._key)
+
+        # per weekday table and the holidays window: the sorted ordinals of
+        # the holidays that fall on a workday (others are already off by the
+        # weekday) between the first and the last ordinal of the window.
+        self._weekday_table: Tuple[int, ...] = _weekday_table(self._weekdaysoff)
+        self._window: Optional[_HolidaysWindow] = None
+        self._window_lock = threading.Lock()
+        # explicit holidays, sorted and deduplicated, for range queries by bisect
+        self._holidays_sorted: Tuple[datetime.date, ...] = ()
+        if not isinstance(self._holidays_set, HolidayRules):
+            self._holidays_sorted = tuple(sorted(self._holidays_set))
+            # a single window for every date
+            self._window = _HolidaysWindow(0, datetime.date.max.toordinal() + 1, [
+                d.toordinal() for d in self._holidays_sorted if d.isoweekday() not in self._weekdaysoff
+            ], 0)
+
+        # cumulative index, `_index[i]` is the number of workdays up to the
+        # ordinal `_index_base + i - 1`, inclusive.
+        self._index_base: int = 0
+        self._index: Sequence[int] = array('i')
+        if year_start is not None and year_end is not None:
+            self._index_base = datetime.date(year_start, 1, 1).toordinal()
+            self._index = self._build_index(self._index_base, datetime.date(year_end, 12, 31).toordinal())
+
+    @property
+    def holidays_set(self) -> Union[FrozenSet[datetime.date], HolidayRules]:
+        return self._holidays_set
+
+    @property
+    def weekdaysoff(self) -> FrozenSet[int]:
+        return self._weekdaysoff
+
+    @property
+    def year_start(self) -> Optional[int]:
+        return self._year_start
+
+    @property
+    def year_end(self) -> Optional[int]:
+        return self._year_end
+
+    @property
+    def key(self) -> Tuple[Union[FrozenSet[datetime.date], HolidayRules], FrozenSet[int]]:
+        '''
+        Immutable identity of the calendar, its holidays and weekdays off.
+        '''
+        return self._key
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BusinessCalendar):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return (
+            f'BusinessCalendar({self._holidays_set!r}, {set(self._weekdaysoff)!r}, '
+            f'{self._year_start!r}, {self._year_end!r})'
+        )
+
+    def __getstate__(self) -> dict:
+        state = {name: getattr(self, name) for name in self.__slots__ if name != '_window_lock'}
+        # an index loaded from a snapshot is a view of a memory mapped file
+        if not isinstance(state['_index'], array):
+            state['_index'] = array('i', state['_index'])
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._window_lock = threading.Lock()
+
+    @classmethod
+    def _from_index(
+        cls,
+        holidays: Union[Iterable[datetime.date], HolidayRules],
+        weekdaysoff: Iterable[int],
+        year_start: int,
+        year_end: int,
+        index_base: int,
+        index: Sequence[int],
+    ) -> 'BusinessCalendar':
+        '''
+        A calendar with a prebuilt cumulative index, like a snapshot one.
+        '''
+        calendar = cls(holidays, weekdaysoff)
+        calendar._year_start = year_start
+        calendar._year_end = year_end
+        calendar._index_base = index_base
+        calendar._index = index
+        if isinstance(calendar._holidays_set, HolidayRules):
+            # the rules window anchored as the one the index was built on
+            calendar._holidays_window(index_base - 1, index_base + len(index) - 2)
+        return calendar
+
+    def _holidays_window(self, ordinal_start: int, ordinal_end: int) -> '_HolidaysWindow':
+        '''
+        A holidays window covering the ordinals from `ordinal_start` to `ordinal_end`.
+
+        Explicit holidays have a single window. `HolidayRules` windows grow
+        by whole years, as the queries need: cumulative counts are relative to
+        the first ordinal ever covered (the anchor), so they don't change when
+        the window grows and values from different windows can be mixed.
+        '''
+        window = self._window
+        if window is not None and window.first <= ordinal_start and ordinal_end <= window.last:
+            return window
+
+        with self._window_lock:
+            window = self._window
+            year_start = datetime.date.fromordinal(max(ordinal_start, 1)).year
+            year_end = datetime.date.fromordinal(max(ordinal_end, 1)).year
+            if window is not None:
+                year_start = min(year_start, datetime.date.fromordinal(max(window.first, 1)).year)
+                year_end = max(year_end, datetime.date.fromordinal(window.last).year)
+                anchor = window.anchor
+            else:
+                anchor = datetime.date(year_start, 1, 1).toordinal()
+
+            holidays = sorted(
+                d.toordinal()
+                for year in range(year_start, year_end + 1)
+                for d in self._holidays_set.year(year)
+                if d.isoweekday() not in self._weekdaysoff
+            )
+            first = datetime.date(year_start, 1, 1).toordinal() if year_start > datetime.MINYEAR else 0
+            last = datetime.date(year_end, 12, 31).toordinal()
+            self._window = _HolidaysWindow(first, last, holidays, bisect.bisect_left(holidays, anchor), anchor)
+            return self._window
+
+    def _build_index(self, ordinal_start: int, ordinal_end: int) -> Sequence[int]:
+        window = self._holidays_window(ordinal_start - 1, ordinal_end)
+        index = array('i', [self._cumulative_ordinal(ordinal_start - 1, window)])
+        total = index[0]
+        weekdaysoff, holidays = self._weekdaysoff, self._holidays_set
+        for ordinal in range(ordinal_start, ordinal_end + 1):
+            total += (
+                (ordinal - 1) % 7 + 1 not in weekdaysoff and
+                datetime.date.fromordinal(ordinal) not in holidays
+            )
+            index.append(total)
+        return index
+
+    def _cumulative_ordinal(self, ordinal: int, window: '_HolidaysWindow') -> int:
+        '''
+        Number of workdays from `datetime.date.min` up to `ordinal` (inclusive),
+        minus the holidays counted from the window anchor.
+        '''
+        position = ordinal - self._index_base + 1
+        if 0 <= position < len(self._index):
+            return self._index[position]
+
+        return (
+            _cumulative_workdays(ordinal, self._weekday_table) -
+            bisect.bisect_right(window.holidays, ordinal) +
+            window.anchor_count
+        )
+
+    def count(self, date_start: datetime.date, date_end: datetime.date) -> int:
+        '''
+        Number of workdays between `date_start` and `date_end`, both inclusive.
+        '''
+        if date_end < date_start:
+            return 0
+        ordinal_start = date_start.toordinal() - 1
+        ordinal_end = date_end.toordinal()
+        window = self._holidays_window(ordinal_start, ordinal_end)
+        return self._cumulative_ordinal(ordinal_end, window) - self._cumulative_ordinal(ordinal_start, window)
+
+    def is_workday(self, date: datetime.date) -> bool:
+        ordinal = date.toordinal()
+        window = self._holidays_window(ordinal - 1, ordinal)
+        return self._cumulative_ordinal(ordinal, window) != self._cumulative_ordinal(ordinal - 1, window)
+
+    def _select_ordinal(self, target: int, window: '_HolidaysWindow') -> int:
+        '''
+        Ordinal of the workday number `target`, the inverse of
+        `_cumulative_ordinal()`. Right only if the window covers it.
+        '''
+        table = self._weekday_table
+        if table[7] == 0:
+            raise ValueError('there are no workdays, every weekday is off')
+
+        if len(self._index) > 1 and self._index[0] < target <= self._index[-1]:
+            return self._index_base - 1 + bisect.bisect_left(self._index, target)
+
+        # number of holidays (on workdays) up to the answer: the holiday `i`
+        # comes before the answer when the workdays before it, not counting
+        # the `i` holidays that precede it, are less than `target`.
+        target -= window.anchor_count
+        holidays = window.holidays
+        low, high = 0, len(holidays)
+        while low < high:
+            middle = (low + high) // 2
+            if _cumulative_workdays(holidays[middle], table) - middle <= target:
+                low = middle + 1
+            else:
+                high = middle
+
+        # the workday number `target + low` of the weekday table
+        weeks, weekday = divmod(target + low - 1, table[7])
+        return weeks * 7 + bisect.bisect_left(table, weekday + 1)
+
+    def add_workdays(self, date: datetime.date, days: int) -> datetime.date:
+        '''
+        Shift `date` by a number of workdays, like Excel WORKDAY function.
+
+        The `date` itself is not counted, `days` may be negative to go
+        backwards and 0 returns the `date` unchanged, even if it's a day off.
+        The cost is O(log H), H the number of holidays, whatever the `days`.
+
+        ex.:
+            calendar.add_workdays(datetime.date(2020, 12, 24), 1)
+            datetime.date(2020, 12, 28)  # 25 is a holiday, 26 and 27 weekend
+        '''
+        if days == 0:
+            return date
+
+        ordinal = date.toordinal()
+        window = self._holidays_window(ordinal - 1, ordinal)
+        if days > 0:
+            target = self._cumulative_ordinal(ordinal, window) + days
+        else:
+            target = self._cumulative_ordinal(ordinal - 1, window) + days + 1
+
+        # the answer is right once the window covers it, a window that grows
+        # may only bring more holidays, pushing the answer further
+        while True:
+            result = self._select_ordinal(target, window)
+            ordinal_start, ordinal_end = min(ordinal - 1, result), max(ordinal, result)
+            if window.first <= ordinal_start and ordinal_end <= window.last:
+                return datetime.date.fromordinal(result)
+            window = self._holidays_window(ordinal_start, ordinal_end)
+
+    def nth_workday(self, date_start: datetime.date, date_end: datetime.date, n: int) -> Optional[datetime.date]:
+        '''
+        The `n`-th workday between `date_start` and `date_end`, 1 is the
+        first and -1 the last, None if there are less than `abs(n)`.
+        '''
+        if n == 0:
+            raise ValueError('n must not be 0, 1 is the first workday and -1 the last')
+        if abs(n) > self.count(date_start, date_end):
+            return None
+        # shifted from the range bound, that counts only if it's a workday
+        date = date_start if n > 0 else date_end
+        shift = 1 if n > 0 else -1
+        return self.add_workdays(date, n - shift if self.is_workday(date) else n)
+
+    def nth_workdays(
+        self,
+        date_start: datetime.date,
+        date_end: datetime.date,
+        period: str = 'month',
+        n: int = -1,
+        output: str = 'list',
+    ) -> Union[List[Optional[datetime.date]], Sequence[int]]:
+        '''
+        The `n`-th workday (1 the first, -1 the last) of every month, quarter
+        or ISO week with any day between `date_start` and `date_end`. The
+        whole period is considered, not only the days inside the range.
+        Each period costs O(log H), whatever its length.
+
+        Args:
+            date_start (datetime.date): first day of the range.
+            date_end (datetime.date): last day of the range.
+            period (str): 'month', 'quarter' or 'week' (ISO).
+            n (int): 1 is the first workday of the period, -1 the last.
+            output (str): 'list' of dates, None where a period has less than
+                `abs(n)` workdays, or 'array', an `array('i')` of ordinals,
+                0 where a period has less than `abs(n)` workdays.
+
+        ex.:
+            calendar.nth_workdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31), 'month', -1)
+            # the last workday of each month of 2020
+        '''
+        if output not in ('list', 'array'):
+            raise ValueError(f"output must be 'list' or 'array', got {output!r}")
+
+        dates = [
+            self.nth_workday(first, last, n)
+            for first, last in _period_bounds(date_start, date_end, period)
+        ]
+        if output == 'array':
+            return array('i', [0 if date is None else date.toordinal() for date in dates])
+        return dates
+
+    def holidays(self, date_start: datetime.date, date_end: datetime.date) -> List[datetime.date]:
+        '''
+        Sorted holidays between `date_start` and `date_end`, both inclusive,
+        including those on weekdays off.
+        '''
+        if isinstance(self._holidays_set, HolidayRules):
+            return self._holidays_set.between(date_start, date_end)
+        return list(self._holidays_sorted[
+            bisect.bisect_left(self._holidays_sorted, date_start):
+            bisect.bisect_right(self._holidays_sorted, date_end)
+        ])
+
+    def holidays_count(self, date_start: datetime.date, date_end: datetime.date) -> int:
+        '''
+        Number of holidays between `date_start` and `date_end`, both
+        inclusive, including those on weekdays off. O(log H) for explicit
+        holidays.
+        '''
+        if isinstance(self._holidays_set, HolidayRules):
+            return len(self._holidays_set.between(date_start, date_end))
+        return max(
+            bisect.bisect_right(self._holidays_sorted, date_end) -
+            bisect.bisect_left(self._holidays_sorted, date_start),
+            0
+        )
+
+    def workdays(self, date_start: datetime.date, date_end: datetime.date) -> List[datetime.date]:
+        '''
+        List of workdays between `date_start` and `date_end`, both inclusive.
+        '''
+        return list(self.iter_workdays(date_start, date_end))
+
+    def iter_workdays(self, date_start: datetime.date, date_end: datetime.date) -> Iterator[datetime.date]:
+        '''
+        Yield, in order, the workdays between `date_start` and `date_end`.
+
+        The weekday is checked by arithmetic and the holidays by a cursor
+        over the sorted holidays, no intermediate collection is kept.
+        '''
+        return map(datetime.date.fromordinal, self._iter_ordinals(date_start, date_end))
+
+    def workday_ordinals(self, date_start: datetime.date, date_end: datetime.date) -> Sequence[int]:
+        '''
+        The workdays between `date_start` and `date_end` as an `array('i')` of
+        `datetime.date.toordinal()` ordinals, 4 bytes per workday and no
+        `datetime.date` objects.
+        '''
+        return array('i', self._iter_ordinals(date_start, date_end))
+
+    def workday_spans(
+        self,
+        date_start: datetime.date,
+        date_end: datetime.date,
+    ) -> List[Tuple[datetime.date, datetime.date]]:
+        '''
+        The workdays between `date_start` and `date_end` as runs of
+        consecutive days, a list of (first, last) dates, both inclusive.
+
+        ex.:
+            calendar.workday_spans(datetime.date(2020, 12, 21), datetime.date(2020, 12, 31))
+            [(datetime.date(2020, 12, 21), datetime.date(2020, 12, 24)),
+             (datetime.date(2020, 12, 28), datetime.date(2020, 12, 31))]
+        '''
+        spans = []
+        first = previous = None
+        for ordinal in self._iter_ordinals(date_start, date_end):
+            if previous is None or ordinal != previous + 1:
+                if previous is not None:
+                    spans.append((datetime.date.fromordinal(first), datetime.date.fromordinal(previous)))
+                first = ordinal
+            previous = ordinal
+        if previous is not None:
+            spans.append((datetime.date.fromordinal(first), datetime.date.fromordinal(previous)))
+        return spans
+
+    def _iter_ordinals(self, date_start: datetime.date, date_end: datetime.date) -> Iterator[int]:
+        ordinal_start = date_start.toordinal()
+        ordinal_end = date_end.toordinal()
+        holidays = self._holidays_window(ordinal_start, ordinal_end).holidays
+        position = bisect.bisect_left(holidays, ordinal_start)
+        next_holiday = holidays[position] if position < len(holidays) else ordinal_end + 1
+        weekdaysoff = self._weekdaysoff
+
+        for ordinal in range(ordinal_start, ordinal_end + 1):
+            if ordinal == next_holiday:
+                position += 1
+                next_holiday = holidays[position] if position < len(holidays) else ordinal_end + 1
+            elif (ordinal - 1) % 7 + 1 not in weekdaysoff:
+                yield ordinal
+
+
+# calendars compiled for the `Networkdays` instances without one, shared by
+# their holidays and weekdays off (a dict lookup, the holidays sets are
+# compared once), the oldest dropped past `_CALENDARS_MAXSIZE`.
+_CALENDARS_MAXSIZE = 64
+_calendars: Dict[Tuple[Union[FrozenSet[datetime.date], HolidayRules], FrozenSet[int]], BusinessCalendar] = {}
+_calendars_lock = threading.Lock()
+
+
+def _shared_calendar(
+    holidays: Union[FrozenSet[datetime.date], HolidayRules],
+    weekdaysoff: FrozenSet[int],
+) -> BusinessCalendar:
+    key = (holidays, weekdaysoff)
+    calendar = _calendars.get(key)
+    if calendar is None:
+        calendar = BusinessCalendar(holidays, weekdaysoff)
+        with _calendars_lock:
+            calendar = _calendars.setdefault(key, calendar)
+            while len(_calendars) > _CALENDARS_MAXSIZE:
+                del _calendars[next(iter(_calendars))]
+    return calendar
+
+
+# ranges up to these days are checked day by day by a `Networkdays` whose
+# calendar is not compiled yet
+_SCAN_DAYS = 62
+
+
+def _range_days(networkdays: 'Networkdays', *args: object, **kwargs: object) -> int:
+    return (networkdays._date_end() - networkdays.date_start).days + 1
+
 
 class Networkdays:
 
@@ -16,14 +584,108 @@ class Networkdays:
         self,
         date_start: datetime.date,
         date_end: Optional[datetime.date] = None,
-        holidays: Set[datetime.date] = set(),
-        weekdaysoff: Set[int] = {6, 7},
+        holidays: Union[Iterable[datetime.date], HolidayRules] = frozenset(),
+        weekdaysoff: Iterable[int] = frozenset({6, 7}),
+        calendar: Optional[BusinessCalendar] = None,
+        cache: Optional[ResultCache] = None,
     ):
+        '''
+        Args:
+            date_start (datetime.date): initial date
+            date_end (datetime.date): end date
+            holidays: list of datetime object, or HolidayRules, indicating days off.
+            weekdaysoff (set): list of weekdays not working.
+            calendar (BusinessCalendar): a prebuilt calendar, if informed its
+                holidays and weekdaysoff are used instead of the arguments.
+                If not, the holidays are frozen and the calendar compiled
+                on the first query that needs them, and the calendar is
+                shared with other instances of the same holidays and
+                weekdaysoff.
+            cache (ResultCache): opt-in cache for the `networkdays()`,
+                `weekends()` and `holidays()` results.
+        '''
         self.date_start: datetime.date = date_start
         self.date_end: Optional[datetime.date] = date_end
-        self.holidays_set: Set[datetime.date] = holidays
-        self.weekdaysoff: Set[int] = weekdaysoff
+        self.cache: Optional[ResultCache] = cache
+        self._calendar: Optional[BusinessCalendar] = calendar
+        # O(1), nothing is copied or compiled here, see `holidays_set` and `calendar`
+        self._holidays_given: Union[Iterable[datetime.date], HolidayRules] = holidays
+        self._holidays_set: Optional[Union[FrozenSet[datetime.date], HolidayRules]] = None
+        if calendar is not None:
+            self._holidays_set = calendar.holidays_set
+            self.weekdaysoff: FrozenSet[int] = calendar.weekdaysoff
+        else:
+            self.weekdaysoff = frozenset(weekdaysoff)
+
+    @property
+    def holidays_set(self) -> Union[FrozenSet[datetime.date], HolidayRules]:
+        '''
+        Frozen copy of the holidays (a frozenset is not copied), taken on
+        the first use.
+        '''
+        if self._holidays_set is None:
+            holidays = self._holidays_given
+            self._holidays_set = holidays if isinstance(holidays, HolidayRules) else frozenset(holidays)
+        return self._holidays_set
+
+    @property
+    def calendar(self) -> BusinessCalendar:
+        if self._calendar is None:
+            self._calendar = _shared_calendar(self.holidays_set, self.weekdaysoff)
+            # the same set of the calendar, cache keys are then compared by identity
+            self._holidays_set = self._calendar.holidays_set
+        return self._calendar
 
+    def _scan_holidays(self) -> Union[Set[datetime.date], FrozenSet[datetime.date], HolidayRules]:
+        '''
+        The holidays to check day by day, without copying them if they are a set.
+        '''
+        if self._holidays_set is not None:
+            return self._holidays_set
+        holidays = self._holidays_given
+        if isinstance(holidays, (set, frozenset, HolidayRules)):
+            return holidays
+        return self.holidays_set
+
+    def _scan(self) -> Optional[Iterator[datetime.date]]:
+        '''
+        The workdays of a short range checked day by day, if the calendar is
+        not compiled yet: cheaper than compiling it for a single query.
+        '''
+        if self._calendar is not None:
+            return None
+        date_end = self._date_end()
+        days = (date_end - self.date_start).days + 1
+        if days > _SCAN_DAYS:
+            return None
+        holidays = self._scan_holidays()
+        weekdaysoff = self.weekdaysoff
+        return (
+            date for date in (self.date_start + datetime.timedelta(days=day) for day in range(days))
+            if date.isoweekday() not in weekdaysoff and date not in holidays
+        )
+
+    def _cached(self, name: str, compute: Callable[[], List[datetime.date]]) -> List[datetime.date]:
+        if self.cache is None:
+            return compute()
+        # the calendar key, without compiling the calendar
+        key = (name, self.date_start, self._date_end(), (self.holidays_set, self.weekdaysoff))
+        # cached as tuple, so callers can't change it through the returned list
+        return list(self.cache.get(key, lambda: tuple(compute())))
+
+    def _date_end(self) -> datetime.date:
+        '''
+        `date_end`, or if none, 1 year after (by calendar) `date_start`.
+        '''
+        if self.date_end is None:
+            return datetime.date(
+                self.date_start.year + 1,
+                self.date_start.month,
+                self.date_start.day
+            )
+        return self.date_end
+
+    @instrumented('Networkdays.networkdays', _range_days)
     def networkdays(self) -> List[datetime.date]:
         '''
         NetWorkDays like Excel Networkdays function.
@@ -42,7 +704,8 @@ class Networkdays:
                 default is Saturday and Sunday {6,7}.
 
         returns:
-            list of work days.
+            list of work days, see `networkdays_ordinals()` and
+            `networkdays_spans()` for compact forms of long ranges.
 
         ex.:
             networkdays(
@@ -54,33 +717,89 @@ class Networkdays:
 
         '''
 
-        # if not date_end, assume 1 year after (by calendar) date start
-        if self.date_end is None:
-            self.date_end = datetime.date(
-                self.date_start.year + 1,
-                self.date_start.month,
-                self.date_start.day
-            )
+        return self._cached('networkdays', lambda: list(self.iter_networkdays()))
 
-        date_diff = self.date_end - self.date_start
-        dates = {
-            self.date_start + datetime.timedelta(days=days)
-            for days in range(0, (date_diff.days + 1))
-        }
+    def networkdays_ordinals(self) -> Sequence[int]:
+        '''
+        `networkdays()` as an `array('i')` of `datetime.date.toordinal()`
+        ordinals, 4 bytes per workday, not cached.
+        `numpy.frombuffer(ordinals, dtype=numpy.intc)` is a NumPy view of it,
+        without a copy.
+        '''
+        return self.calendar.workday_ordinals(self.date_start, self._date_end())
+
+    def networkdays_spans(self) -> List[Tuple[datetime.date, datetime.date]]:
+        '''
+        `networkdays()` as runs of consecutive workdays, a list of
+        (first, last) dates, both inclusive, not cached.
+        See `BusinessCalendar.workday_spans()`.
+        '''
+        return self.calendar.workday_spans(self.date_start, self._date_end())
+
+    def iter_networkdays(self) -> Iterator[datetime.date]:
+        '''
+        Lazy `networkdays()`, yield the workdays one at a time, in order,
+        with constant memory whatever the range length.
 
-        dates_weekends = self.weekends()
-        dates = dates.difference(dates_weekends)
-        dates_holidays = self.holidays()
-        dates = dates.difference(dates_holidays)
-        sorted_dates = sorted(dates)
+        ex.:
+            itertools.islice(Networkdays(date_start).iter_networkdays(), 10)
+        '''
+        workdays = self._scan()
+        if workdays is not None:
+            return workdays
+        return self.calendar.iter_workdays(self.date_start, self._date_end())
+
+    def count(self) -> int:
+        '''
+        Number of workdays between `date_start` and `date_end`, the same as
+        `len(self.networkdays())` but without building any list of dates.
 
-        return sorted_dates
+        Full weeks and the remaining days are counted by arithmetic over the
+        `weekdaysoff` and holidays on workdays by binary search, so the cost
+        is O(log H), H the number of holidays, whatever the range length
+        (or O(1) inside the indexed years of the `calendar`).
 
+        returns:
+            int: number of work days.
+        '''
+        workdays = self._scan()
+        if workdays is not None:
+            return sum(1 for _ in workdays)
+        return self.calendar.count(self.date_start, self._date_end())
+
+    def rank(self, date: datetime.date) -> int:
+        '''
+        Number of workdays of the range before `date`, its index in
+        `networkdays()` if it's a workday (like `bisect_left`), in O(log H).
+
+        ex.:
+            Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31)).rank(datetime.date(2020, 12, 7))
+            4  # 1st (a Tuesday) to 4th
+        '''
+        date_end = self._date_end()
+        if date <= self.date_start:
+            return 0
+        return self.calendar.count(self.date_start, min(date - datetime.timedelta(days=1), date_end))
+
+    def select(self, index: int) -> datetime.date:
+        '''
+        The workday at `index` of the range, `networkdays()[index]` (negative
+        from the end) without the list, in O(log H).
+
+        raises:
+            IndexError: if the range has no workday at `index`.
+        '''
+        workday = self.calendar.nth_workday(self.date_start, self._date_end(), index + 1 if index >= 0 else index)
+        if workday is None:
+            raise IndexError(f'workday index {index} out of range')
+        return workday
+
+    @instrumented('Networkdays.weekends', _range_days)
     def weekends(self) -> List[datetime.date]:
-        date_end = self.date_end
-        if date_end is None:
-            # This should not happen if networkdays() is called first, but as a public method, it's good to be safe.
-            date_end = datetime.date(self.date_start.year + 1, self.date_start.month, self.date_start.day)
+        return self._cached('weekends', self._weekends)
+
+    def _weekends(self) -> List[datetime.date]:
+        date_end = self._date_end()
         date_diff = date_end - self.date_start
         dates = [
             self.date_start + datetime.timedelta(days=days)
@@ -91,30 +810,104 @@ class Networkdays:
         dates = sorted(dates)
         return dates
 
+    @instrumented('Networkdays.holidays', _range_days)
     def holidays(self) -> List[datetime.date]:
-        date_end = self.date_end
-        if date_end is None:
-            # This should not happen if networkdays() is called first, but as a public method, it's good to be safe.
-            date_end = datetime.date(self.date_start.year + 1, self.date_start.month, self.date_start.day)
+        return self._cached('holidays', self._holidays)
+
+    def _holidays(self) -> List[datetime.date]:
+        return self.calendar.holidays(self.date_start, self._date_end())
 
-        filtered_holidays = [d for d in self.holidays_set if date_end >= d >= self.date_start]
-        return sorted(filtered_holidays)
+    def add_workdays(self, date: datetime.date, days: int) -> datetime.date:
+        '''
+        Shift `date` by a number of workdays, like Excel WORKDAY function,
+        using the holidays and weekdaysoff from the Networkdays instance.
+        See `BusinessCalendar.add_workdays()`.
+        '''
+        return self.calendar.add_workdays(date, days)
 
     def last_workday_of_month(self, year: int, month: int) -> Optional[datetime.date]:
         '''
         Return the last workday of a given month.
         It uses the holidays and weekdaysoff from the Networkdays instance.
         '''
+        first_day = datetime.date(year, month, 1)
+        if self._calendar is not None:
+            return self._calendar.nth_workdays(first_day, first_day, 'month', -1)[0]
+
+        # a single month, checked day by day without compiling the calendar
         import calendar
         _, num_days = calendar.monthrange(year, month)
-
+        holidays = self._scan_holidays()
         for day in range(num_days, 0, -1):
             date_cursor = datetime.date(year, month, day)
-            if date_cursor.isoweekday() not in self.weekdaysoff and \
-               date_cursor not in self.holidays_set:
+            if date_cursor.isoweekday() not in self.weekdaysoff and date_cursor not in holidays:
                 return date_cursor
+        return None
+
+    def nth_workdays(
+        self,
+        period: str = 'month',
+        n: int = -1,
+        output: str = 'list',
+    ) -> Union[List[Optional[datetime.date]], Sequence[int]]:
+        '''
+        The `n`-th workday (1 the first, -1 the last) of every month, quarter
+        or ISO week between `date_start` and `date_end`.
+        See `BusinessCalendar.nth_workdays()`.
+        '''
+        return self.calendar.nth_workdays(self.date_start, self._date_end(), period, n, output)
+
+
+def job_workdays_number(
+    project_duration_hours: Union[int, float],
+    workhours_per_day: Union[int, float],
+) -> int:
+    '''
+    Number of workdays of a job, a partial day of work counts as a workday.
+    '''
+    # number of workdays based on daily hours
+    workdays_number = int(project_duration_hours // workhours_per_day)
+    r = project_duration_hours % workhours_per_day
+    # check if need a partial day of work
+    if r != 0:
+        workdays_number += 1
+    return workdays_number
+
 
+# (project_duration_hours, workhours_per_day, date_start)
+JobSpec = Tuple[Union[int, float], Union[int, float], datetime.date]
+
+
+class JobSpan(NamedTuple):
+    '''
+    Compact job schedule, first and last workday, None if the job has no
+    workdays.
+    '''
+    date_start: Optional[datetime.date]
+    date_end: Optional[datetime.date]
+    bussines_days: int
+
+
+def job_span(calendar: BusinessCalendar, job: JobSpec) -> JobSpan:
+    '''
+    First and last workdays of a job, without listing the workdays, same
+    dates of `JobSchedule(*job, calendar=calendar)`.
+    '''
+    project_duration_hours, workhours_per_day, date_start = job
+    workdays_number = job_workdays_number(project_duration_hours, workhours_per_day)
+    if workdays_number <= 0:
+        return JobSpan(None, None, 0)
+
+    first_day_job = calendar.add_workdays(date_start - datetime.timedelta(days=1), 1)
+    last_day_job = calendar.add_workdays(first_day_job, workdays_number - 1)
+    return JobSpan(first_day_job, last_day_job, workdays_number)
+
+
+def _job_range_days(job: 'JobSchedule') -> Optional[int]:
+    # the workdays of a capacity job are only known once it's scheduled
+    if job.capacity is not None:
         return None
+    return job_workdays_number(job.project_duration_hours, job.workhours_per_day)
 
 
 class JobSchedule:
@@ -125,6 +918,8 @@ class JobSchedule:
         workhours_per_day: Union[int, float],
         date_start: datetime.date,
         networkdays: Optional[Networkdays] = None,
+        calendar: Optional[BusinessCalendar] = None,
+        capacity: Optional['WorkCapacity'] = None,
     ):
         '''
          Args:
@@ -132,12 +927,26 @@ class JobSchedule:
             workhours_per_day (int/decimal):
             date_start: a base date to start count
             networkdays: a Networkdays instance.
+            calendar: a BusinessCalendar, used when no `networkdays` is informed.
+            capacity: a WorkCapacity, hours of work per day, if informed the
+                job ends when its hours are done, `workhours_per_day` is not
+                used and the calendar is the capacity one.
 
         '''
+        if capacity is not None and calendar is None:
+            calendar = capacity.calendar
+
         self.project_duration_hours: Union[int, float] = project_duration_hours
         self.date_start: datetime.date = date_start
         self.workhours_per_day: Union[int, float] = workhours_per_day
         self.networkdays: Optional[Networkdays] = networkdays
+        self.calendar: Optional[BusinessCalendar] = calendar
+        self.capacity: Optional['WorkCapacity'] = capacity
+        # hours of work on the last day of the job
+        self.last_day_hours: Union[int, float] = 0
+        # the jobdays per year, month and ISO week, see `_periods()`
+        self._period_index: Optional[Dict[int, Dict[int, Dict[int, int]]]] = None
+        self._period_index_days: Optional[List[datetime.date]] = None
 
         self.jobdays: List[datetime.date] = self.job_workdays()
 
@@ -151,6 +960,8 @@ class JobSchedule:
             self.prj_starts = ''
             self.prj_ends = ''
 
+    # the requested range of a job is its number of workdays
+    @instrumented('JobSchedule.job_workdays', _job_range_days)
     def job_workdays(self) -> List[datetime.date]:
         '''
         list workdays for a given job duration
@@ -158,39 +969,50 @@ class JobSchedule:
         Returns:
             list: workday datetime.date list
         '''
-        # number of workdays based on daily hours
-        workdays_number = int(self.project_duration_hours // self.workhours_per_day)
-        r = self.project_duration_hours % self.workhours_per_day
-        # check if need a partial day of work
-        if r != 0:
-            workdays_number += 1
-
         if self.networkdays is None:
-            delta = datetime.timedelta(days=workdays_number)
-            date_end = self.date_start + delta
-            self.networkdays = Networkdays(self.date_start, date_end)
+            self.networkdays = Networkdays(self.date_start, calendar=self.calendar)
+            date_start = self.date_start
+            date_end = None
+        else:
+            # the job is bounded by the networkdays dates
+            date_start = max(self.date_start, self.networkdays.date_start)
+            date_end = self.networkdays._date_end()
 
-        workdays = self.networkdays.networkdays()
+        if self.project_duration_hours <= 0:
+            return []
 
-        # job schedule starts on date_start of the job
-        # look for the closest date  of date_start to start the job
-        start_date = self.date_start
-        while True:
-            try:
-                first_day_job = workdays.index(start_date)
-                break
-            except ValueError:
-                start_date += datetime.timedelta(days=1)
-
-        if workdays_number < len(workdays):
-            # only workdays and not the entire calendar
-            # todo: set a "borrow" flag, when last workday > date_end
-            workdays = workdays[first_day_job:first_day_job + workdays_number]
+        if self.capacity is not None:
+            # the job ends when its hours are done, by cumulative hours
+            finish = self.capacity.finish(date_start, self.project_duration_hours)
+            last_day_job = finish.date
+            self.last_day_hours = finish.hours
         else:
-            workdays = workdays[first_day_job:]
+            # job schedule starts on the closest workday of date_start
+            calendar = self.networkdays.calendar
+            workdays_number = job_workdays_number(self.project_duration_hours, self.workhours_per_day)
+            if workdays_number <= 0:
+                return []
+            first_day_job = calendar.add_workdays(date_start - datetime.timedelta(days=1), 1)
+            last_day_job = calendar.add_workdays(first_day_job, workdays_number - 1)
+            self.last_day_hours = self.project_duration_hours % self.workhours_per_day or self.workhours_per_day
 
+        truncated = False
+        if date_end is None:
+            self.networkdays.date_end = last_day_job
+        elif last_day_job > date_end:
+            # todo: set a "borrow" flag, when last workday > date_end
+            last_day_job = date_end
+            truncated = True
 
-        return workdays
+        if self.capacity is None:
+            jobdays = calendar.workdays(first_day_job, last_day_job)
+            if truncated:
+                self.last_day_hours = self.workhours_per_day if jobdays else 0
+        else:
+            jobdays = self.capacity.workdays(date_start, last_day_job)
+            if truncated:
+                self.last_day_hours = self.capacity.hours(jobdays[-1]) if jobdays else 0
+        return jobdays
 
     def years(self) -> Iterator[int]:
         '''
@@ -201,6 +1023,38 @@ class JobSchedule:
             self.jobdays[-1].year + 1
         ))
 
+    def _periods(self) -> Dict[int, Dict[int, Dict[int, int]]]:
+        '''
+        Index of the jobdays, year -> month -> ISO week -> number of
+        workdays, in the jobdays order. Built on first use, in one pass,
+        the ISO week is computed once per week and not per day.
+        '''
+        if self._period_index is None or self._period_index_days is not self.jobdays:
+            index: Dict[int, Dict[int, Dict[int, int]]] = {}
+            next_monday = 0
+            week = 0
+            for day in self.jobdays:
+                ordinal = day.toordinal()
+                if ordinal >= next_monday:
+                    week = day.isocalendar()[1]
+                    # ordinal 1 is a Monday
+                    next_monday = ordinal - (ordinal - 1) % 7 + 7
+                weeks = index.setdefault(day.year, {}).setdefault(day.month, {})
+                weeks[week] = weeks.get(week, 0) + 1
+            self._period_index = index
+            self._period_index_days = self.jobdays
+        return self._period_index
+
+    def _months_weeks(self, year: Optional[int] = None, month: Optional[int] = None) -> List[Dict[int, int]]:
+        '''
+        The ISO weeks of each month of the jobdays, filtered by year and month.
+        '''
+        periods = self._periods()
+        years = [periods.get(year, {})] if year else list(periods.values())
+        if month:
+            return [months[month] for months in years if month in months]
+        return [weeks for months in years for weeks in months.values()]
+
     def months(self, year: Optional[int] = None) -> Iterator[int]:
         """return a weeks `iterATOR`
 
@@ -210,10 +1064,10 @@ class JobSchedule:
         Returns:
             TYPE: Description
         """
-        days: Iterable[datetime.date] = self.jobdays
-        if year:
-            days = filter(lambda x: x.year == year, days)
-        return iter([year for year, days_per_year in groupby(days, lambda x: x.month)])
+        periods = self._periods()
+        months = periods.get(year, {}) if year else [month for months in periods.values() for month in months]
+        # consecutive repeated months are one (a gap of whole years apart)
+        return iter([month for month, _ in groupby(months)])
 
     def weeks(self, year: Optional[int] = None, month: Optional[int] = None) -> Iterator[int]:
         """
@@ -228,13 +1082,26 @@ class JobSchedule:
         Returns:
             iter: weeks iso numbers based
         """
-        days: Iterable[datetime.date] = self.jobdays
-        if year:
-            days = filter(lambda x: x.year == year, days)
-        if month:
-            days = filter(lambda x: x.month == month, days)
+        weeks = [week for month_weeks in self._months_weeks(year, month) for week in month_weeks]
+        # a week split by a month (or year) is one
+        return iter([week for week, _ in groupby(weeks)])
 
-        return iter([weeks for weeks, days_per_year in groupby(days, lambda x: x.isocalendar()[1])])
+    def workdays_count(
+        self,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        week: Optional[int] = None,
+    ) -> int:
+        '''
+        Number of workdays of the job in a year, month or ISO week, by the
+        same filters of `weeks()`.
+
+        ex.:
+            jobschedule.workdays_count(2021, 1, 53)  # Jan 1st to 3rd, 2021
+        '''
+        if week:
+            return sum(month_weeks.get(week, 0) for month_weeks in self._months_weeks(year, month))
+        return sum(sum(month_weeks.values()) for month_weeks in self._months_weeks(year, month))
 
     def days(self) -> Iterator[datetime.date]:
         return iter(self.jobdays)
@@ -0,0 +1,103 @@
+'''
+Bulk `JobSchedule` computation on a process pool.
+
+The calendar is sent once to each worker process, when the worker starts,
+and the jobs are sent in chunks, so a job costs only its own
+(hours, hours per day, start date) tuple on the way in and its result on
+the way out.
+'''
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from networkdays.networkdays import BusinessCalendar, JobSpan, JobSpec, job_span
+
+
+class JobScheduleFields(NamedTuple):
+    '''
+    The `JobSchedule` fields of a job.
+    '''
+    jobdays: List[datetime.date]
+    bussines_days: int
+    prj_starts: str
+    prj_ends: str
+
+
+# the calendar of a worker process, set once by `_init_worker`
+_worker_calendar: Optional[BusinessCalendar] = None
+
+
+def _init_worker(calendar: BusinessCalendar) -> None:
+    global _worker_calendar
+    _worker_calendar = calendar
+
+
+def job_schedule_fields(calendar: BusinessCalendar, job: JobSpec) -> JobScheduleFields:
+    span = job_span(calendar, job)
+    if not span.bussines_days:
+        return JobScheduleFields([], 0, '', '')
+
+    jobdays = calendar.workdays(span.date_start, span.date_end)
+    return JobScheduleFields(
+        jobdays,
+        len(jobdays),
+        jobdays[0].strftime('%x'),
+        jobdays[-1].strftime('%x'),
+    )
+
+
+def _worker_job_span(job: JobSpec) -> JobSpan:
+    return job_span(_worker_calendar, job)
+
+
+def _worker_job_schedule_fields(job: JobSpec) -> JobScheduleFields:
+    return job_schedule_fields(_worker_calendar, job)
+
+
+def schedule_jobs(
+    jobs: Iterable[JobSpec],
+    calendar: Optional[BusinessCalendar] = None,
+    compact: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Union[List[JobSpan], List[JobScheduleFields]]:
+    '''
+    Schedule many jobs across processes, results in the same order of `jobs`.
+
+    Args:
+        jobs: (project_duration_hours, workhours_per_day, date_start) tuples.
+        calendar (BusinessCalendar): shared by every job, sent once per
+            worker. Default is no holidays, Saturday and Sunday off.
+        compact (bool): return `JobSpan` (first day, last day, number of
+            workdays) instead of the `JobScheduleFields`.
+        workers (int): number of processes, default is the number of CPUs.
+            With 1 worker the jobs are scheduled on the current process.
+        chunksize (int): jobs sent to a worker at a time.
+
+    returns:
+        list of `JobSpan` or `JobScheduleFields`.
+
+    ex.:
+        schedule_jobs(
+            [(120, 8, datetime.date(2024, 7, 1)), (16, 8, datetime.date(2024, 7, 5))],
+            calendar=BusinessCalendar(HOLIDAYS),
+            compact=True,
+        )
+    '''
+    if calendar is None:
+        calendar = BusinessCalendar()
+    jobs = list(jobs)
+
+    if workers == 1:
+        schedule = job_span if compact else job_schedule_fields
+        return [schedule(calendar, job) for job in jobs]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(len(jobs) // (workers * 4), 1)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(calendar,)) as pool:
+        worker_schedule = _worker_job_span if compact else _worker_job_schedule_fields
+        return list(pool.map(worker_schedule, jobs, chunksize=chunksize))
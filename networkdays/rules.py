@@ -0,0 +1,208 @@
+'''
+Holiday rules, expanded lazily per year.
+
+Instead of an explicit set of dates covering every year that may ever be
+queried, holidays may be given as rules. A `HolidayRules` expands them only
+for the years a query touches and caches each year, so memory and setup time
+scale with the queried span.
+
+ex.:
+    HOLIDAYS = HolidayRules([
+        FixedDate(1, 1),                 # New Year's Day
+        EasterOffset(-2),                # Good Friday
+        NthWeekday(11, 4, 4),            # Thanksgiving, 4th Thursday of November
+        LastWeekday(5, 1),               # Memorial Day, last Monday of May
+        Observed(FixedDate(12, 25)),     # Christmas, on Monday if on a weekend
+    ])
+    Networkdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31), HOLIDAYS)
+'''
+import bisect
+import calendar
+import datetime
+import threading
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Tuple
+
+
+def easter(year: int) -> datetime.date:
+    '''
+    Easter Sunday of the Gregorian calendar (anonymous Gregorian algorithm).
+    '''
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+class FixedDate(NamedTuple):
+    '''
+    Same day every year, like Christmas `FixedDate(12, 25)`.
+    '''
+    month: int
+    day: int
+
+    def dates(self, year: int) -> List[datetime.date]:
+        try:
+            return [datetime.date(year, self.month, self.day)]
+        except ValueError:  # february 29 on a common year
+            return []
+
+
+class NthWeekday(NamedTuple):
+    '''
+    The `n`-th ISO `weekday` (Monday is 1) of a month, like Thanksgiving,
+    the 4th Thursday of November, `NthWeekday(11, 4, 4)`.
+    '''
+    month: int
+    weekday: int
+    n: int
+
+    def dates(self, year: int) -> List[datetime.date]:
+        first = datetime.date(year, self.month, 1)
+        day = 1 + (self.weekday - first.isoweekday()) % 7 + 7 * (self.n - 1)
+        if day > calendar.monthrange(year, self.month)[1]:
+            return []
+        return [datetime.date(year, self.month, day)]
+
+
+class LastWeekday(NamedTuple):
+    '''
+    The last ISO `weekday` (Monday is 1) of a month, like Memorial Day,
+    the last Monday of May, `LastWeekday(5, 1)`.
+    '''
+    month: int
+    weekday: int
+
+    def dates(self, year: int) -> List[datetime.date]:
+        last = datetime.date(year, self.month, calendar.monthrange(year, self.month)[1])
+        return [last - datetime.timedelta(days=(last.isoweekday() - self.weekday) % 7)]
+
+
+class EasterOffset(NamedTuple):
+    '''
+    Days from Easter Sunday, like Good Friday `EasterOffset(-2)` or
+    Corpus Christi `EasterOffset(60)`.
+    '''
+    days: int = 0
+
+    def dates(self, year: int) -> List[datetime.date]:
+        try:
+            return [easter(year) + datetime.timedelta(days=self.days)]
+        except OverflowError:
+            return []
+
+
+class Observed(NamedTuple):
+    '''
+    A rule whose holiday, when on a weekend, is observed on another day.
+    By default on the following Monday, Saturday +2 days and Sunday +1 day,
+    for the US rule (Saturday on Friday) use `Observed(rule, saturday=-1)`.
+    '''
+    rule: NamedTuple
+    saturday: int = 2
+    sunday: int = 1
+
+    def dates(self, year: int) -> List[datetime.date]:
+        shifts = {6: self.saturday, 7: self.sunday}
+        dates = []
+        for date in self.rule.dates(year):
+            try:
+                dates.append(date + datetime.timedelta(days=shifts.get(date.isoweekday(), 0)))
+            except OverflowError:
+                pass
+        return dates
+
+
+def _rule_identity(rule: object) -> Tuple[str, object]:
+    '''
+    A rule with its type, rules of different types with the same fields
+    (`FixedDate(5, 1)` and `LastWeekday(5, 1)`) are not the same rule.
+    '''
+    if not isinstance(rule, tuple):
+        return (type(rule).__qualname__, rule)
+    return (
+        type(rule).__qualname__,
+        tuple(_rule_identity(field) if hasattr(field, 'dates') else field for field in rule),
+    )
+
+
+class HolidayRules:
+    '''
+    Holidays from rules, expanded per year on demand and cached.
+
+    It may be used anywhere a set of holidays is expected by `Networkdays`
+    or `BusinessCalendar`, and shared by many of them.
+
+    Args:
+        rules: objects with a `dates(year)` method, like `FixedDate`,
+            `NthWeekday`, `LastWeekday`, `EasterOffset` or `Observed`.
+    '''
+
+    def __init__(self, rules: Iterable[NamedTuple]):
+        self.rules: Tuple[NamedTuple, ...] = tuple(rules)
+        self._identity: Tuple[Tuple[str, object], ...] = tuple(_rule_identity(rule) for rule in self.rules)
+        # per year, holidays set and sorted holidays
+        self._years: Dict[int, Tuple[FrozenSet[datetime.date], Tuple[datetime.date, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def _year(self, year: int) -> Tuple[FrozenSet[datetime.date], Tuple[datetime.date, ...]]:
+        holidays = self._years.get(year)
+        if holidays is not None:
+            return holidays
+
+        dates = set()
+        for rules_year in range(max(year - 1, datetime.MINYEAR), min(year + 1, datetime.MAXYEAR) + 1):
+            for rule in self.rules:
+                dates.update(date for date in rule.dates(rules_year) if date.year == year)
+
+        holidays = (frozenset(dates), tuple(sorted(dates)))
+        with self._lock:
+            return self._years.setdefault(year, holidays)
+
+    def year(self, year: int) -> FrozenSet[datetime.date]:
+        '''
+        Holidays on `year`, including those that a shift (like `Observed`)
+        brings from the previous or the next year.
+        '''
+        return self._year(year)[0]
+
+    def between(self, date_start: datetime.date, date_end: datetime.date) -> List[datetime.date]:
+        '''
+        Sorted holidays between `date_start` and `date_end`, both inclusive.
+        '''
+        dates: List[datetime.date] = []
+        for year in range(date_start.year, date_end.year + 1):
+            holidays = self._year(year)[1]
+            if year == date_start.year or year == date_end.year:
+                holidays = holidays[
+                    bisect.bisect_left(holidays, date_start):bisect.bisect_right(holidays, date_end)
+                ]
+            dates.extend(holidays)
+        return dates
+
+    def __contains__(self, date: object) -> bool:
+        return isinstance(date, datetime.date) and date in self.year(date.year)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HolidayRules):
+            return NotImplemented
+        return self._identity == other._identity
+
+    def __hash__(self) -> int:
+        return hash(self._identity)
+
+    def __getstate__(self) -> dict:
+        # the cache is dropped, the lock can't be pickled
+        return {'rules': self.rules}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['rules'])
+
+    def __repr__(self) -> str:
+        return f'HolidayRules({list(self.rules)!r})'
@@ -0,0 +1,229 @@
+'''
+Local query server, calendars are loaded once and queries are answered as
+JSON over HTTP, on localhost or a UNIX socket.
+
+Run it with `python -m networkdays serve`, every query is a POST with a JSON
+object body, dates are ISO strings and `calendar` selects a named calendar
+(the default one if omitted):
+
+    POST /count          {"start": "2020-12-01", "end": "2020-12-31"}
+                         {"count": 22}
+    POST /networkdays    {"start": "2020-12-01", "end": "2020-12-04"}
+                         {"workdays": ["2020-12-01", ...]}
+    POST /add_workdays   {"date": "2020-12-24", "days": 1}
+                         {"date": "2020-12-28"}
+    POST /jobschedule    {"hours": 120, "hours_per_day": 8, "start": "2024-07-01"}
+                         {"jobdays": [...], "bussines_days": 15, "prj_starts": "2024-07-01", "prj_ends": "2024-07-19"}
+    GET  /health         {"status": "ok"}
+'''
+import datetime
+import json
+import os
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, Optional
+
+from networkdays.networkdays import BusinessCalendar, JobSchedule, Networkdays
+
+
+Calendars = Dict[Optional[str], BusinessCalendar]
+
+
+def _date(query: Dict[str, Any], key: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(query[key])
+    except KeyError:
+        raise ValueError(f'missing "{key}"')
+    except (TypeError, ValueError):
+        raise ValueError(f'cant convert date "{query[key]}"')
+
+
+def _calendar(query: Dict[str, Any], calendars: Calendars) -> BusinessCalendar:
+    name = query.get('calendar')
+    if name is not None and not isinstance(name, str):
+        raise ValueError(f'calendar must be a string, got {name!r}')
+    if name not in calendars:
+        raise ValueError(f'unknown calendar "{name}"')
+    return calendars[name]
+
+
+def _networkdays(query: Dict[str, Any], calendars: Calendars) -> Networkdays:
+    date_end = _date(query, 'end') if query.get('end') else None
+    return Networkdays(_date(query, 'start'), date_end, calendar=_calendar(query, calendars))
+
+
+def query_count(query: Dict[str, Any], calendars: Calendars) -> Dict[str, Any]:
+    return {'count': _networkdays(query, calendars).count()}
+
+
+def query_networkdays(query: Dict[str, Any], calendars: Calendars) -> Dict[str, Any]:
+    return {'workdays': [date.isoformat() for date in _networkdays(query, calendars).iter_networkdays()]}
+
+
+def query_add_workdays(query: Dict[str, Any], calendars: Calendars) -> Dict[str, Any]:
+    days = query.get('days')
+    if isinstance(days, bool) or not isinstance(days, int):
+        raise ValueError(f'days must be an integer, got {days!r}')
+    date = _calendar(query, calendars).add_workdays(_date(query, 'date'), days)
+    return {'date': date.isoformat()}
+
+
+def query_jobschedule(query: Dict[str, Any], calendars: Calendars) -> Dict[str, Any]:
+    hours = query.get('hours')
+    hours_per_day = query.get('hours_per_day')
+    for name, value in (('hours', hours), ('hours_per_day', hours_per_day)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise ValueError(f'{name} must be a positive number, got {value!r}')
+
+    jobschedule = JobSchedule(hours, hours_per_day, _date(query, 'start'), calendar=_calendar(query, calendars))
+    jobdays = jobschedule.jobdays
+    return {
+        'jobdays': [date.isoformat() for date in jobdays],
+        'bussines_days': jobschedule.bussines_days,
+        'prj_starts': jobdays[0].isoformat() if jobdays else None,
+        'prj_ends': jobdays[-1].isoformat() if jobdays else None,
+    }
+
+
+QUERIES: Dict[str, Callable[[Dict[str, Any], Calendars], Dict[str, Any]]] = {
+    '/count': query_count,
+    '/networkdays': query_networkdays,
+    '/add_workdays': query_add_workdays,
+    '/jobschedule': query_jobschedule,
+}
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    '''
+    JSON queries handler, the calendars are taken from the server.
+    '''
+
+    server_version = 'networkdays'
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self) -> None:
+        # idle keep-alive connections are closed, not holding a pool worker
+        self.timeout = self.server.idle_timeout
+        super().setup()
+
+    def _reply(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == '/health':
+            self._reply(200, {'status': 'ok'})
+        else:
+            self._reply(404, {'error': f'not found "{self.path}"'})
+
+    def do_POST(self) -> None:
+        query_function = QUERIES.get(self.path)
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            # the body can't be skipped, so neither the connection kept
+            self.close_connection = True
+            self._reply(400, {'error': f'invalid Content-Length "{self.headers["Content-Length"]}"'})
+            return
+        body = self.rfile.read(length)
+        if query_function is None:
+            self._reply(404, {'error': f'not found "{self.path}"'})
+            return
+
+        try:
+            query = json.loads(body or b'{}')
+            if not isinstance(query, dict):
+                raise ValueError('query must be a JSON object')
+            result = self.server.compute(query_function, query, self.server.calendars)
+        except (ValueError, OverflowError) as e:
+            self._reply(400, {'error': str(e)})
+            return
+        self._reply(200, result)
+
+    def address_string(self) -> str:
+        # UNIX socket clients have no address
+        return self.client_address[0] if self.client_address else self.server.server_address
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class PoolMixIn(socketserver.ThreadingMixIn):
+    '''
+    Each connection on its own thread, the queries computed on a bounded
+    thread pool of `workers`.
+
+    An idle keep-alive connection holds only its own thread, not a pool
+    worker, until it is closed or idle for `idle_timeout` seconds.
+    '''
+
+    workers: Optional[int] = None
+    idle_timeout: Optional[float] = 5.0
+    daemon_threads = True
+
+    def _pool(self) -> ThreadPoolExecutor:
+        pool = getattr(self, '_executor', None)
+        if pool is None:
+            pool = self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return pool
+
+    def compute(self, function: Callable[..., Any], *args: Any) -> Any:
+        '''
+        `function(*args)` on a pool worker, waiting for its result.
+        '''
+        return self._pool().submit(function, *args).result()
+
+    def server_close(self) -> None:
+        super().server_close()
+        pool = getattr(self, '_executor', None)
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+class QueryServer(PoolMixIn, HTTPServer):
+
+    def __init__(self, address, calendars: Calendars, workers: Optional[int] = None, verbose: bool = False):
+        self.calendars: Calendars = calendars
+        self.workers = workers
+        self.verbose: bool = verbose
+        super().__init__(address, QueryHandler)
+
+
+class UnixQueryServer(PoolMixIn, socketserver.UnixStreamServer):
+
+    def __init__(self, path: str, calendars: Calendars, workers: Optional[int] = None, verbose: bool = False):
+        self.calendars: Calendars = calendars
+        self.workers = workers
+        self.verbose: bool = verbose
+        super().__init__(path, QueryHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def make_server(
+    calendars: Calendars,
+    host: str = '127.0.0.1',
+    port: int = 8000,
+    unix_socket: Optional[str] = None,
+    workers: Optional[int] = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    '''
+    Server on `unix_socket`, if informed, or on `host`:`port`.
+    '''
+    if unix_socket:
+        return UnixQueryServer(unix_socket, calendars, workers, verbose)
+    return QueryServer((host, port), calendars, workers, verbose)
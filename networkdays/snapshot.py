@@ -0,0 +1,141 @@
+'''
+Compiled `BusinessCalendar` snapshots, a binary file to load calendars
+without building them again.
+
+The file has a 32 bytes header, the sorted ordinals of the holidays and
+the cumulative workdays index, both as int32 in the byte order of the
+machine that wrote it, and for `HolidayRules` the rules, as JSON. `load_snapshot()` maps the file in memory and the
+index is used from the mapped pages, not copied, so processes loading
+the same snapshot share them.
+
+Header, little endian:
+    magic (4s) b'NWDC', version (H), byte order (B) 0 little 1 big endian,
+    weekdays off (B) bit `w - 1` set for ISO weekday `w`, year_start (i),
+    year_end (i), index base ordinal (i), number of holidays (I), index
+    length (I), rules JSON length (I), 0 without rules.
+
+Rules are stored as `[type, *fields]` lists, only the rules of
+`networkdays.rules` may be stored.
+
+ex.:
+    write_snapshot(BusinessCalendar(HOLIDAYS, {6, 7}, 2000, 2050), 'calendar.nwd')
+    calendar = load_snapshot('calendar.nwd')  # in each worker
+'''
+import datetime
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, List, NamedTuple, Sequence
+
+from networkdays.networkdays import BusinessCalendar
+from networkdays.rules import EasterOffset, FixedDate, HolidayRules, LastWeekday, NthWeekday, Observed
+
+
+MAGIC = b'NWDC'
+VERSION = 2
+HEADER = struct.Struct('<4sHBBiiiIII')
+
+RULES = {rule.__name__: rule for rule in (FixedDate, NthWeekday, LastWeekday, EasterOffset, Observed)}
+
+_BYTEORDERS = ('little', 'big')
+
+
+def _encode_rule(rule: Any) -> List[Any]:
+    if RULES.get(type(rule).__name__) is not type(rule):
+        raise ValueError(f'{rule!r} is not a networkdays.rules rule, it cant be stored in a snapshot')
+    return [type(rule).__name__] + [
+        _encode_rule(field) if hasattr(field, 'dates') else field for field in rule
+    ]
+
+
+def _decode_rule(encoded: List[Any]) -> NamedTuple:
+    name, *fields = encoded
+    return RULES[name](*(_decode_rule(field) if isinstance(field, list) else field for field in fields))
+
+
+def write_snapshot(calendar: BusinessCalendar, path: str) -> None:
+    '''
+    Write a calendar snapshot file. The calendar must have the cumulative
+    index (`year_start` and `year_end`), `HolidayRules` are written as
+    rules, so the loaded calendar has the holidays of any year.
+    '''
+    if calendar.year_start is None or calendar.year_end is None:
+        raise ValueError('a snapshot needs a calendar with year_start and year_end')
+
+    rules = b''
+    if isinstance(calendar.holidays_set, HolidayRules):
+        holidays = []
+        rules = json.dumps([_encode_rule(rule) for rule in calendar.holidays_set.rules]).encode()
+    else:
+        holidays = calendar.holidays(datetime.date.min, datetime.date.max)
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        _BYTEORDERS.index(sys.byteorder),
+        sum(1 << (weekday - 1) for weekday in calendar.weekdaysoff),
+        calendar.year_start,
+        calendar.year_end,
+        calendar._index_base,
+        len(holidays),
+        len(calendar._index),
+        len(rules),
+    )
+    with open(path, 'wb') as snapshot:
+        snapshot.write(header)
+        snapshot.write(array('i', [holiday.toordinal() for holiday in holidays]).tobytes())
+        snapshot.write(array('i', calendar._index).tobytes())
+        snapshot.write(rules)
+
+
+def load_snapshot(path: str) -> BusinessCalendar:
+    '''
+    Load a calendar from a snapshot file, the index is used straight from
+    the memory mapped file (copied only if the file byte order is not the
+    machine one).
+    '''
+    with open(path, 'rb') as snapshot:
+        data = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(data) < HEADER.size:
+        raise ValueError(f'{path} is not a calendar snapshot, too short')
+    (
+        magic, version, byteorder, weekdaysoff, year_start, year_end,
+        index_base, holidays_number, index_length, rules_length,
+    ) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a calendar snapshot')
+    # version 1 has no rules, its rules length is the (zero) padding
+    if version not in (1, VERSION):
+        raise ValueError(f'{path} snapshot version {version} is not supported')
+    rules_offset = HEADER.size + 4 * (holidays_number + index_length)
+    if len(data) != rules_offset + rules_length:
+        raise ValueError(f'{path} snapshot is truncated')
+
+    offset = HEADER.size + 4 * holidays_number
+    holidays: Sequence[int] = memoryview(data)[HEADER.size:offset].cast('i')
+    index: Sequence[int] = memoryview(data)[offset:rules_offset].cast('i')
+    if _BYTEORDERS[byteorder] != sys.byteorder:
+        holidays, index = array('i', holidays), array('i', index)
+        holidays.byteswap()
+        index.byteswap()
+
+    if rules_length:
+        try:
+            rules = [_decode_rule(rule) for rule in json.loads(bytes(data[rules_offset:]))]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f'{path} snapshot rules are invalid: {e}')
+        calendar_holidays: Any = HolidayRules(rules)
+    else:
+        calendar_holidays = [datetime.date.fromordinal(holiday) for holiday in holidays]
+
+    return BusinessCalendar._from_index(
+        calendar_holidays,
+        {weekday for weekday in range(1, 8) if weekdaysoff & 1 << (weekday - 1)},
+        year_start,
+        year_end,
+        index_base,
+        index,
+    )
@@ -0,0 +1,138 @@
+'''
+Business days over NumPy arrays of dates.
+
+Same semantics of `networkdays.networkdays.Networkdays`, but a whole batch of
+date ranges is computed at once, sharing a single holidays/weekdaysoff
+configuration, instead of one `Networkdays` object per range.
+
+NumPy is an optional dependency, needed only by this module::
+
+    pip install python-networkdays[numpy]
+'''
+import datetime
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+
+# `datetime.date.toordinal()` of the `datetime64` epoch, 1970-01-01
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def as_datetime64(dates) -> np.ndarray:
+    '''
+    Convert dates to a `datetime64[D]` array.
+
+    Args:
+        dates: array like of `datetime64`, `datetime.date` or integers,
+            integers are taken as `datetime.date.toordinal()` ordinals.
+    '''
+    dates = np.asarray(dates)
+    if np.issubdtype(dates.dtype, np.integer):
+        return (dates - EPOCH_ORDINAL).astype('datetime64[D]')
+    return dates.astype('datetime64[D]')
+
+
+def weekmask(weekdaysoff: Iterable[int]) -> List[int]:
+    '''
+    NumPy weekmask, Monday to Sunday, for the ISO `weekdaysoff`.
+    '''
+    weekdaysoff = set(weekdaysoff)
+    return [int(weekday not in weekdaysoff) for weekday in range(1, 8)]
+
+
+def busdaycalendar(
+    holidays: Iterable[datetime.date] = (),
+    weekdaysoff: Iterable[int] = (6, 7),
+) -> Optional[np.busdaycalendar]:
+    '''
+    Build a `numpy.busdaycalendar`, it may be reused for many batches.
+
+    Returns None when every weekday is off, NumPy does not accept an
+    empty weekmask.
+    '''
+    mask = weekmask(weekdaysoff)
+    if not any(mask):
+        return None
+    return np.busdaycalendar(
+        weekmask=mask,
+        holidays=as_datetime64(list(holidays)),
+    )
+
+
+def busday_count(
+    date_start,
+    date_end,
+    holidays: Iterable[datetime.date] = (),
+    weekdaysoff: Iterable[int] = (6, 7),
+) -> np.ndarray:
+    '''
+    Number of workdays between each pair of dates, like
+    `len(Networkdays(start, end, holidays, weekdaysoff).networkdays())`.
+
+    Both dates are inclusive and a range where the end is before the
+    start has no workdays.
+
+    Args:
+        date_start: array like of start dates (`datetime64[D]` or ordinals).
+        date_end: array like of end dates, same shape of `date_start`.
+        holidays: list of `datetime.date`, shared by every range.
+        weekdaysoff (set): ISO weekdays off, default is {6, 7}.
+
+    returns:
+        numpy.ndarray: int array of workdays numbers.
+
+    ex.:
+        busday_count(
+            np.array(['2020-12-01', '2021-01-01'], dtype='datetime64[D]'),
+            np.array(['2020-12-31', '2021-01-31'], dtype='datetime64[D]'),
+            holidays={datetime.date(2020, 12, 25)},
+        )
+        array([22, 21])
+    '''
+    starts = as_datetime64(date_start)
+    ends = as_datetime64(date_end)
+    calendar = busdaycalendar(holidays, weekdaysoff)
+    if calendar is None:
+        return np.zeros(np.broadcast(starts, ends).shape, dtype=np.int64)
+
+    counts = np.busday_count(starts, ends + np.timedelta64(1, 'D'), busdaycal=calendar)
+    return np.where(ends < starts, 0, counts)
+
+
+def busday_offset(
+    dates,
+    days,
+    holidays: Iterable[datetime.date] = (),
+    weekdaysoff: Iterable[int] = (6, 7),
+) -> np.ndarray:
+    '''
+    Shift each date by a number of workdays, like
+    `BusinessCalendar(holidays, weekdaysoff).add_workdays(date, days)`
+    (Excel WORKDAY): the date itself is not counted and 0 days returns the
+    date unchanged, even if it's a day off. NaT stays NaT.
+
+    Args:
+        dates: array like of dates (`datetime64[D]` or ordinals).
+        days: int or array like of ints, broadcast with `dates`.
+        holidays: list of `datetime.date`, shared by every date.
+        weekdaysoff (set): ISO weekdays off, default is {6, 7}.
+
+    returns:
+        numpy.ndarray: `datetime64[D]` array of shifted dates.
+
+    ex.:
+        busday_offset(np.array(['2020-12-24'], dtype='datetime64[D]'), 1, {datetime.date(2020, 12, 25)})
+        array(['2020-12-28'], dtype='datetime64[D]')
+    '''
+    dates = as_datetime64(dates)
+    days = np.asarray(days)
+    calendar = busdaycalendar(holidays, weekdaysoff)
+    if calendar is None:
+        raise ValueError('there are no workdays, every weekday is off')
+
+    # a day off is first rolled to the workday the shift counts from: the
+    # one before going forward and the one after going backward
+    forward = np.busday_offset(dates, days, roll='backward', busdaycal=calendar)
+    backward = np.busday_offset(dates, days, roll='forward', busdaycal=calendar)
+    return np.where(days > 0, forward, np.where(days < 0, backward, dates))
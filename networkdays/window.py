@@ -0,0 +1,126 @@
+'''
+Rolling windows of business days.
+
+A `RollingWindow` keeps the last (or the next) N workdays from a date, like
+"the last 30 business days", in a `deque`. Moving the window forward only
+appends the workdays that come into it and drops those that leave, instead
+of listing the whole window again.
+
+ex.:
+    window = RollingWindow(datetime.date(2020, 12, 31), 30, calendar)
+    window.advance()  # the last 30 workdays up to 2021-01-01
+    window.first, window.last
+'''
+import datetime
+from collections import deque
+from typing import Deque, Iterator, List, Optional
+
+from networkdays.networkdays import BusinessCalendar
+
+
+class RollingWindow:
+    '''
+    The last `size` workdays up to `date` (inclusive), or with `ahead` the
+    next `size` workdays from `date` (inclusive).
+
+    Moving forward costs O(k), k the workdays that come into the window,
+    plus O(log H) per workday for `ahead` windows. Moving backward, or
+    more than `2 * size` days forward, lists the window again.
+
+    Args:
+        date (datetime.date): the current date of the window.
+        size (int): number of workdays in the window.
+        calendar (BusinessCalendar): holidays and weekdays off, default is
+            no holidays and Saturday and Sunday off.
+        ahead (bool): the next workdays from `date` instead of the last ones.
+    '''
+
+    def __init__(
+        self,
+        date: datetime.date,
+        size: int,
+        calendar: Optional[BusinessCalendar] = None,
+        ahead: bool = False,
+    ):
+        if size < 1:
+            raise ValueError(f'size must be at least 1, got {size}')
+
+        self.size: int = size
+        self.calendar: BusinessCalendar = calendar if calendar is not None else BusinessCalendar()
+        self.ahead: bool = ahead
+        self.date: datetime.date = date
+        self._workdays: Deque[datetime.date] = deque(maxlen=size)
+        self._build()
+
+    def _build(self) -> None:
+        calendar = self.calendar
+        self._workdays.clear()
+        if self.ahead:
+            date_start = calendar.add_workdays(self.date - datetime.timedelta(days=1), 1)
+            date_end = calendar.add_workdays(date_start, self.size - 1)
+        else:
+            date_end = self.date
+            # `date_end` is the first of the `size` workdays back, if a workday
+            days = 1 - self.size if calendar.is_workday(date_end) else -self.size
+            date_start = calendar.add_workdays(date_end, days)
+        self._workdays.extend(calendar.iter_workdays(date_start, date_end))
+
+    def move_to(self, date: datetime.date) -> None:
+        '''
+        Move the window to `date`, updating it with the workdays that come
+        in and go out.
+        '''
+        date_from, self.date = self.date, date
+        if date < date_from or (date - date_from).days > 2 * self.size:
+            # backward or far ahead, nothing to keep
+            self._build()
+            return
+
+        workdays = self._workdays
+        if not self.ahead:
+            # the deque length drops the oldest workdays
+            workdays.extend(self.calendar.iter_workdays(date_from + datetime.timedelta(days=1), date))
+            return
+
+        while workdays and workdays[0] < date:
+            workdays.popleft()
+        last_workday = workdays[-1] if workdays else date - datetime.timedelta(days=1)
+        while len(workdays) < self.size:
+            last_workday = self.calendar.add_workdays(last_workday, 1)
+            workdays.append(last_workday)
+
+    def advance(self, days: int = 1) -> None:
+        '''
+        Move the window `days` calendar days forward.
+        '''
+        self.move_to(self.date + datetime.timedelta(days=days))
+
+    @property
+    def first(self) -> datetime.date:
+        return self._workdays[0]
+
+    @property
+    def last(self) -> datetime.date:
+        return self._workdays[-1]
+
+    def workdays(self) -> List[datetime.date]:
+        return list(self._workdays)
+
+    def __len__(self) -> int:
+        return len(self._workdays)
+
+    def __iter__(self) -> Iterator[datetime.date]:
+        return iter(self._workdays)
+
+    def __contains__(self, date: object) -> bool:
+        '''
+        By the window bounds and `is_workday()`, the window has every
+        workday between its first and last.
+        '''
+        return (
+            isinstance(date, datetime.date) and bool(self._workdays) and
+            self._workdays[0] <= date <= self._workdays[-1] and self.calendar.is_workday(date)
+        )
+
+    def __repr__(self) -> str:
+        return f'RollingWindow({self.date!r}, {self.size}, ahead={self.ahead})'
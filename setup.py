@@ -19,6 +19,11 @@ setuptools.setup(
 
     url="https://github.com/cadu-leite/networkdays",
     packages=setuptools.find_packages(),
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+        'pyarrow': ['numpy', 'pyarrow'],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
 
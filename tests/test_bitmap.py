@@ -0,0 +1,61 @@
+import unittest
+import datetime
+
+from networkdays.bitmap import WorkdayBitmap
+from networkdays.networkdays import Networkdays
+
+
+HOLIDAYS_BR = {datetime.date(2020, 11, 2), datetime.date(2020, 11, 20)}
+HOLIDAYS_US = {datetime.date(2020, 11, 11), datetime.date(2020, 11, 26)}
+
+
+class TestClassWorkdayBitmap(unittest.TestCase):
+
+    def test_from_networkdays(self):
+        ndays = Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 12, 31), HOLIDAYS_BR)
+        bitmap = WorkdayBitmap.from_networkdays(ndays)
+
+        self.assertEqual(len(bitmap), 61)
+        self.assertEqual(len(bitmap.bits), 8)
+        self.assertEqual(bitmap.date_end, datetime.date(2020, 12, 31))
+        self.assertEqual(list(bitmap), ndays.networkdays())
+        self.assertEqual(bitmap.count(), ndays.count())
+        self.assertIn(datetime.date(2020, 11, 3), bitmap)
+        self.assertNotIn(datetime.date(2020, 11, 2), bitmap)  # holiday
+        self.assertNotIn(datetime.date(2021, 1, 4), bitmap)  # out of the bitmap
+
+    def test_count_slices(self):
+        ndays = Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 12, 31), HOLIDAYS_BR)
+        bitmap = WorkdayBitmap.from_networkdays(ndays)
+        for start_day in range(0, 61, 5):
+            for end_day in range(start_day - 1, 70, 3):
+                date_start = datetime.date(2020, 11, 1) + datetime.timedelta(days=start_day)
+                date_end = datetime.date(2020, 11, 1) + datetime.timedelta(days=end_day)
+                with self.subTest(date_start=date_start, date_end=date_end):
+                    expected = Networkdays(date_start, min(date_end, ndays.date_end), HOLIDAYS_BR).count()
+                    self.assertEqual(bitmap.count(date_start, date_end), expected)
+
+    def test_and_or(self):
+        sao_paulo = WorkdayBitmap.from_networkdays(
+            Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 11, 30), HOLIDAYS_BR))
+        new_york = WorkdayBitmap.from_networkdays(
+            Networkdays(datetime.date(2020, 11, 10), datetime.date(2020, 12, 15), HOLIDAYS_US))
+
+        both = sao_paulo & new_york
+        self.assertEqual(both.date_start, datetime.date(2020, 11, 10))
+        self.assertEqual(both.date_end, datetime.date(2020, 11, 30))
+        self.assertEqual(
+            list(both),
+            Networkdays(datetime.date(2020, 11, 10), datetime.date(2020, 11, 30), HOLIDAYS_BR | HOLIDAYS_US).networkdays()
+        )
+
+        any_open = sao_paulo | new_york
+        self.assertEqual(any_open.date_start, datetime.date(2020, 11, 1))
+        self.assertEqual(any_open.date_end, datetime.date(2020, 12, 15))
+        self.assertEqual(list(any_open), sorted(set(sao_paulo) | set(new_york)))
+
+    def test_and_no_overlap(self):
+        november = WorkdayBitmap.from_networkdays(Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 11, 30)))
+        january = WorkdayBitmap.from_networkdays(Networkdays(datetime.date(2021, 1, 1), datetime.date(2021, 1, 31)))
+        self.assertEqual((november & january).count(), 0)
+        self.assertEqual(len(november & january), 0)
@@ -0,0 +1,246 @@
+import unittest
+import datetime
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from networkdays.networkdays import BusinessCalendar, JobSchedule, Networkdays
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2020, 12, 26),  # saturday
+    datetime.date(2021, 1, 1),
+    datetime.date(2030, 1, 1),
+}
+
+
+class TestClassBusinessCalendar(unittest.TestCase):
+
+    def test_count(self):
+        '''
+        indexed and not indexed calendars, same as `Networkdays.networkdays()`
+        '''
+        ranges = [
+            (datetime.date(2020, 12, 1), datetime.date(2020, 12, 31)),
+            (datetime.date(2020, 12, 25), datetime.date(2020, 12, 25)),
+            (datetime.date(2019, 12, 15), datetime.date(2020, 1, 15)),  # starts before the index
+            (datetime.date(2021, 12, 15), datetime.date(2031, 1, 15)),  # ends after the index
+            (datetime.date(2020, 12, 31), datetime.date(2020, 12, 1)),
+        ]
+        for weekdaysoff in ({6, 7}, {3}, set()):
+            calendars = [
+                BusinessCalendar(HOLIDAYS, weekdaysoff),
+                BusinessCalendar(HOLIDAYS, weekdaysoff, 2020, 2021),
+            ]
+            for calendar in calendars:
+                for date_start, date_end in ranges:
+                    with self.subTest(weekdaysoff=weekdaysoff, year_start=calendar.year_start, date_start=date_start):
+                        workdays = Networkdays(date_start, date_end, HOLIDAYS, weekdaysoff).networkdays()
+                        self.assertEqual(calendar.count(date_start, date_end), len(workdays))
+                        self.assertEqual(calendar.workdays(date_start, date_end), workdays)
+
+    def test_is_workday(self):
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2020)
+        self.assertTrue(calendar.is_workday(datetime.date(2020, 12, 24)))
+        self.assertFalse(calendar.is_workday(datetime.date(2020, 12, 25)))  # holiday
+        self.assertFalse(calendar.is_workday(datetime.date(2020, 12, 27)))  # sunday
+        self.assertFalse(calendar.is_workday(datetime.date(2021, 1, 1)))  # out of the index
+        self.assertTrue(calendar.is_workday(datetime.date(2021, 1, 4)))
+
+    def test_year_span_params(self):
+        with self.assertRaises(ValueError):
+            BusinessCalendar(HOLIDAYS, {6, 7}, 2020)
+        with self.assertRaises(ValueError):
+            BusinessCalendar(HOLIDAYS, {6, 7}, 2021, 2020)
+
+    def test_networkdays_with_calendar(self):
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2021)
+        ndays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31), calendar=calendar)
+        self.assertEqual(ndays.count(), 22)
+        self.assertEqual(len(ndays.networkdays()), 22)
+        self.assertEqual(ndays.holidays(), [datetime.date(2020, 12, 25), datetime.date(2020, 12, 26)])
+
+    def test_holidays(self):
+        '''
+        sorted holidays in a range, weekdays off included, same as a scan
+        '''
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7})
+        ranges = [
+            (datetime.date(2020, 12, 25), datetime.date(2021, 1, 1)),
+            (datetime.date(2020, 12, 26), datetime.date(2020, 12, 31)),
+            (datetime.date(2020, 1, 1), datetime.date(2040, 1, 1)),
+            (datetime.date(2021, 1, 2), datetime.date(2029, 12, 31)),
+            (datetime.date(2021, 1, 1), datetime.date(2020, 12, 25)),
+        ]
+        for date_start, date_end in ranges:
+            with self.subTest(date_start=date_start, date_end=date_end):
+                holidays = sorted(d for d in HOLIDAYS if date_start <= d <= date_end)
+                self.assertEqual(calendar.holidays(date_start, date_end), holidays)
+                self.assertEqual(calendar.holidays_count(date_start, date_end), len(holidays))
+
+    def test_nth_workdays(self):
+        '''
+        n-th workday of every period, same as indexing the workdays of each period
+        '''
+        date_start, date_end = datetime.date(2020, 11, 15), datetime.date(2021, 2, 3)
+        periods = {
+            'month': [(datetime.date(2020, m, 1), datetime.date(2020 + m // 12, m % 12 + 1, 1)) for m in (11, 12)] +
+                     [(datetime.date(2021, 1, 1), datetime.date(2021, 2, 1)),
+                      (datetime.date(2021, 2, 1), datetime.date(2021, 3, 1))],
+            'quarter': [(datetime.date(2020, 10, 1), datetime.date(2021, 1, 1)),
+                        (datetime.date(2021, 1, 1), datetime.date(2021, 4, 1))],
+            'week': [(datetime.date(2020, 11, 9) + datetime.timedelta(weeks=w),
+                      datetime.date(2020, 11, 16) + datetime.timedelta(weeks=w)) for w in range(13)],
+        }
+        for weekdaysoff in ({6, 7}, {1, 2, 3, 4}, set(range(1, 8))):
+            calendar = BusinessCalendar(HOLIDAYS, weekdaysoff)
+            for period, bounds in periods.items():
+                for n in (1, 2, -1, -3):
+                    with self.subTest(weekdaysoff=weekdaysoff, period=period, n=n):
+                        expected = []
+                        for first, end in bounds:
+                            workdays = calendar.workdays(first, end - datetime.timedelta(days=1))
+                            expected.append(workdays[n if n < 0 else n - 1] if abs(n) <= len(workdays) else None)
+                        self.assertEqual(calendar.nth_workdays(date_start, date_end, period, n), expected)
+                        self.assertEqual(
+                            list(calendar.nth_workdays(date_start, date_end, period, n, 'array')),
+                            [0 if d is None else d.toordinal() for d in expected]
+                        )
+
+        ndays = Networkdays(date_start, date_end, HOLIDAYS)
+        self.assertEqual(ndays.nth_workdays('month'), [
+            datetime.date(2020, 11, 30),
+            datetime.date(2020, 12, 31),
+            datetime.date(2021, 1, 29),
+            datetime.date(2021, 2, 26),
+        ])
+        self.assertEqual(ndays.nth_workdays('quarter', 1), [datetime.date(2020, 10, 1), datetime.date(2021, 1, 4)])
+
+    def test_nth_workdays_bounds(self):
+        calendar = BusinessCalendar(HOLIDAYS)
+        self.assertEqual(calendar.nth_workdays(datetime.date.max, datetime.date.max), [datetime.date(9999, 12, 31)])
+        self.assertEqual(calendar.nth_workdays(datetime.date.min, datetime.date.min, 'week', 1), [datetime.date.min])
+        self.assertEqual(calendar.nth_workdays(datetime.date.max, datetime.date.max, 'week'), [datetime.date.max])
+        self.assertEqual(calendar.nth_workdays(datetime.date.max, datetime.date.max, 'quarter', 1), [datetime.date(9999, 10, 1)])
+        with self.assertRaises(ValueError):
+            calendar.nth_workdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31), 'year')
+        with self.assertRaises(ValueError):
+            calendar.nth_workdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31), n=0)
+        with self.assertRaises(ValueError):
+            calendar.nth_workdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31), output='dict')
+
+    def test_immutable_value(self):
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2021)
+        with self.assertRaises(AttributeError):
+            calendar.weekdaysoff = frozenset({7})
+        with self.assertRaises(AttributeError):
+            calendar.year_start = 2000
+        with self.assertRaises(AttributeError):
+            del calendar.holidays_set
+        with self.assertRaises(AttributeError):
+            calendar.other = 1  # __slots__, no new attributes
+        self.assertEqual(calendar.weekdaysoff, {6, 7})
+
+        # same holidays and weekdays off, equal whatever the index
+        self.assertEqual(calendar, BusinessCalendar(list(HOLIDAYS), (7, 6)))
+        self.assertEqual(hash(calendar), hash(BusinessCalendar(list(HOLIDAYS), (7, 6))))
+        self.assertNotEqual(calendar, BusinessCalendar(HOLIDAYS, {7}))
+        self.assertEqual({calendar: 'br'}[BusinessCalendar(HOLIDAYS)], 'br')
+        self.assertEqual(pickle.loads(pickle.dumps(calendar)), calendar)
+
+    def test_shared_by_threads(self):
+        calendar = BusinessCalendar(HOLIDAYS)
+        ranges = [
+            (datetime.date(2020, 1, 1) + datetime.timedelta(days=days), datetime.date(2021, 6, 30))
+            for days in range(0, 500, 7)
+        ]
+        with ThreadPoolExecutor(8) as pool:
+            counts = list(pool.map(lambda dates: calendar.count(*dates), ranges))
+        self.assertEqual(counts, [len(calendar.workdays(*dates)) for dates in ranges])
+
+    def test_networkdays_no_side_effects(self):
+        ndays = Networkdays(datetime.date(2020, 12, 1))
+        ndays.networkdays()
+        self.assertIsNone(ndays.date_end)
+
+        # frozen on first use, not copied by the constructor
+        holidays = set(HOLIDAYS)
+        ndays = Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 12, 31), holidays=holidays)
+        self.assertEqual(ndays.holidays_set, HOLIDAYS)
+        holidays.add(datetime.date(2020, 12, 2))
+        self.assertEqual(ndays.holidays_set, HOLIDAYS)
+        self.assertEqual(ndays.count(), 43)
+        self.assertIsInstance(Networkdays(datetime.date(2020, 12, 1)).holidays_set, frozenset)
+
+    def test_networkdays_short_ranges_without_calendar(self):
+        for weekdaysoff in ({6, 7}, {7}, {1, 3, 5}):
+            for days in (0, 1, 6, 30, 61, 62, 100):
+                date_start = datetime.date(2020, 12, 1)
+                date_end = date_start + datetime.timedelta(days=days)
+                calendar = BusinessCalendar(HOLIDAYS, weekdaysoff)
+                with self.subTest(weekdaysoff=weekdaysoff, days=days):
+                    ndays = Networkdays(date_start, date_end, list(HOLIDAYS), weekdaysoff)
+                    self.assertEqual(ndays.count(), calendar.count(date_start, date_end))
+                    self.assertEqual(ndays.networkdays(), calendar.workdays(date_start, date_end))
+                    self.assertEqual(ndays._calendar is None, days < 62)
+
+    def test_networkdays_calendar_compiled_on_demand(self):
+        ndays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31), HOLIDAYS)
+        self.assertIsNone(ndays._calendar)
+        self.assertEqual(ndays.last_workday_of_month(2020, 12), datetime.date(2020, 12, 31))
+        self.assertIsNone(ndays._calendar)
+
+        self.assertEqual(ndays.count(), 22)
+        self.assertEqual(ndays.calendar, BusinessCalendar(HOLIDAYS))
+        other = Networkdays(datetime.date(2021, 1, 1), holidays=set(HOLIDAYS))
+        self.assertIs(other.calendar, ndays.calendar)
+        self.assertIsNot(Networkdays(datetime.date(2021, 1, 1), weekdaysoff={7}).calendar, ndays.calendar)
+
+    def test_jobschedule_with_calendar(self):
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2021)
+        jobschedule = JobSchedule(16, 8, datetime.date(2020, 12, 23), calendar=calendar)
+        self.assertEqual(jobschedule.jobdays, [datetime.date(2020, 12, 23), datetime.date(2020, 12, 24)])
+        self.assertIs(jobschedule.networkdays.calendar, calendar)
+
+    def test_add_workdays(self):
+        '''
+        December 2020
+        Mo Tu We Th Fr Sa Su
+            1  2  3  4  5  6
+         7  8  9 10 11 12 13
+        14 15 16 17 18 19 20
+        21 22 23 24 25 26 27
+        28 29 30 31
+        '''
+        cases = [
+            (datetime.date(2020, 12, 24), 1, datetime.date(2020, 12, 28)),
+            (datetime.date(2020, 12, 24), 0, datetime.date(2020, 12, 24)),
+            (datetime.date(2020, 12, 26), 0, datetime.date(2020, 12, 26)),
+            (datetime.date(2020, 12, 26), 1, datetime.date(2020, 12, 28)),
+            (datetime.date(2020, 12, 26), -1, datetime.date(2020, 12, 24)),
+            (datetime.date(2020, 12, 28), -1, datetime.date(2020, 12, 24)),
+            (datetime.date(2020, 12, 31), 1, datetime.date(2021, 1, 4)),
+            (datetime.date(2020, 12, 1), 22, datetime.date(2021, 1, 4)),
+            (datetime.date(2021, 1, 4), -22, datetime.date(2020, 12, 1)),
+        ]
+        calendars = [
+            BusinessCalendar(HOLIDAYS),
+            BusinessCalendar(HOLIDAYS, year_start=2020, year_end=2020),
+        ]
+        for calendar in calendars:
+            for date, days, expected in cases:
+                with self.subTest(year_start=calendar.year_start, date=date, days=days):
+                    self.assertEqual(calendar.add_workdays(date, days), expected)
+
+    def test_add_workdays_long_shift(self):
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7})
+        date_start = datetime.date(2020, 1, 1)
+        date = calendar.add_workdays(date_start, 5000)
+        self.assertEqual(calendar.count(date_start + datetime.timedelta(days=1), date), 5000)
+        self.assertTrue(calendar.is_workday(date))
+        self.assertEqual(calendar.add_workdays(date, -5000), date_start)
+
+    def test_add_workdays_no_workdays(self):
+        calendar = BusinessCalendar(weekdaysoff={1, 2, 3, 4, 5, 6, 7})
+        with self.assertRaises(ValueError):
+            calendar.add_workdays(datetime.date(2020, 1, 1), 1)
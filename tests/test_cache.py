@@ -0,0 +1,62 @@
+import unittest
+import datetime
+
+from networkdays.cache import ResultCache
+from networkdays.networkdays import Networkdays
+
+
+class TestClassResultCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        self.assertEqual(cache.get('a', lambda: 1), 1)
+        self.assertEqual(cache.get('b', lambda: 2), 2)
+        self.assertEqual(cache.get('a', lambda: None), 1)  # hit, 'a' is the most recent now
+        self.assertEqual(cache.get('c', lambda: 3), 3)  # evicts 'b'
+        self.assertEqual(cache.get('b', lambda: 4), 4)  # miss, evicts 'a'
+
+        self.assertEqual(cache.stats(), {
+            'hits': 1,
+            'misses': 4,
+            'evictions': 2,
+            'size': 2,
+            'maxsize': 2,
+            'hit_rate': 0.2,
+        })
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_maxsize(self):
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+
+        cache = ResultCache(maxsize=None)
+        for key in range(5000):
+            cache.get(key, lambda: key)
+        self.assertEqual(len(cache), 5000)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_networkdays_cache(self):
+        cache = ResultCache()
+        date_start = datetime.date(2020, 12, 1)
+        date_end = datetime.date(2020, 12, 31)
+
+        # equal holidays and weekdaysoff, but different objects, share results
+        ndays_1 = Networkdays(date_start, date_end, {datetime.date(2020, 12, 25)}, {6, 7}, cache=cache)
+        ndays_2 = Networkdays(date_start, date_end, [datetime.date(2020, 12, 25)], [7, 6], cache=cache)
+        workdays = ndays_1.networkdays()
+        self.assertEqual(ndays_2.networkdays(), workdays)
+        self.assertEqual(ndays_2.weekends(), ndays_1.weekends())
+        self.assertEqual(ndays_2.holidays(), [datetime.date(2020, 12, 25)])
+        self.assertEqual(cache.stats()['misses'], 3)
+        self.assertEqual(cache.stats()['hits'], 2)
+
+        # returned lists are copies
+        workdays.clear()
+        self.assertEqual(len(ndays_1.networkdays()), 22)
+
+        # other holidays, other results
+        ndays_3 = Networkdays(date_start, date_end, cache=cache)
+        self.assertEqual(len(ndays_3.networkdays()), 23)
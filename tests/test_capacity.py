@@ -0,0 +1,151 @@
+import unittest
+import datetime
+
+from networkdays import instrumentation
+from networkdays.capacity import Finish, WorkCapacity
+from networkdays.networkdays import BusinessCalendar, JobSchedule, Networkdays
+from networkdays.rules import FixedDate, HolidayRules
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2020, 12, 26),  # saturday
+    datetime.date(2021, 1, 1),
+}
+
+SHIFTS = {1: 8, 2: 8, 3: 8, 4: 8, 5: 4}
+
+OVERRIDES = {
+    datetime.date(2020, 12, 24): 4,  # half day
+    datetime.date(2020, 12, 31): 4,  # half day
+    datetime.date(2021, 1, 9): 6,  # worked saturday
+}
+
+
+class TestClassWorkCapacity(unittest.TestCase):
+
+    def setUp(self):
+        self.capacity = WorkCapacity(SHIFTS, OVERRIDES, BusinessCalendar(HOLIDAYS))
+
+    def day_by_day(self, date_start, hours):
+        date = date_start
+        while True:
+            day_hours = self.capacity.hours(date)
+            if hours <= day_hours and day_hours:
+                return Finish(date, hours)
+            hours -= day_hours
+            date += datetime.timedelta(days=1)
+
+    def test_hours(self):
+        self.assertEqual(self.capacity.hours(datetime.date(2020, 12, 21)), 8)
+        self.assertEqual(self.capacity.hours(datetime.date(2020, 12, 18)), 4)  # friday
+        self.assertEqual(self.capacity.hours(datetime.date(2020, 12, 24)), 4)  # override
+        self.assertEqual(self.capacity.hours(datetime.date(2020, 12, 25)), 0)  # holiday
+        self.assertEqual(self.capacity.hours(datetime.date(2020, 12, 27)), 0)  # sunday
+        self.assertEqual(self.capacity.hours(datetime.date(2021, 1, 9)), 6)  # worked saturday
+
+    def test_total(self):
+        '''
+        December 2020
+        Mo Tu We Th Fr Sa Su
+         .. 21 22 23 24 25 26 27
+         28 29 30 31
+        '''
+        self.assertEqual(self.capacity.total(datetime.date(2020, 12, 21), datetime.date(2020, 12, 27)), 28)
+        self.assertEqual(self.capacity.total(datetime.date(2020, 12, 28), datetime.date(2020, 12, 31)), 28)
+        self.assertEqual(self.capacity.total(datetime.date(2020, 12, 31), datetime.date(2020, 12, 28)), 0)
+        date_start, date_end = datetime.date(2020, 11, 1), datetime.date(2021, 2, 28)
+        self.assertEqual(
+            self.capacity.total(date_start, date_end),
+            sum(self.capacity.hours(date) for date in Networkdays(date_start, date_end, weekdaysoff=set()).networkdays())
+        )
+
+    def test_finish(self):
+        self.assertEqual(
+            self.capacity.finish(datetime.date(2020, 12, 21), 30),
+            Finish(datetime.date(2020, 12, 28), 2)
+        )
+        # starts on a day off
+        self.assertEqual(
+            self.capacity.finish(datetime.date(2020, 12, 25), 8),
+            Finish(datetime.date(2020, 12, 28), 8)
+        )
+        for days in range(0, 40, 3):
+            date_start = datetime.date(2020, 12, 1) + datetime.timedelta(days=days)
+            for hours in (0.5, 4, 8, 12, 36, 100, 1000, 10000):
+                with self.subTest(date_start=date_start, hours=hours):
+                    self.assertEqual(self.capacity.finish(date_start, hours), self.day_by_day(date_start, hours))
+
+    def test_finish_errors(self):
+        with self.assertRaises(ValueError):
+            self.capacity.finish(datetime.date(2020, 12, 21), 0)
+        with self.assertRaises(ValueError):
+            WorkCapacity({}).finish(datetime.date(2020, 12, 21), 8)
+        with self.assertRaises(ValueError):
+            WorkCapacity({8: 8})
+        with self.assertRaises(ValueError):
+            WorkCapacity(SHIFTS, calendar=BusinessCalendar(HolidayRules([FixedDate(12, 25)])))
+
+    def test_default_calendar(self):
+        capacity = WorkCapacity({6: 5, 7: 5})
+        self.assertEqual(capacity.calendar.weekdaysoff, {1, 2, 3, 4, 5})
+        self.assertEqual(capacity.finish(datetime.date(2020, 12, 21), 12), Finish(datetime.date(2021, 1, 2), 2))
+
+    def test_holiday_rules(self):
+        calendar = BusinessCalendar(HolidayRules([FixedDate(12, 25)]), year_start=2020, year_end=2021)
+        capacity = WorkCapacity(SHIFTS, calendar=calendar)
+        self.assertEqual(capacity.hours(datetime.date(2020, 12, 25)), 0)
+        self.assertEqual(capacity.finish(datetime.date(2020, 12, 24), 12), Finish(datetime.date(2020, 12, 28), 4))
+
+        # out of the calendar years the rules holidays are not known
+        christmas = datetime.date(2023, 12, 25)
+        self.assertFalse(calendar.is_workday(christmas))
+        with self.assertRaises(ValueError):
+            capacity.hours(christmas)
+        with self.assertRaises(ValueError):
+            capacity.total(datetime.date(2021, 12, 1), christmas)
+        with self.assertRaises(ValueError):
+            capacity.finish(christmas, 16)
+        with self.assertRaises(ValueError):
+            capacity.finish(datetime.date(2021, 12, 27), 80)
+        with self.assertRaises(ValueError):
+            JobSchedule(16, 8, christmas, capacity=capacity)
+
+    def test_jobschedule(self):
+        jobschedule = JobSchedule(30, 8, datetime.date(2020, 12, 21), capacity=self.capacity)
+        self.assertEqual(jobschedule.jobdays, [
+            datetime.date(2020, 12, 21),
+            datetime.date(2020, 12, 22),
+            datetime.date(2020, 12, 23),
+            datetime.date(2020, 12, 24),
+            datetime.date(2020, 12, 28),
+        ])
+        self.assertEqual(jobschedule.last_day_hours, 2)
+        self.assertIs(jobschedule.calendar, self.capacity.calendar)
+
+        # bounded by the networkdays
+        networkdays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 26), HOLIDAYS)
+        jobschedule = JobSchedule(30, 8, datetime.date(2020, 12, 21), networkdays, capacity=self.capacity)
+        self.assertEqual(jobschedule.jobdays[-1], datetime.date(2020, 12, 24))
+        self.assertEqual(jobschedule.last_day_hours, 4)
+
+    def test_jobschedule_without_workhours_per_day(self):
+        '''
+        `workhours_per_day` is not used with a capacity, not even instrumented
+        '''
+        instrumentation.enable()
+        try:
+            jobschedule = JobSchedule(30, 0, datetime.date(2020, 12, 21), capacity=self.capacity)
+            self.assertEqual(jobschedule.jobdays[-1], datetime.date(2020, 12, 28))
+            self.assertEqual(JobSchedule(0, 0, datetime.date(2020, 12, 21), capacity=self.capacity).jobdays, [])
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+
+    def test_jobschedule_last_day_hours(self):
+        self.assertEqual(JobSchedule(20, 8, datetime.date(2020, 12, 21)).last_day_hours, 4)
+        self.assertEqual(JobSchedule(16, 8, datetime.date(2020, 12, 21)).last_day_hours, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
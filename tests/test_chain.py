@@ -0,0 +1,96 @@
+import unittest
+import datetime
+
+from networkdays.chain import JobChain
+from networkdays.networkdays import BusinessCalendar, JobSchedule, JobSpan
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2021, 1, 1),
+}
+
+JOBS = [(16, 8), (40, 8), (0, 8), (4, 8), (100, 6), (8, 8)]
+
+
+class TestClassJobChain(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(HOLIDAYS)
+
+    def by_hand(self, date_start, jobs):
+        '''
+        one JobSchedule per job, the next start date fed in by hand
+        '''
+        spans = []
+        for hours, workhours_per_day in jobs:
+            jobschedule = JobSchedule(hours, workhours_per_day, date_start, calendar=self.calendar)
+            if jobschedule.jobdays:
+                spans.append(JobSpan(jobschedule.jobdays[0], jobschedule.jobdays[-1], jobschedule.bussines_days))
+                date_start = jobschedule.jobdays[-1] + datetime.timedelta(days=1)
+            else:
+                spans.append(JobSpan(None, None, 0))
+        return spans
+
+    def test_windows(self):
+        '''
+        December 2020
+        Mo Tu We Th Fr Sa Su
+         21 22 23 24 25 26 27
+         28 29 30 31
+        '''
+        chain = JobChain(datetime.date(2020, 12, 19), JOBS, self.calendar)
+        windows = chain.windows()
+        self.assertEqual(windows[0], JobSpan(datetime.date(2020, 12, 21), datetime.date(2020, 12, 22), 2))
+        self.assertEqual(windows[1], JobSpan(datetime.date(2020, 12, 23), datetime.date(2020, 12, 30), 5))
+        self.assertEqual(windows[2], JobSpan(None, None, 0))
+        self.assertEqual(windows[3], JobSpan(datetime.date(2020, 12, 31), datetime.date(2020, 12, 31), 1))
+        self.assertEqual(windows, self.by_hand(datetime.date(2020, 12, 19), JOBS))
+        self.assertEqual(list(chain), windows)
+        self.assertEqual(chain[-1], windows[-1])
+        self.assertEqual(chain.date_end(), windows[-1].date_end)
+        self.assertEqual(len(chain), len(JOBS))
+
+    def test_changes(self):
+        jobs = list(JOBS)
+        chain = JobChain(datetime.date(2020, 12, 19), jobs, self.calendar)
+        chain.windows()
+
+        changes = [
+            lambda: (chain.insert(2, (24, 8)), jobs.insert(2, (24, 8))),
+            lambda: (chain.insert(0, (1, 8)), jobs.insert(0, (1, 8))),
+            lambda: (chain.insert(100, (9, 8)), jobs.insert(100, (9, 8))),
+            lambda: (chain.insert(-1, (9, 8)), jobs.insert(-1, (9, 8))),
+            lambda: (chain.pop(3), jobs.pop(3)),
+            lambda: (chain.pop(), jobs.pop()),
+            lambda: (chain.append((80, 8)), jobs.append((80, 8))),
+            lambda: chain.__setitem__(1, (200, 8)) or jobs.__setitem__(1, (200, 8)),
+        ]
+        for change in changes:
+            change()
+            with self.subTest(jobs=jobs):
+                self.assertEqual(chain.windows(), self.by_hand(datetime.date(2020, 12, 19), jobs))
+
+    def test_only_later_jobs_recomputed(self):
+        chain = JobChain(datetime.date(2020, 12, 19), JOBS, self.calendar)
+        first = chain.windows()
+        chain.insert(4, (8, 8))
+        self.assertEqual(chain._valid, 4)
+        self.assertEqual(chain.windows()[:4], first[:4])
+        self.assertEqual(chain.windows()[5], JobSpan(datetime.date(2021, 1, 5), datetime.date(2021, 1, 27), 17))
+
+    def test_empty(self):
+        chain = JobChain(datetime.date(2020, 12, 19))
+        self.assertEqual(chain.windows(), [])
+        self.assertIsNone(chain.date_end())
+
+    def test_jobschedule(self):
+        chain = JobChain(datetime.date(2020, 12, 19), JOBS, self.calendar)
+        jobschedule = chain.jobschedule(1)
+        self.assertEqual(jobschedule.jobdays[0], datetime.date(2020, 12, 23))
+        self.assertEqual(jobschedule.jobdays[-1], datetime.date(2020, 12, 30))
+        self.assertEqual(jobschedule.bussines_days, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
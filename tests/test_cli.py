@@ -1,6 +1,12 @@
 import unittest
+import json
+import os
 import subprocess
 import sys
+import tempfile
+
+from networkdays.__main__ import read_calendar
+
 
 class TestCommandLineInterface(unittest.TestCase):
     """
@@ -127,3 +133,130 @@ class TestCommandLineInterface(unittest.TestCase):
                     'optional arguments:' in stdout or 'options:' in stdout,
                     "Help message should contain a header for optional arguments or options"
                 )
+
+
+class TestCommandLineInterfaceBatch(unittest.TestCase):
+    """
+    Tests for the batch mode, rows from stdin and one result row per input row.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.holidays = os.path.join(self.tmpdir.name, 'holidays.txt')
+        with open(self.holidays, 'w') as holidays_file:
+            holidays_file.write('# christmas\n2020-12-25\n\n')
+        self.calendar = os.path.join(self.tmpdir.name, 'sundays.json')
+        with open(self.calendar, 'w') as calendar_file:
+            json.dump({'holidays': ['2020-12-25'], 'weekdaysoff': [7]}, calendar_file)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_cli(self, args, stdin):
+        process = subprocess.run(
+            [sys.executable, '-m', 'networkdays', 'batch', *args],
+            input=stdin,
+            capture_output=True,
+            text=True
+        )
+        return process.stdout, process.stderr, process.returncode
+
+    def test_batch_csv(self):
+        stdin = (
+            '2024-03-01,2024-03-10\n'
+            '2024-02,2024-03\n'
+            '2020-12-01,2020-12-31\n'
+            '2020-12-01,2020-12-31,sundays\n'
+        )
+        stdout, stderr, exit_code = self.run_cli(
+            ['--holidays', self.holidays, '--calendar', f'sundays={self.calendar}'], stdin)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stderr, '')
+        self.assertEqual(stdout, (
+            '2024-03-01,2024-03-10,6\n'
+            '2024-02,2024-03,22\n'
+            '2020-12-01,2020-12-31,22\n'
+            '2020-12-01,2020-12-31,26\n'
+        ))
+
+    def test_invalid_calendar_files(self):
+        calendars = [
+            ([], 'must be a JSON object'),
+            ({'holidays': [20201225]}, 'holidays must be a list of ISO dates'),
+            ({'holidays': '2020-12-25'}, 'holidays must be a list of ISO dates'),
+            ({'weekdaysoff': '6,7'}, 'weekdaysoff must be a list of ISO weekdays'),
+            ({'weekdaysoff': [0, 6]}, 'weekdaysoff must be a list of ISO weekdays'),
+            ({'weekdaysoff': [True]}, 'weekdaysoff must be a list of ISO weekdays'),
+        ]
+        for data, error in calendars:
+            with self.subTest(data=data):
+                with open(self.calendar, 'w') as calendar_file:
+                    json.dump(data, calendar_file)
+                with self.assertRaisesRegex(ValueError, error):
+                    read_calendar(self.calendar)
+
+        with open(self.calendar, 'w') as calendar_file:
+            json.dump({'holidays': ['2020-12-32']}, calendar_file)
+        with self.assertRaisesRegex(ValueError, 'cant convert date'):
+            read_calendar(self.calendar)
+
+        stdout, stderr, exit_code = self.run_cli(['--calendar', f'sundays={self.calendar}'], '2020-12-01,2020-12-31\n')
+        self.assertEqual(exit_code, 1)
+        self.assertIn('cant convert date', stderr)
+
+    def test_batch_csv_header_and_list(self):
+        stdin = 'start,end\n2024-03-01,2024-03-05\n'
+        stdout, stderr, exit_code = self.run_cli(['--header', '--output', 'list', '--weekdaysoff', '5,6,7'], stdin)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stdout, 'start,end,list\n2024-03-01,2024-03-05,2024-03-04 2024-03-05\n')
+
+    def test_batch_ndjson(self):
+        stdin = (
+            '{"start": "2020-12-24", "end": "2020-12-28"}\n'
+            '\n'
+            '{"start": "2020-12-24", "end": "2020-12-28", "calendar": "sundays"}\n'
+        )
+        stdout, stderr, exit_code = self.run_cli(
+            ['--format', 'ndjson', '--holidays', self.holidays, '--calendar', f'sundays={self.calendar}'], stdin)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(
+            [json.loads(line) for line in stdout.splitlines()],
+            [
+                {'start': '2020-12-24', 'end': '2020-12-28', 'count': 2},
+                {'start': '2020-12-24', 'end': '2020-12-28', 'count': 3},
+            ]
+        )
+
+    def test_batch_ndjson_invalid_fields(self):
+        stdin = (
+            '{"start": 2020, "end": "2020-12-28"}\n'
+            '{"start": "2020-12-24", "end": "2020-12-28", "calendar": [1]}\n'
+            '{"start": "2020-12-24", "end": "2020-12-28"}\n'
+        )
+        stdout, stderr, exit_code = self.run_cli(['--format', 'ndjson', '--holidays', self.holidays], stdin)
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(json.loads(stdout.splitlines()[-1]), {'start': '2020-12-24', 'end': '2020-12-28', 'count': 2})
+        self.assertEqual(stderr, (
+            'line 1: Error: start, end and calendar must be strings\n'
+            'line 2: Error: start, end and calendar must be strings\n'
+        ))
+
+    def test_batch_invalid_rows(self):
+        stdin = 'bad,2024-01-01\n2024-03-01,2024-03-10,nocalendar\n2024-03-01,2024-03-10\n'
+        stdout, stderr, exit_code = self.run_cli([], stdin)
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(stdout, 'bad,2024-01-01,\n2024-03-01,2024-03-10,\n2024-03-01,2024-03-10,6\n')
+        self.assertEqual(stderr, (
+            'line 1: Error: cant convert date "bad"\n'
+            'line 2: Error: unknown calendar "nocalendar"\n'
+        ))
+
+    def test_batch_invalid_calendar(self):
+        stdout, stderr, exit_code = self.run_cli(['--weekdaysoff', '8'], '')
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(stderr, 'Error: cant convert weekdays "8"\n')
@@ -0,0 +1,138 @@
+import unittest
+import datetime
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is an optional dependency
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is an optional dependency
+    pa = None
+
+from networkdays.networkdays import BusinessCalendar
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2021, 1, 1),
+}
+
+STARTS = ['2020-12-01', '2020-12-24', '2020-12-26', None]
+ENDS = ['2020-12-31', '2020-12-28', '2020-12-20', '2020-12-31']
+
+
+@unittest.skipIf(np is None or pd is None, 'numpy or pandas is not installed')
+class TestColumnarPandas(unittest.TestCase):
+
+    def setUp(self):
+        from networkdays import columnar
+        self.columnar = columnar
+        self.calendar = BusinessCalendar(HOLIDAYS)
+
+    def test_count_series(self):
+        starts = pd.Series(pd.to_datetime(STARTS), index=[10, 11, 12, 13], name='opened')
+        ends = pd.Series(pd.to_datetime(ENDS), index=[10, 11, 12, 13])
+        counts = self.columnar.count(starts, ends, HOLIDAYS)
+        self.assertEqual(list(counts.index), [10, 11, 12, 13])
+        self.assertEqual(counts.name, 'opened')
+        self.assertEqual(str(counts.dtype), 'Int64')
+        self.assertEqual(counts.tolist()[:3], [22, 2, 0])
+        self.assertIs(counts[13], pd.NA)
+
+        counts = self.columnar.count(starts[:3], ends[:3], HOLIDAYS)
+        self.assertEqual(counts.dtype, np.int64)
+        self.assertEqual(counts.tolist(), [22, 2, 0])
+
+    def test_add_workdays_series(self):
+        dates = pd.Series(pd.to_datetime(STARTS), name='opened')
+        for days in (-3, -1, 0, 1, 5):
+            with self.subTest(days=days):
+                shifted = self.columnar.add_workdays(dates, days, HOLIDAYS)
+                self.assertEqual(shifted.dtype, dates.dtype)
+                self.assertEqual(shifted.name, 'opened')
+                self.assertEqual(
+                    [d.date() for d in shifted[:3]],
+                    [self.calendar.add_workdays(datetime.date.fromisoformat(d), days) for d in STARTS[:3]]
+                )
+                self.assertTrue(pd.isna(shifted[3]))
+
+        shifted = self.columnar.add_workdays(dates[:2], pd.Series([1, -1]), HOLIDAYS)
+        self.assertEqual(shifted.tolist(), [pd.Timestamp(2020, 12, 2), pd.Timestamp(2020, 12, 23)])
+
+        shifted = self.columnar.add_workdays(dates[:2], pd.Series([1, None], dtype='Int64'), HOLIDAYS)
+        self.assertEqual(shifted[0], pd.Timestamp(2020, 12, 2))
+        self.assertTrue(pd.isna(shifted[1]))
+
+    def test_datetime_index_with_time_zone(self):
+        dates = pd.DatetimeIndex(['2020-12-24 22:00', '2020-12-31 23:30'], tz='America/Sao_Paulo', name='at')
+        shifted = self.columnar.add_workdays(dates, 1, HOLIDAYS)
+        self.assertIsInstance(shifted, pd.DatetimeIndex)
+        self.assertEqual(str(shifted.tz), 'America/Sao_Paulo')
+        self.assertEqual(shifted.name, 'at')
+        self.assertEqual([d.date() for d in shifted], [datetime.date(2020, 12, 28), datetime.date(2021, 1, 4)])
+        counts = self.columnar.count(dates, dates, HOLIDAYS)
+        self.assertEqual(list(counts), [1, 1])
+
+
+@unittest.skipIf(np is None or pa is None, 'numpy or pyarrow is not installed')
+class TestColumnarArrow(unittest.TestCase):
+
+    def setUp(self):
+        from networkdays import columnar
+        self.columnar = columnar
+        self.calendar = BusinessCalendar(HOLIDAYS)
+
+    def dates(self, dates):
+        return pa.array([d and datetime.date.fromisoformat(d) for d in dates], type=pa.date32())
+
+    def test_count(self):
+        counts = self.columnar.count(self.dates(STARTS), self.dates(ENDS), HOLIDAYS)
+        self.assertEqual(counts.type, pa.int64())
+        self.assertEqual(counts.to_pylist(), [22, 2, 0, None])
+
+        counts = self.columnar.count(pa.chunked_array([self.dates(STARTS[:2]), self.dates(STARTS[2:])]),
+                                     self.dates(ENDS), HOLIDAYS)
+        self.assertEqual(counts.to_pylist(), [22, 2, 0, None])
+
+    def test_add_workdays(self):
+        dates = self.dates(STARTS)
+        for days in (-3, -1, 0, 1, 5):
+            with self.subTest(days=days):
+                shifted = self.columnar.add_workdays(dates, days, HOLIDAYS)
+                self.assertEqual(shifted.type, pa.date32())
+                self.assertEqual(
+                    shifted.to_pylist(),
+                    [self.calendar.add_workdays(datetime.date.fromisoformat(d), days) for d in STARTS[:3]] + [None]
+                )
+
+        shifted = self.columnar.add_workdays(dates, pa.array([1, None, 1, 1]), HOLIDAYS)
+        self.assertEqual(shifted.to_pylist(), [datetime.date(2020, 12, 2), None, datetime.date(2020, 12, 28), None])
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestColumnarNumpy(unittest.TestCase):
+
+    def test_numpy(self):
+        from networkdays import columnar
+        starts = np.array(STARTS, dtype='datetime64[D]')
+        ends = np.array(ENDS, dtype='datetime64[D]')
+        self.assertEqual(columnar.count(starts[:3], ends[:3], HOLIDAYS).tolist(), [22, 2, 0])
+        counts = columnar.count(starts, ends, HOLIDAYS)
+        self.assertEqual(counts.dtype, np.float64)
+        self.assertEqual(counts[:3].tolist(), [22, 2, 0])
+        self.assertTrue(np.isnan(counts[3]))
+        self.assertEqual(
+            columnar.add_workdays(starts, 1, HOLIDAYS).tolist(),
+            [datetime.date(2020, 12, 2), datetime.date(2020, 12, 28), datetime.date(2020, 12, 28), None]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
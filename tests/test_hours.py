@@ -0,0 +1,97 @@
+import unittest
+import datetime
+
+from networkdays.hours import BusinessHours
+from networkdays.networkdays import BusinessCalendar
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2021, 1, 1),
+}
+
+
+class TestClassBusinessHours(unittest.TestCase):
+
+    def setUp(self):
+        self.hours = BusinessHours(datetime.time(9), datetime.time(18), BusinessCalendar(HOLIDAYS))
+
+    def by_steps(self, start, end):
+        '''
+        open minutes between start and end, start and end on whole minutes
+        '''
+        elapsed = datetime.timedelta(0)
+        minute = datetime.timedelta(minutes=1)
+        while start < end:
+            if self.hours.is_open(start):
+                elapsed += minute
+            start += minute
+        return elapsed
+
+    def test_elapsed(self):
+        '''
+        December 2020
+        Mo Tu We Th Fr Sa Su
+         21 22 23 24 25 26 27
+         28 29 30 31
+        '''
+        self.assertEqual(
+            self.hours.elapsed(datetime.datetime(2020, 12, 24, 17), datetime.datetime(2020, 12, 28, 10)),
+            datetime.timedelta(hours=2)
+        )
+        self.assertEqual(
+            self.hours.elapsed(datetime.datetime(2020, 12, 21, 10, 30), datetime.datetime(2020, 12, 21, 11)),
+            datetime.timedelta(minutes=30)
+        )
+        self.assertEqual(
+            self.hours.elapsed(datetime.datetime(2020, 12, 21, 7), datetime.datetime(2020, 12, 21, 8)),
+            datetime.timedelta(0)
+        )
+        self.assertEqual(
+            self.hours.elapsed(datetime.datetime(2020, 12, 21, 7), datetime.datetime(2021, 12, 20, 20)),
+            datetime.timedelta(hours=9 * 259)
+        )
+        self.assertEqual(
+            self.hours.elapsed(datetime.datetime(2020, 12, 28, 10), datetime.datetime(2020, 12, 24, 17)),
+            datetime.timedelta(0)
+        )
+
+    def test_elapsed_by_steps(self):
+        moments = [
+            datetime.datetime(2020, 12, 23, 8, 15),
+            datetime.datetime(2020, 12, 24, 9),
+            datetime.datetime(2020, 12, 24, 12, 7),
+            datetime.datetime(2020, 12, 25, 11),
+            datetime.datetime(2020, 12, 26, 23, 59),
+            datetime.datetime(2020, 12, 28, 18),
+            datetime.datetime(2020, 12, 31, 17, 59),
+            datetime.datetime(2021, 1, 4, 0, 0),
+        ]
+        for start in moments:
+            for end in moments:
+                with self.subTest(start=start, end=end):
+                    self.assertEqual(self.hours.elapsed(start, end), self.by_steps(start, end))
+
+    def test_aware_datetimes(self):
+        utc = datetime.timezone.utc
+        brt = datetime.timezone(datetime.timedelta(hours=-3))
+        self.assertEqual(
+            self.hours.elapsed(
+                datetime.datetime(2020, 12, 21, 10, tzinfo=brt),
+                datetime.datetime(2020, 12, 21, 15, tzinfo=utc),  # 12h BRT
+            ),
+            datetime.timedelta(hours=2)
+        )
+
+    def test_is_open(self):
+        self.assertTrue(self.hours.is_open(datetime.datetime(2020, 12, 24, 9)))
+        self.assertFalse(self.hours.is_open(datetime.datetime(2020, 12, 24, 18)))
+        self.assertFalse(self.hours.is_open(datetime.datetime(2020, 12, 25, 12)))  # holiday
+
+    def test_invalid_hours(self):
+        with self.assertRaises(ValueError):
+            BusinessHours(datetime.time(18), datetime.time(9))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import datetime
+
+from networkdays import instrumentation
+from networkdays.networkdays import JobSchedule, Networkdays
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        self.assertFalse(instrumentation.is_enabled())
+        Networkdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31)).networkdays()
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_snapshot(self):
+        instrumentation.enable()
+        ndays = Networkdays(datetime.date(2020, 1, 1), datetime.date(2020, 1, 31))
+        ndays.networkdays()
+        ndays.networkdays()
+        ndays.holidays()
+        Networkdays(datetime.date(2000, 1, 1), datetime.date(2049, 12, 31)).weekends()
+        JobSchedule(16, 8, datetime.date(2020, 12, 24))
+
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(
+            sorted(snapshot),
+            ['JobSchedule.job_workdays', 'Networkdays.holidays', 'Networkdays.networkdays', 'Networkdays.weekends']
+        )
+        networkdays = snapshot['Networkdays.networkdays']
+        self.assertEqual(networkdays['calls'], 2)
+        self.assertGreater(networkdays['seconds'], 0)
+        self.assertEqual(networkdays['range_days']['31'], 2)
+        self.assertEqual(networkdays['range_days_sum'], 62)
+        self.assertEqual(snapshot['Networkdays.weekends']['range_days']['36525'], 1)
+        self.assertEqual(snapshot['JobSchedule.job_workdays']['range_days']['7'], 1)
+
+        instrumentation.disable()
+        ndays.networkdays()
+        self.assertEqual(instrumentation.snapshot()['Networkdays.networkdays']['calls'], 2)
+
+    def test_prometheus(self):
+        instrumentation.enable()
+        ndays = Networkdays(datetime.date(2020, 1, 1), datetime.date(2020, 1, 31))
+        ndays.networkdays()
+        Networkdays(datetime.date(2020, 1, 1), datetime.date(2220, 1, 1)).networkdays()
+
+        text = instrumentation.prometheus()
+        self.assertIn('# TYPE networkdays_calls_total counter\n', text)
+        self.assertIn('networkdays_calls_total{method="Networkdays.networkdays"} 2\n', text)
+        self.assertIn('# TYPE networkdays_range_days histogram\n', text)
+        self.assertIn('networkdays_range_days_bucket{method="Networkdays.networkdays",le="7"} 0\n', text)
+        self.assertIn('networkdays_range_days_bucket{method="Networkdays.networkdays",le="31"} 1\n', text)
+        self.assertIn('networkdays_range_days_bucket{method="Networkdays.networkdays",le="36525"} 1\n', text)
+        self.assertIn('networkdays_range_days_bucket{method="Networkdays.networkdays",le="+Inf"} 2\n', text)
+        self.assertIn('networkdays_range_days_count{method="Networkdays.networkdays"} 2\n', text)
+        self.assertTrue(text.endswith('\n'))
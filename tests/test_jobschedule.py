@@ -1,5 +1,6 @@
 import unittest
 import datetime
+from itertools import groupby
 
 from networkdays.networkdays import JobSchedule, Networkdays
 
@@ -217,3 +218,53 @@ class TestClassJobSchedule(unittest.TestCase):
 
         self.assertEqual(list(jobschedule.weeks(year=2020, month=11)),[ 45, 46, 47, 48, 49] )
 
+    def test_job_workdays_not_truncated(self):
+        '''
+        without a predefined networkdays, all the job workdays are scheduled
+        (no matter how many weekends and holidays are in between).
+        '''
+        jobschedule = JobSchedule(120, 8, datetime.date(2024, 7, 1))
+        self.assertEqual(jobschedule.bussines_days, 15)
+        self.assertEqual(jobschedule.jobdays[-1], datetime.date(2024, 7, 19))
+
+    def test_job_workdays_starts_on_long_dayoff(self):
+        '''
+        the job starts on a long run of days off (holidays)
+        '''
+        holidays = {datetime.date(2020, 1, 1) + datetime.timedelta(days=d) for d in range(366)}
+        networkdays = Networkdays(datetime.date(2020, 1, 1), datetime.date(2021, 12, 31), holidays)
+        jobschedule = JobSchedule(16, 8, datetime.date(2020, 1, 1), networkdays)
+        self.assertEqual(jobschedule.jobdays, [datetime.date(2021, 1, 1), datetime.date(2021, 1, 4)])
+
+    def test_job_workdays_starts_after_networkdays(self):
+        networkdays = Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 11, 30))
+        jobschedule = JobSchedule(16, 8, datetime.date(2020, 12, 1), networkdays)
+        self.assertEqual(jobschedule.jobdays, [])
+        self.assertEqual(jobschedule.bussines_days, 0)
+
+    def test_job_schedule_periods_index(self):
+        '''
+        years, months and weeks from the period index, same as grouping the
+        jobdays of each filter
+        '''
+        holidays = {datetime.date(2021, 1, 1), datetime.date(2021, 12, 31), datetime.date(2022, 5, 2)}
+        jobschedule = JobSchedule(6000, 8, datetime.date(2020, 12, 2), Networkdays(
+            datetime.date(2020, 11, 1), datetime.date(2023, 2, 28), holidays
+        ))
+        jobdays = jobschedule.jobdays
+        self.assertEqual(list(jobschedule.years()), [2020, 2021, 2022, 2023])
+        for year in (None, 2020, 2021, 2022, 2023, 2024):
+            with self.subTest(year=year):
+                days = [d for d in jobdays if not year or d.year == year]
+                self.assertEqual(list(jobschedule.months(year)), [m for m, _ in groupby(d.month for d in days)])
+            for month in (None, 1, 5, 12):
+                with self.subTest(year=year, month=month):
+                    days = [d for d in jobdays if (not year or d.year == year) and (not month or d.month == month)]
+                    weeks = [w for w, _ in groupby(d.isocalendar()[1] for d in days)]
+                    self.assertEqual(list(jobschedule.weeks(year, month)), weeks)
+                    self.assertEqual(jobschedule.workdays_count(year, month), len(days))
+                    self.assertEqual(
+                        jobschedule.workdays_count(year, month, 52),
+                        len([d for d in days if d.isocalendar()[1] == 52])
+                    )
+        self.assertEqual(jobschedule.workdays_count(2021, 1, 53), 0)  # Jan 1st, 2021 is a holiday
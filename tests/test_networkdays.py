@@ -1,5 +1,12 @@
 import unittest
 import datetime
+import bisect
+import itertools
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
 
 from networkdays.networkdays import Networkdays
 
@@ -148,3 +155,137 @@ class TestClassNetworkDays(unittest.TestCase):
         networkdays = Networkdays(start_date, end_date, weekdaysoff=weekdaysoff)
         last_workday = networkdays.last_workday_of_month(2020, 11)
         self.assertEqual(last_workday, datetime.date(2020, 11, 27))
+
+    def test_count(self):
+        '''
+        `count()` must match the length of the `networkdays()` list.
+        '''
+        holidays = {
+            datetime.date(2020, 12, 25),
+            datetime.date(2020, 12, 26),  # saturday
+            datetime.date(2021, 1, 1),
+            datetime.date(2019, 1, 1),  # out of range
+        }
+        cases = [
+            (datetime.date(2020, 12, 1), datetime.date(2020, 12, 31), holidays, {6, 7}),
+            (datetime.date(2020, 12, 25), datetime.date(2020, 12, 25), holidays, {6, 7}),
+            (datetime.date(2020, 12, 26), datetime.date(2020, 12, 27), holidays, {6, 7}),
+            (datetime.date(2020, 1, 3), datetime.date(2031, 7, 16), holidays, {6, 7}),
+            (datetime.date(2020, 11, 1), datetime.date(2020, 11, 30), [datetime.date(2020, 11, 29)], {1, 2, 3, 4, 5, 6}),
+            (datetime.date(2020, 11, 4), datetime.date(2021, 2, 11), holidays, {3}),
+            (datetime.date(2020, 11, 4), datetime.date(2020, 11, 30), holidays, set()),
+        ]
+        for date_start, date_end, holidays_set, weekdaysoff in cases:
+            with self.subTest(date_start=date_start, date_end=date_end, weekdaysoff=weekdaysoff):
+                ndays = Networkdays(date_start, date_end, holidays_set, weekdaysoff)
+                self.assertEqual(ndays.count(), len(ndays.networkdays()))
+
+    def test_count_edge_cases(self):
+        # end before start has no workdays, as `networkdays()`
+        ndays = Networkdays(datetime.date(2020, 12, 31), datetime.date(2020, 12, 1))
+        self.assertEqual(ndays.count(), 0)
+        self.assertEqual(ndays.networkdays(), [])
+
+        # no date_end, 1 year after date_start
+        ndays = Networkdays(datetime.date(2020, 6, 20))
+        self.assertEqual(ndays.count(), len(ndays.networkdays()))
+
+        # every day is off
+        ndays = Networkdays(datetime.date(2020, 1, 1), datetime.date(2020, 12, 31), weekdaysoff={1, 2, 3, 4, 5, 6, 7})
+        self.assertEqual(ndays.count(), 0)
+
+    def test_rank_and_select(self):
+        '''
+        rank and select, same as `bisect_left` and indexing of `networkdays()`
+        '''
+        holidays = {datetime.date(2020, 12, 25), datetime.date(2020, 12, 26), datetime.date(2021, 1, 1)}
+        for weekdaysoff in ({6, 7}, {1, 2, 3, 4, 5, 6}, set()):
+            ndays = Networkdays(datetime.date(2020, 12, 19), datetime.date(2021, 1, 12), holidays, weekdaysoff)
+            workdays = ndays.networkdays()
+            for days in range(-3, 30):
+                date = datetime.date(2020, 12, 19) + datetime.timedelta(days=days)
+                with self.subTest(weekdaysoff=weekdaysoff, date=date):
+                    self.assertEqual(ndays.rank(date), bisect.bisect_left(workdays, date))
+            for index in range(-len(workdays) - 2, len(workdays) + 2):
+                with self.subTest(weekdaysoff=weekdaysoff, index=index):
+                    if -len(workdays) <= index < len(workdays):
+                        self.assertEqual(ndays.select(index), workdays[index])
+                    else:
+                        with self.assertRaises(IndexError):
+                            ndays.select(index)
+
+        ndays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31))
+        self.assertEqual(ndays.rank(datetime.date(2020, 12, 7)), 4)
+        self.assertEqual(ndays.rank(datetime.date.min), 0)
+        self.assertEqual(ndays.select(-1), datetime.date(2020, 12, 31))
+
+    def test_networkdays_outputs(self):
+        '''
+        December 2020
+        Mo Tu We Th Fr Sa Su
+            1  2  3  4  5  6
+         7  8  9 10 11 12 13
+        14 15 16 17 18 19 20
+        21 22 23 24 25 26 27
+        28 29 30 31
+        '''
+        holidays = {datetime.date(2020, 12, 25), datetime.date(2020, 12, 31)}
+        for weekdaysoff in ({6, 7}, {3}, set(), {1, 2, 3, 4, 5, 6, 7}):
+            ndays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2021, 3, 31), holidays, weekdaysoff)
+            workdays = ndays.networkdays()
+            with self.subTest(weekdaysoff=weekdaysoff):
+                ordinals = ndays.networkdays_ordinals()
+                self.assertEqual(ordinals.typecode, 'i')
+                self.assertEqual(list(ordinals), [d.toordinal() for d in workdays])
+                spans = ndays.networkdays_spans()
+                self.assertEqual(
+                    [d for first, last in spans for d in Networkdays(first, last, weekdaysoff=set()).networkdays()],
+                    workdays
+                )
+                # runs are maximal, a day off between them
+                for (_, last), (first, _) in zip(spans, spans[1:]):
+                    self.assertGreater((first - last).days, 1)
+
+        ndays = Networkdays(datetime.date(2020, 12, 21), datetime.date(2021, 1, 1), holidays)
+        self.assertEqual(ndays.networkdays_spans(), [
+            (datetime.date(2020, 12, 21), datetime.date(2020, 12, 24)),
+            (datetime.date(2020, 12, 28), datetime.date(2020, 12, 30)),
+            (datetime.date(2021, 1, 1), datetime.date(2021, 1, 1)),
+        ])
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_networkdays_numpy_output(self):
+        ndays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31))
+        ordinals = np.frombuffer(ndays.networkdays_ordinals(), dtype=np.intc)
+        self.assertEqual(ordinals.tolist(), [d.toordinal() for d in ndays.networkdays()])
+        self.assertEqual(ordinals.itemsize, 4)
+
+    def test_iter_networkdays(self):
+        '''
+        lazy workdays, same dates of a day by day check
+        '''
+        holidays = {
+            datetime.date(2020, 12, 25),
+            datetime.date(2020, 12, 26),  # saturday
+            datetime.date(2021, 1, 1),
+        }
+        date_start = datetime.date(2020, 12, 1)
+        date_end = datetime.date(2021, 1, 31)
+        for weekdaysoff in ({6, 7}, {3}, set()):
+            with self.subTest(weekdaysoff=weekdaysoff):
+                ndays = Networkdays(date_start, date_end, holidays, weekdaysoff)
+                expected = [
+                    date_start + datetime.timedelta(days=days)
+                    for days in range((date_end - date_start).days + 1)
+                    if (date_start + datetime.timedelta(days=days)).isoweekday() not in weekdaysoff and
+                    date_start + datetime.timedelta(days=days) not in holidays
+                ]
+                workdays = ndays.iter_networkdays()
+                self.assertNotIsInstance(workdays, list)
+                self.assertEqual(list(workdays), expected)
+                self.assertEqual(ndays.networkdays(), expected)
+
+    def test_iter_networkdays_stop_early(self):
+        ndays = Networkdays(datetime.date(2000, 1, 1), datetime.date(2099, 12, 31))
+        first_days = list(itertools.islice(ndays.iter_networkdays(), 3))
+        self.assertEqual(first_days, [datetime.date(2000, 1, 3), datetime.date(2000, 1, 4), datetime.date(2000, 1, 5)])
@@ -0,0 +1,50 @@
+import unittest
+import datetime
+
+from networkdays.networkdays import BusinessCalendar, JobSchedule
+from networkdays.parallel import JobSpan, schedule_jobs
+
+
+HOLIDAYS = {datetime.date(2020, 12, 25), datetime.date(2021, 1, 1)}
+
+JOBS = [
+    (8, 8, datetime.date(2020, 11, 1)),
+    (4.5, 1.5, datetime.date(2020, 11, 1)),
+    (600, 8, datetime.date(2020, 12, 1)),
+    (16, 8, datetime.date(2020, 12, 24)),
+    (0, 8, datetime.date(2020, 12, 24)),
+]
+
+
+class TestScheduleJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(HOLIDAYS)
+        self.jobschedules = [JobSchedule(*job, calendar=self.calendar) for job in JOBS]
+
+    def assertSameSchedules(self, results):
+        self.assertEqual(len(results), len(self.jobschedules))
+        for result, jobschedule in zip(results, self.jobschedules):
+            self.assertEqual(result.jobdays, jobschedule.jobdays)
+            self.assertEqual(result.bussines_days, jobschedule.bussines_days)
+            self.assertEqual(result.prj_starts, jobschedule.prj_starts)
+            self.assertEqual(result.prj_ends, jobschedule.prj_ends)
+
+    def test_schedule_jobs_serial(self):
+        self.assertSameSchedules(schedule_jobs(JOBS, self.calendar, workers=1))
+
+    def test_schedule_jobs_processes(self):
+        self.assertSameSchedules(schedule_jobs(JOBS, self.calendar, workers=2, chunksize=2))
+
+    def test_schedule_jobs_compact(self):
+        expected = [
+            JobSpan(jobschedule.jobdays[0], jobschedule.jobdays[-1], jobschedule.bussines_days)
+            if jobschedule.jobdays else JobSpan(None, None, 0)
+            for jobschedule in self.jobschedules
+        ]
+        self.assertEqual(schedule_jobs(JOBS, self.calendar, compact=True, workers=1), expected)
+        self.assertEqual(schedule_jobs(JOBS, self.calendar, compact=True, workers=2), expected)
+
+    def test_schedule_jobs_default_calendar(self):
+        spans = schedule_jobs([(120, 8, datetime.date(2024, 7, 1))], compact=True, workers=1)
+        self.assertEqual(spans, [JobSpan(datetime.date(2024, 7, 1), datetime.date(2024, 7, 19), 15)])
@@ -0,0 +1,140 @@
+import unittest
+import datetime
+import pickle
+import random
+
+from networkdays.cache import ResultCache
+from networkdays.networkdays import BusinessCalendar, JobSchedule, Networkdays
+from networkdays.rules import (
+    EasterOffset,
+    FixedDate,
+    HolidayRules,
+    LastWeekday,
+    NthWeekday,
+    Observed,
+    easter,
+)
+
+
+US_RULES = [
+    Observed(FixedDate(1, 1), saturday=-1),  # New Year's Day
+    NthWeekday(1, 1, 3),  # Martin Luther King Jr. Day
+    LastWeekday(5, 1),  # Memorial Day
+    Observed(FixedDate(7, 4), saturday=-1),  # Independence Day
+    NthWeekday(11, 4, 4),  # Thanksgiving
+    Observed(FixedDate(12, 25), saturday=-1),  # Christmas
+    EasterOffset(-2),  # Good Friday
+]
+
+
+class TestHolidayRules(unittest.TestCase):
+
+    def test_easter(self):
+        self.assertEqual(easter(2020), datetime.date(2020, 4, 12))
+        self.assertEqual(easter(2021), datetime.date(2021, 4, 4))
+        self.assertEqual(easter(2024), datetime.date(2024, 3, 31))
+        self.assertEqual(easter(2038), datetime.date(2038, 4, 25))
+
+    def test_rules(self):
+        self.assertEqual(FixedDate(2, 29).dates(2020), [datetime.date(2020, 2, 29)])
+        self.assertEqual(FixedDate(2, 29).dates(2021), [])
+        self.assertEqual(NthWeekday(11, 4, 4).dates(2020), [datetime.date(2020, 11, 26)])
+        self.assertEqual(NthWeekday(9, 1, 1).dates(2020), [datetime.date(2020, 9, 7)])
+        self.assertEqual(NthWeekday(2, 1, 5).dates(2021), [])  # no 5th Monday
+        self.assertEqual(LastWeekday(5, 1).dates(2020), [datetime.date(2020, 5, 25)])
+        self.assertEqual(LastWeekday(10, 6).dates(2020), [datetime.date(2020, 10, 31)])
+        self.assertEqual(EasterOffset(60).dates(2020), [datetime.date(2020, 6, 11)])  # Corpus Christi
+        self.assertEqual(Observed(FixedDate(12, 26)).dates(2020), [datetime.date(2020, 12, 28)])  # saturday
+        self.assertEqual(Observed(FixedDate(12, 27)).dates(2020), [datetime.date(2020, 12, 28)])  # sunday
+        self.assertEqual(Observed(FixedDate(12, 26), saturday=-1).dates(2020), [datetime.date(2020, 12, 25)])
+        self.assertEqual(Observed(FixedDate(12, 24)).dates(2020), [datetime.date(2020, 12, 24)])
+
+    def test_year_shifted_holidays(self):
+        '''
+        January 1, 2022 is a saturday, observed on December 31, 2021.
+        '''
+        rules = HolidayRules(US_RULES)
+        self.assertIn(datetime.date(2021, 12, 31), rules.year(2021))
+        self.assertNotIn(datetime.date(2022, 1, 1), rules)
+        self.assertEqual(
+            rules.between(datetime.date(2021, 12, 1), datetime.date(2022, 1, 31)),
+            [datetime.date(2021, 12, 24), datetime.date(2021, 12, 31), datetime.date(2022, 1, 17)]
+        )
+
+    def test_lazy_expansion(self):
+        rules = HolidayRules(US_RULES)
+        ndays = Networkdays(datetime.date(2020, 12, 1), datetime.date(2021, 1, 31), rules)
+        ndays.networkdays()
+        self.assertEqual(sorted(rules._years), [2020, 2021])
+
+    def test_hash_and_pickle(self):
+        self.assertEqual(HolidayRules(US_RULES), HolidayRules(US_RULES))
+        self.assertEqual(hash(HolidayRules(US_RULES)), hash(HolidayRules(US_RULES)))
+        self.assertNotEqual(HolidayRules(US_RULES), HolidayRules(US_RULES[:2]))
+        rules = pickle.loads(pickle.dumps(HolidayRules(US_RULES)))
+        self.assertEqual(rules, HolidayRules(US_RULES))
+        self.assertEqual(len(rules.year(2020)), 7)
+
+    def test_rule_type_in_identity(self):
+        '''
+        rules of different types with the same fields are different rules,
+        calendars of them don't share cached results
+        '''
+        fixed, last = HolidayRules([FixedDate(5, 1)]), HolidayRules([LastWeekday(5, 1)])
+        self.assertNotEqual(fixed, last)
+        self.assertNotEqual(HolidayRules([Observed(FixedDate(5, 1))]), HolidayRules([Observed(LastWeekday(5, 1))]))
+        self.assertEqual(HolidayRules([Observed(FixedDate(5, 1))]), HolidayRules([Observed(FixedDate(5, 1))]))
+
+        cache = ResultCache()
+        date_start, date_end = datetime.date(2020, 5, 1), datetime.date(2020, 5, 31)
+        self.assertEqual(Networkdays(date_start, date_end, fixed, cache=cache).holidays(), [datetime.date(2020, 5, 1)])
+        self.assertEqual(Networkdays(date_start, date_end, last, cache=cache).holidays(), [datetime.date(2020, 5, 25)])
+
+    def test_same_as_explicit_holidays(self):
+        '''
+        a calendar of rules answers as a calendar of the expanded dates.
+        '''
+        explicit = {
+            date for year in range(1970, 2080) for rule in US_RULES for date in rule.dates(year)
+            if 1975 <= date.year <= 2075
+        }
+        random.seed(13)
+        for weekdaysoff in ({6, 7}, {5, 6, 7}):
+            explicit_calendar = BusinessCalendar(explicit, weekdaysoff)
+            for rules_calendar in (
+                BusinessCalendar(HolidayRules(US_RULES), weekdaysoff),
+                BusinessCalendar(HolidayRules(US_RULES), weekdaysoff, 2019, 2021),
+            ):
+                for _ in range(200):
+                    date_start = datetime.date(2000, 1, 1) + datetime.timedelta(days=random.randint(0, 15000))
+                    date_end = date_start + datetime.timedelta(days=random.randint(-5, 4000))
+                    days = random.randint(-2000, 2000)
+                    with self.subTest(weekdaysoff=weekdaysoff, date_start=date_start, date_end=date_end, days=days):
+                        self.assertEqual(
+                            rules_calendar.count(date_start, date_end),
+                            explicit_calendar.count(date_start, date_end)
+                        )
+                        self.assertEqual(
+                            rules_calendar.add_workdays(date_start, days),
+                            explicit_calendar.add_workdays(date_start, days)
+                        )
+                        self.assertEqual(rules_calendar.is_workday(date_start), explicit_calendar.is_workday(date_start))
+                self.assertEqual(
+                    rules_calendar.workdays(datetime.date(2020, 1, 1), datetime.date(2021, 12, 31)),
+                    explicit_calendar.workdays(datetime.date(2020, 1, 1), datetime.date(2021, 12, 31))
+                )
+                self.assertEqual(
+                    rules_calendar.holidays(datetime.date(2019, 12, 25), datetime.date(2022, 1, 17)),
+                    explicit_calendar.holidays(datetime.date(2019, 12, 25), datetime.date(2022, 1, 17))
+                )
+
+    def test_networkdays_and_jobschedule(self):
+        rules = HolidayRules(US_RULES)
+        ndays = Networkdays(datetime.date(2020, 11, 1), datetime.date(2020, 12, 31), rules)
+        self.assertEqual(ndays.holidays(), [datetime.date(2020, 11, 26), datetime.date(2020, 12, 25)])
+        self.assertEqual(ndays.count(), 42)
+        self.assertEqual(len(ndays.networkdays()), 42)
+        self.assertEqual(ndays.last_workday_of_month(2021, 5), datetime.date(2021, 5, 28))
+
+        jobschedule = JobSchedule(16, 8, datetime.date(2020, 12, 24), calendar=BusinessCalendar(rules))
+        self.assertEqual(jobschedule.jobdays, [datetime.date(2020, 12, 24), datetime.date(2020, 12, 28)])
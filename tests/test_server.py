@@ -0,0 +1,177 @@
+import unittest
+import datetime
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from networkdays.networkdays import BusinessCalendar
+from networkdays.server import make_server
+
+
+CALENDARS = {
+    None: BusinessCalendar({datetime.date(2020, 12, 25)}),
+    'sundays': BusinessCalendar(weekdaysoff={7}),
+}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path):
+        super().__init__('localhost')
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+class TestQueryServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = make_server(CALENDARS, port=0, workers=4)
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,))
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def connection(self):
+        host, port = self.server.server_address
+        return http.client.HTTPConnection(host, port, timeout=5)
+
+    def query(self, path, body=None, connection=None):
+        connection = connection or self.connection()
+        if body is None:
+            connection.request('GET', path)
+        else:
+            connection.request('POST', path, json.dumps(body))
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_count(self):
+        self.assertEqual(self.query('/count', {'start': '2020-12-01', 'end': '2020-12-31'}), (200, {'count': 22}))
+        self.assertEqual(
+            self.query('/count', {'start': '2020-12-01', 'end': '2020-12-31', 'calendar': 'sundays'}),
+            (200, {'count': 27})
+        )
+
+    def test_networkdays(self):
+        self.assertEqual(
+            self.query('/networkdays', {'start': '2020-12-24', 'end': '2020-12-28'}),
+            (200, {'workdays': ['2020-12-24', '2020-12-28']})
+        )
+
+    def test_add_workdays(self):
+        self.assertEqual(self.query('/add_workdays', {'date': '2020-12-24', 'days': 1}), (200, {'date': '2020-12-28'}))
+        self.assertEqual(self.query('/add_workdays', {'date': '2020-12-28', 'days': -1}), (200, {'date': '2020-12-24'}))
+
+    def test_jobschedule(self):
+        status, result = self.query('/jobschedule', {'hours': 16, 'hours_per_day': 8, 'start': '2020-12-24'})
+        self.assertEqual(status, 200)
+        self.assertEqual(result, {
+            'jobdays': ['2020-12-24', '2020-12-28'],
+            'bussines_days': 2,
+            'prj_starts': '2020-12-24',
+            'prj_ends': '2020-12-28',
+        })
+
+    def test_errors(self):
+        self.assertEqual(self.query('/health'), (200, {'status': 'ok'}))
+        self.assertEqual(self.query('/nothing', {})[0], 404)
+        self.assertEqual(self.query('/count', {'start': '2020-13-01'}), (400, {'error': 'cant convert date "2020-13-01"'}))
+        self.assertEqual(self.query('/count', {'end': '2020-12-01'}), (400, {'error': 'missing "start"'}))
+        self.assertEqual(
+            self.query('/count', {'start': '2020-12-01', 'calendar': 'moon'}),
+            (400, {'error': 'unknown calendar "moon"'})
+        )
+        self.assertEqual(self.query('/add_workdays', {'date': '2020-12-01', 'days': '1'})[0], 400)
+        self.assertEqual(self.query('/add_workdays', {'date': '2020-12-01', 'days': True})[0], 400)
+        self.assertEqual(
+            self.query('/count', {'start': '2020-12-01', 'calendar': [1]}),
+            (400, {'error': 'calendar must be a string, got [1]'})
+        )
+        self.assertEqual(self.query('/jobschedule', {'hours': 8, 'hours_per_day': 0, 'start': '2020-12-01'})[0], 400)
+        self.assertEqual(self.query('/count', [1, 2]), (400, {'error': 'query must be a JSON object'}))
+
+    def test_keep_alive_and_concurrent_queries(self):
+        connection = self.connection()
+        for _ in range(3):
+            self.assertEqual(self.query('/count', {'start': '2020-12-01', 'end': '2020-12-31'}, connection)[1], {'count': 22})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda day: self.query('/count', {'start': '2020-12-01', 'end': f'2020-12-{day:02}'}),
+                range(1, 32)
+            ))
+        self.assertEqual(results[-1], (200, {'count': 22}))
+        self.assertTrue(all(status == 200 for status, result in results))
+
+    def test_idle_connections_dont_hold_workers(self):
+        server = make_server(CALENDARS, port=0, workers=2)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+        thread.start()
+        try:
+            # more idle keep-alive connections than workers
+            idle = [socket.create_connection(server.server_address) for _ in range(3)]
+            connection = http.client.HTTPConnection(*server.server_address, timeout=2)
+            query = {'start': '2020-12-01', 'end': '2020-12-31'}
+            self.assertEqual(self.query('/count', query, connection), (200, {'count': 22}))
+            connection.close()
+            for sock in idle:
+                sock.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_invalid_content_length(self):
+        connection = self.connection()
+        connection.putrequest('POST', '/count')
+        connection.putheader('Content-Length', 'abc')
+        connection.endheaders()
+        response = connection.getresponse()
+        self.assertEqual(response.status, 400)
+        self.assertEqual(json.loads(response.read()), {'error': 'invalid Content-Length "abc"'})
+
+    def test_idle_connection_closed(self):
+        server = make_server(CALENDARS, port=0, workers=1)
+        server.idle_timeout = 0.2
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+        thread.start()
+        try:
+            idle = socket.create_connection(server.server_address, timeout=5)
+            # closed by the server, not by the client timeout
+            self.assertEqual(idle.recv(1), b'')
+            idle.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'UNIX sockets are not available')
+class TestUnixQueryServer(unittest.TestCase):
+
+    def test_count(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'networkdays.sock')
+            server = make_server(CALENDARS, unix_socket=path)
+            thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+            thread.start()
+            try:
+                connection = UnixHTTPConnection(path)
+                connection.request('POST', '/count', json.dumps({'start': '2020-12-01', 'end': '2020-12-31'}))
+                response = connection.getresponse()
+                self.assertEqual(json.loads(response.read()), {'count': 22})
+                connection.close()
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+            self.assertFalse(os.path.exists(path))
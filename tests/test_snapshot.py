@@ -0,0 +1,164 @@
+import unittest
+import datetime
+import os
+import pickle
+import struct
+import tempfile
+
+from networkdays.networkdays import BusinessCalendar, Networkdays
+from networkdays.rules import EasterOffset, FixedDate, HolidayRules, LastWeekday, NthWeekday, Observed
+from networkdays.snapshot import load_snapshot, write_snapshot
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2020, 12, 26),  # saturday
+    datetime.date(2021, 1, 1),
+    datetime.date(2030, 1, 1),
+}
+
+
+class CustomRule:
+
+    def dates(self, year):
+        return [datetime.date(year, 6, 1)]
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        descriptor, self.path = tempfile.mkstemp(suffix='.nwd')
+        os.close(descriptor)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write_and_load(self):
+        calendar = BusinessCalendar(HOLIDAYS, {3, 6, 7}, 2020, 2022)
+        write_snapshot(calendar, self.path)
+        loaded = load_snapshot(self.path)
+
+        self.assertIsInstance(loaded._index, memoryview)
+        self.assertEqual(loaded.key, calendar.key)
+        self.assertEqual((loaded.year_start, loaded.year_end), (2020, 2022))
+        self.assertEqual(list(loaded._index), list(calendar._index))
+        ranges = [
+            (datetime.date(2020, 12, 1), datetime.date(2020, 12, 31)),
+            (datetime.date(2019, 12, 15), datetime.date(2031, 1, 15)),
+        ]
+        for date_start, date_end in ranges:
+            with self.subTest(date_start=date_start):
+                self.assertEqual(loaded.count(date_start, date_end), calendar.count(date_start, date_end))
+                self.assertEqual(loaded.workdays(date_start, date_end), calendar.workdays(date_start, date_end))
+                self.assertEqual(loaded.holidays(date_start, date_end), calendar.holidays(date_start, date_end))
+        for days in (-300, -1, 1, 10, 400):
+            with self.subTest(days=days):
+                self.assertEqual(
+                    loaded.add_workdays(datetime.date(2021, 6, 1), days),
+                    calendar.add_workdays(datetime.date(2021, 6, 1), days)
+                )
+        self.assertEqual(
+            Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31), calendar=loaded).count(),
+            Networkdays(datetime.date(2020, 12, 1), datetime.date(2020, 12, 31), calendar=calendar).count(),
+        )
+
+        # pickled (to a process pool) with a copy of the index
+        unpickled = pickle.loads(pickle.dumps(loaded))
+        self.assertEqual(list(unpickled._index), list(calendar._index))
+        self.assertEqual(unpickled.count(datetime.date(2020, 1, 1), datetime.date(2022, 12, 31)),
+                         calendar.count(datetime.date(2020, 1, 1), datetime.date(2022, 12, 31)))
+
+    def test_holiday_rules(self):
+        calendar = BusinessCalendar(HolidayRules([FixedDate(12, 25)]), {6, 7}, 2020, 2021)
+        write_snapshot(calendar, self.path)
+        loaded = load_snapshot(self.path)
+        self.assertEqual(loaded.holidays_set, calendar.holidays_set)
+        self.assertEqual(loaded, calendar)
+        self.assertEqual(
+            loaded.count(datetime.date(2020, 1, 1), datetime.date(2021, 12, 31)),
+            calendar.count(datetime.date(2020, 1, 1), datetime.date(2021, 12, 31))
+        )
+
+        with self.assertRaises(ValueError):
+            write_snapshot(BusinessCalendar(HolidayRules([CustomRule()]), {6, 7}, 2020, 2021), self.path)
+
+    def test_holiday_rules_out_of_span(self):
+        '''
+        the rules are kept, queries out of and across the index span agree
+        with the calendar written
+        '''
+        rules = HolidayRules([
+            FixedDate(1, 1), Observed(FixedDate(12, 25), saturday=-1), EasterOffset(-2),
+            NthWeekday(11, 4, 4), LastWeekday(5, 1),
+        ])
+        calendar = BusinessCalendar(rules, {6, 7}, 2020, 2021)
+        write_snapshot(calendar, self.path)
+        loaded = load_snapshot(self.path)
+
+        self.assertEqual(list(loaded._index), list(calendar._index))
+        self.assertEqual(loaded.add_workdays(datetime.date(2016, 1, 9), -31), datetime.date(2015, 11, 24))
+        self.assertEqual(loaded.count(datetime.date(2021, 6, 1), datetime.date(2022, 6, 1)), 258)
+        ranges = [
+            (datetime.date(2015, 6, 1), datetime.date(2016, 6, 1)),
+            (datetime.date(2019, 6, 1), datetime.date(2020, 6, 1)),
+            (datetime.date(2016, 1, 1), datetime.date(2023, 12, 31)),
+            (datetime.date(2021, 6, 1), datetime.date(2022, 6, 1)),
+        ]
+        for date_start, date_end in ranges:
+            with self.subTest(date_start=date_start):
+                self.assertEqual(loaded.count(date_start, date_end), calendar.count(date_start, date_end))
+                self.assertEqual(loaded.holidays(date_start, date_end), calendar.holidays(date_start, date_end))
+        shifts = [(datetime.date(2016, 1, 9), -31), (datetime.date(2021, 12, 20), 30), (datetime.date(2019, 1, 1), 600)]
+        for date, days in shifts:
+            with self.subTest(date=date, days=days):
+                self.assertEqual(loaded.add_workdays(date, days), calendar.add_workdays(date, days))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            write_snapshot(BusinessCalendar(HOLIDAYS), self.path)
+
+        with open(self.path, 'wb') as snapshot:
+            snapshot.write(b'NWD')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+        write_snapshot(BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2020), self.path)
+        with open(self.path, 'r+b') as snapshot:
+            snapshot.write(b'XXXX')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+        write_snapshot(BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2020), self.path)
+        with open(self.path, 'r+b') as snapshot:
+            snapshot.truncate(os.path.getsize(self.path) - 4)
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+    def test_invalid_rules(self):
+        write_snapshot(BusinessCalendar(HolidayRules([FixedDate(12, 25)]), {6, 7}, 2020, 2020), self.path)
+        with open(self.path, 'r+b') as snapshot:
+            snapshot.seek(-len(b'"FixedDate", 12, 25]]'), os.SEEK_END)
+            snapshot.write(b'"MovedDate"')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+    def test_other_byte_order(self):
+        calendar = BusinessCalendar(HOLIDAYS, {6, 7}, 2020, 2021)
+        write_snapshot(calendar, self.path)
+        with open(self.path, 'rb') as snapshot:
+            data = bytearray(snapshot.read())
+        # flip the byte order flag and every int32 after the header
+        data[6] ^= 1
+        for offset in range(32, len(data), 4):
+            data[offset:offset + 4] = data[offset:offset + 4][::-1]
+        with open(self.path, 'wb') as snapshot:
+            snapshot.write(bytes(data))
+
+        loaded = load_snapshot(self.path)
+        self.assertEqual(list(loaded._index), list(calendar._index))
+        self.assertEqual(loaded.holidays_set, calendar.holidays_set)
+        self.assertEqual(struct.calcsize('<4sHBBiiiII4x'), 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
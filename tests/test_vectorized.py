@@ -0,0 +1,85 @@
+import unittest
+import datetime
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from networkdays.networkdays import BusinessCalendar, Networkdays
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestBusdayCount(unittest.TestCase):
+
+    def setUp(self):
+        from networkdays import vectorized
+        self.vectorized = vectorized
+
+    def test_busday_count_same_as_networkdays(self):
+        holidays = {
+            datetime.date(2020, 12, 25),
+            datetime.date(2020, 12, 26),  # saturday
+            datetime.date(2021, 1, 1),
+        }
+        ranges = [
+            (datetime.date(2020, 12, 1), datetime.date(2020, 12, 31)),
+            (datetime.date(2020, 12, 25), datetime.date(2020, 12, 25)),
+            (datetime.date(2020, 12, 26), datetime.date(2020, 12, 27)),
+            (datetime.date(2020, 1, 3), datetime.date(2031, 7, 16)),
+            (datetime.date(2020, 12, 31), datetime.date(2020, 12, 1)),  # end before start
+        ]
+        for weekdaysoff in ({6, 7}, {3}, {1, 2, 3, 4, 5, 6}, set()):
+            with self.subTest(weekdaysoff=weekdaysoff):
+                counts = self.vectorized.busday_count(
+                    np.array([start for start, end in ranges], dtype='datetime64[D]'),
+                    np.array([end for start, end in ranges], dtype='datetime64[D]'),
+                    holidays,
+                    weekdaysoff,
+                )
+                expected = [
+                    len(Networkdays(start, end, holidays, weekdaysoff).networkdays())
+                    for start, end in ranges
+                ]
+                self.assertEqual(counts.tolist(), expected)
+
+    def test_busday_count_ordinals(self):
+        starts = np.array([datetime.date(2020, 11, 1).toordinal()])
+        ends = np.array([datetime.date(2020, 11, 30).toordinal()])
+        counts = self.vectorized.busday_count(starts, ends, [datetime.date(2020, 11, 29)], {1, 2, 3, 4, 5, 6})
+        self.assertEqual(counts.tolist(), [4])
+
+    def test_busday_count_all_days_off(self):
+        counts = self.vectorized.busday_count(
+            np.array(['2020-01-01', '2020-06-01'], dtype='datetime64[D]'),
+            np.array(['2020-12-31', '2020-06-30'], dtype='datetime64[D]'),
+            weekdaysoff={1, 2, 3, 4, 5, 6, 7},
+        )
+        self.assertEqual(counts.tolist(), [0, 0])
+
+    def test_busday_offset_same_as_add_workdays(self):
+        holidays = {
+            datetime.date(2020, 12, 25),
+            datetime.date(2020, 12, 26),  # saturday
+            datetime.date(2021, 1, 1),
+        }
+        dates = [datetime.date(2020, 12, 20) + datetime.timedelta(days=d) for d in range(16)]
+        for weekdaysoff in ({6, 7}, {3}, {1, 2, 3, 4, 5, 6}, set()):
+            calendar = BusinessCalendar(holidays, weekdaysoff)
+            for days in (-30, -2, -1, 0, 1, 2, 30):
+                with self.subTest(weekdaysoff=weekdaysoff, days=days):
+                    shifted = self.vectorized.busday_offset(
+                        np.array(dates, dtype='datetime64[D]'), days, holidays, weekdaysoff
+                    )
+                    expected = [calendar.add_workdays(date, days) for date in dates]
+                    self.assertEqual(shifted.tolist(), expected)
+
+    def test_busday_offset_days_array(self):
+        shifted = self.vectorized.busday_offset(
+            np.array(['2020-12-24', '2020-12-24', 'NaT'], dtype='datetime64[D]'),
+            np.array([1, -1, 1]),
+            {datetime.date(2020, 12, 25)},
+        )
+        self.assertEqual(shifted.tolist(), [datetime.date(2020, 12, 28), datetime.date(2020, 12, 23), None])
+        with self.assertRaises(ValueError):
+            self.vectorized.busday_offset(np.array(['2020-12-24'], dtype='datetime64[D]'), 1, weekdaysoff=range(1, 8))
@@ -0,0 +1,69 @@
+import unittest
+import datetime
+
+from networkdays.networkdays import BusinessCalendar
+from networkdays.window import RollingWindow
+
+
+HOLIDAYS = {
+    datetime.date(2020, 12, 25),
+    datetime.date(2021, 1, 1),
+}
+
+
+class TestClassRollingWindow(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(HOLIDAYS)
+        self.workdays = self.calendar.workdays(datetime.date(2020, 9, 1), datetime.date(2021, 6, 30))
+
+    def expected(self, date, size, ahead):
+        if ahead:
+            return [d for d in self.workdays if d >= date][:size]
+        return [d for d in self.workdays if d <= date][-size:]
+
+    def test_window(self):
+        '''
+        December 2020
+        Mo Tu We Th Fr Sa Su
+         21 22 23 24 25 26 27
+         28 29 30 31
+        '''
+        window = RollingWindow(datetime.date(2020, 12, 27), 3, self.calendar)
+        self.assertEqual(window.workdays(), [
+            datetime.date(2020, 12, 22), datetime.date(2020, 12, 23), datetime.date(2020, 12, 24)
+        ])
+        window = RollingWindow(datetime.date(2020, 12, 25), 3, self.calendar, ahead=True)
+        self.assertEqual(window.workdays(), [
+            datetime.date(2020, 12, 28), datetime.date(2020, 12, 29), datetime.date(2020, 12, 30)
+        ])
+        self.assertEqual(window.first, datetime.date(2020, 12, 28))
+        self.assertEqual(window.last, datetime.date(2020, 12, 30))
+        self.assertEqual(len(window), 3)
+        self.assertIn(datetime.date(2020, 12, 29), window)
+        self.assertNotIn(datetime.date(2020, 12, 31), window)
+
+    def test_advance(self):
+        for ahead in (False, True):
+            for size in (1, 5, 30):
+                window = RollingWindow(datetime.date(2020, 11, 1), size, self.calendar, ahead)
+                date = datetime.date(2020, 11, 1)
+                for days in (1, 1, 1, 2, 1, 7, 1, 1, 3, 40, 1, 100, 1):
+                    window.advance(days)
+                    date += datetime.timedelta(days=days)
+                    with self.subTest(ahead=ahead, size=size, date=date):
+                        self.assertEqual(window.date, date)
+                        self.assertEqual(list(window), self.expected(date, size, ahead))
+
+    def test_move_backward(self):
+        window = RollingWindow(datetime.date(2021, 1, 15), 10, self.calendar)
+        window.move_to(datetime.date(2020, 12, 31))
+        self.assertEqual(list(window), self.expected(datetime.date(2020, 12, 31), 10, False))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            RollingWindow(datetime.date(2021, 1, 15), 0, self.calendar)
+
+
+if __name__ == '__main__':
+    unittest.main()